@@ -0,0 +1,339 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Mergeable partial aggregates for building column statistics chunk by chunk
+### DEVELOPER NOTES:
+    Each aggregate is updated with one chunk (pandas Series) at a time and
+    can be merged with another aggregate of the same type, so statistics for
+    a file can be built without ever holding the whole file in memory.
+"""
+import logging
+import os
+import math
+from collections import Counter
+
+import pandas as pd
+import numpy as np
+
+from .encoding import value_counts
+from .numeric_kernel import NumericMoments, scan_numeric
+from .sketches import QUANTILES, TDigest, distinct_counter, exact_quantiles
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def _hash_values(raw_column) -> np.ndarray:
+    """Return the 64-bit hashes of the given values"""
+    if len(raw_column) == 0:
+        return np.empty(0, dtype="uint64")
+    return pd.util.hash_pandas_object(raw_column, index=False).to_numpy()
+
+
+def count_distinct(raw_column, precision: int = None) -> tuple:
+    """
+    Number of distinct values of a column and its standard error: exact (0)
+    for no precision, otherwise estimated with a HyperLogLog sketch
+    """
+    counter = distinct_counter(precision)
+    hashes = _hash_values(raw_column)
+    counter.update(hashes)
+    # an estimate can exceed the number of values it was made from
+    estimate = min(counter.estimate(), len(hashes))
+    return estimate, estimate * counter.error
+
+
+def _histogram_median(histogram: Counter):
+    """Median of the values described by a {value: frequency} histogram"""
+    total = sum(histogram.values())
+    if total == 0:
+        return np.nan
+    lower_pos, upper_pos = (total - 1) // 2, total // 2
+    lower = upper = None
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if lower is None and seen > lower_pos:
+            lower = value
+        if seen > upper_pos:
+            upper = value
+            break
+    return (lower + upper) / 2
+
+
+def quantile_summary(values) -> dict:
+    """{summary name: value} for the QUANTILES of a sequence of values"""
+    return dict(zip(QUANTILES, values))
+
+
+def numeric_quantiles(raw_column) -> dict:
+    """Exact QUANTILES of a numeric column"""
+    values = raw_column.to_numpy(dtype="float64", na_value=np.nan)
+    return quantile_summary(exact_quantiles(values, list(QUANTILES.values())))
+
+
+def timestamp_values(raw_column) -> tuple:
+    """
+    Non-missing datetimes as float microseconds since the epoch (exact in a
+    float64 for any pandas date), with their time zone
+    """
+    values = raw_column.dropna()
+    micros = values.dt.as_unit("us").astype("int64").to_numpy(dtype="float64")
+    return micros, values.dt.tz
+
+
+def to_timestamps(quantiles: dict, tz=None) -> dict:
+    """Back from the float microseconds of timestamp_values"""
+    timestamps = {}
+    for name, value in quantiles.items():
+        timestamps[name] = pd.NaT
+        if not np.isnan(value):
+            timestamps[name] = pd.Timestamp(int(round(value)), unit="us", tz=tz)
+    return timestamps
+
+
+def temporal_quantiles(raw_column) -> dict:
+    """Exact QUANTILES of a datetime column"""
+    micros, tz = timestamp_values(raw_column)
+    levels = list(QUANTILES.values())
+    return to_timestamps(quantile_summary(exact_quantiles(micros, levels)), tz)
+
+
+def histogram_quantiles(histogram: Counter) -> dict:
+    """QUANTILES of the values described by a {value: frequency} histogram"""
+    levels = np.array(list(QUANTILES.values()))
+    total = sum(histogram.values())
+    if total == 0:
+        return quantile_summary(np.full(len(levels), np.nan))
+    values = np.array(sorted(histogram), dtype="float64")
+    # rank of the last row holding each value
+    last_ranks = np.cumsum([histogram[value] for value in sorted(histogram)]) - 1
+    positions = levels * (total - 1)
+    lower = values[np.searchsorted(last_ranks, np.floor(positions))]
+    upper = values[np.searchsorted(last_ranks, np.ceil(positions))]
+    return quantile_summary(lower + (upper - lower) * (positions % 1))
+
+
+def text_length_histogram(raw_column, counts: pd.Series = None) -> Counter:
+    """
+    Histogram of the text lengths of a column, computed on its distinct
+    values weighted by their counts. Raises AttributeError for non-text values
+    """
+    if counts is None:
+        counts = value_counts(raw_column)
+    lengths = pd.Series(counts.index, dtype=object).str.len().to_numpy()
+    weights = counts.groupby(lengths).sum()
+    return Counter({int(k): int(v) for k, v in weights.items() if v > 0})
+
+
+def row_length_histogram(raw_column) -> Counter:
+    """
+    Histogram of the text lengths of every non-missing row, without finding
+    the distinct values. Raises AttributeError for non-text values
+    """
+    lengths = raw_column.dropna().str.len().dropna().to_numpy(dtype="int64")
+    return Counter(
+        {length: int(freq) for length, freq in enumerate(np.bincount(lengths)) if freq}
+    )
+
+
+def length_histogram_stats(histogram: Counter) -> tuple:
+    """Mean, sample std and median of the lengths in a {length: frequency} histogram"""
+    n = sum(histogram.values())
+    total = sum(k * v for k, v in histogram.items())
+    total_sq = sum(k * k * v for k, v in histogram.items())
+    mean = total / n if n > 0 else np.nan
+    std = math.sqrt(max(total_sq - total * total / n, 0) / (n - 1)) if n > 1 else np.nan
+    return mean, std, _histogram_median(histogram)
+
+
+class ColumnAggregate(object):
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.missing = 0
+        self.invalid = 0
+
+    def update(self, raw_column):
+        self.count += int(raw_column.count())
+        self.missing += int(raw_column.isnull().sum())
+
+    def merge(self, other):
+        self.count += other.count
+        self.missing += other.missing
+        self.invalid += other.invalid
+        return self
+
+    def finalize(self) -> dict:
+        return {"count": self.count, "missing": self.missing}
+
+
+class NumericAggregate(ColumnAggregate):
+    def __init__(self, name):
+        ColumnAggregate.__init__(self, name)
+        self._moments = NumericMoments()
+        self._digest = TDigest()
+
+    def update(self, raw_column):
+        if not pd.api.types.is_numeric_dtype(raw_column.dtype):
+            coerced = pd.to_numeric(raw_column, errors="coerce")
+            self.invalid += int(coerced.isnull().sum() - raw_column.isnull().sum())
+            raw_column = coerced
+        # count, missing values and moments all come from one scan
+        moments = scan_numeric(raw_column)
+        self.count += moments.n
+        self.missing += moments.missing
+        self._moments.merge(moments)
+        self._digest.update(raw_column.to_numpy(dtype="float64", na_value=np.nan))
+
+    def merge(self, other):
+        ColumnAggregate.merge(self, other)
+        self._moments.merge(other._moments)
+        self._digest.merge(other._digest)
+        return self
+
+    def finalize(self) -> dict:
+        moments = self._moments
+        return {
+            **ColumnAggregate.finalize(self),
+            "min": moments.min,
+            "max": moments.max,
+            "std": moments.std,
+            "mean": moments.mean,
+            "zeros": moments.zeros,
+            "skew": moments.skew,
+            "quantiles": quantile_summary(
+                self._digest.quantiles(list(QUANTILES.values()))
+            ),
+        }
+
+
+class StringAggregate(ColumnAggregate):
+    def __init__(self, name, distinct_precision=None):
+        ColumnAggregate.__init__(self, name)
+        self.text_lengths = Counter()
+        self.text_length_valid = True
+        self._distinct = distinct_counter(distinct_precision)
+
+    def update(self, raw_column):
+        ColumnAggregate.update(self, raw_column)
+        counts = value_counts(raw_column)
+        try:
+            self.text_lengths.update(text_length_histogram(raw_column, counts))
+        except AttributeError:
+            self.text_length_valid = False
+        distinct = pd.Series(counts.index, dtype=object)
+        self._distinct.update(_hash_values(distinct))
+
+    def merge(self, other):
+        ColumnAggregate.merge(self, other)
+        self.text_lengths.update(other.text_lengths)
+        self.text_length_valid = self.text_length_valid and other.text_length_valid
+        self._distinct.merge(other._distinct)
+        return self
+
+    def finalize(self) -> dict:
+        text_length_mean = text_length_std = text_length_med = None
+        text_length_quantiles = None
+        if self.text_length_valid:
+            text_length_mean, text_length_std, text_length_med = length_histogram_stats(
+                self.text_lengths
+            )
+            text_length_quantiles = histogram_quantiles(self.text_lengths)
+        # an estimate can exceed the number of values it was made from
+        unique = min(self._distinct.estimate(), self.count)
+        return {
+            **ColumnAggregate.finalize(self),
+            "text_length_mean": text_length_mean,
+            "text_length_std": text_length_std,
+            "text_length_med": text_length_med,
+            "text_length_quantiles": text_length_quantiles,
+            "unique": unique,
+            "duplicates": max(self.count - unique, 0),
+            "unique_error": unique * self._distinct.error,
+        }
+
+
+class TemporalAggregate(ColumnAggregate):
+    def __init__(self, name, distinct_precision=None):
+        ColumnAggregate.__init__(self, name)
+        self.min = pd.NaT
+        self.max = pd.NaT
+        self.rows = 0
+        self.tz = None
+        self._distinct = distinct_counter(distinct_precision)
+        # float microseconds, see timestamp_values
+        self._digest = TDigest()
+
+    def update(self, raw_column):
+        if not pd.api.types.is_datetime64_any_dtype(raw_column.dtype):
+            coerced = pd.to_datetime(raw_column, errors="coerce")
+            self.invalid += int(coerced.isnull().sum() - raw_column.isnull().sum())
+            raw_column = coerced
+        ColumnAggregate.update(self, raw_column)
+        self.rows += len(raw_column)
+        self._combine_extremes(raw_column.min(), raw_column.max())
+        self._distinct.update(_hash_values(raw_column))
+        micros, self.tz = timestamp_values(raw_column)
+        self._digest.update(micros)
+
+    def _combine_extremes(self, col_min, col_max):
+        if pd.isnull(self.min) or (not pd.isnull(col_min) and col_min < self.min):
+            self.min = col_min
+        if pd.isnull(self.max) or (not pd.isnull(col_max) and col_max > self.max):
+            self.max = col_max
+
+    def merge(self, other):
+        ColumnAggregate.merge(self, other)
+        self.rows += other.rows
+        self._combine_extremes(other.min, other.max)
+        self._distinct.merge(other._distinct)
+        self._digest.merge(other._digest)
+        self.tz = self.tz or other.tz
+        return self
+
+    def finalize(self) -> dict:
+        distinct = min(self._distinct.estimate(), self.rows)
+        return {
+            **ColumnAggregate.finalize(self),
+            "min": self.min,
+            "max": self.max,
+            # mirrors TemporalColumn: rows minus distinct values
+            "unique": max(self.rows - distinct, 0),
+            "unique_error": distinct * self._distinct.error,
+            "quantiles": to_timestamps(
+                quantile_summary(self._digest.quantiles(list(QUANTILES.values()))),
+                self.tz,
+            ),
+        }
+
+
+class BooleanAggregate(ColumnAggregate):
+    def __init__(self, name):
+        ColumnAggregate.__init__(self, name)
+        self.value_counts = Counter()
+
+    def update(self, raw_column):
+        ColumnAggregate.update(self, raw_column)
+        self.value_counts.update(dict(raw_column.value_counts().items()))
+
+    def merge(self, other):
+        ColumnAggregate.merge(self, other)
+        self.value_counts.update(other.value_counts)
+        return self
+
+    def finalize(self) -> dict:
+        top = np.nan
+        if self.value_counts:
+            top = self.value_counts.most_common(1)[0][0]
+        return {
+            **ColumnAggregate.finalize(self),
+            "top": top,
+            "unique": len(self.value_counts),
+        }
@@ -0,0 +1,329 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Arrow-native loading and column profiling using pyarrow.compute kernels
+### DEVELOPER NOTES:
+    Data stays in a pyarrow.Table; nothing is converted to pandas until a
+    check needs the raw values of a column.
+    Nested data is flattened as json_reader does: struct fields become dotted
+    columns, and lists and maps are kept as JSON text.
+"""
+import logging
+import os
+import json
+import math
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .aggregate import quantile_summary, to_timestamps
+from .sketches import QUANTILES, exact_quantiles
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def _as_float(scalar):
+    value = scalar.as_py()
+    return np.nan if value is None else float(value)
+
+
+def _quantiles(array) -> dict:
+    """Linearly interpolated QUANTILES of a numeric array (NaN when empty)"""
+    if array.null_count == len(array):
+        return quantile_summary([np.nan] * len(QUANTILES))
+    values = pc.quantile(array, q=list(QUANTILES.values()), interpolation="linear")
+    return quantile_summary(
+        np.nan if value is None else float(value) for value in values.to_pylist()
+    )
+
+
+def _to_json_text(column) -> pa.Array:
+    values = column.to_pylist()
+    return pa.array(
+        [None if value is None else json.dumps(value, default=str) for value in values],
+        type=pa.string(),
+    )
+
+
+def flatten_table(table) -> pa.Table:
+    """
+    Flatten struct columns into dotted columns ({"user": {"id": 1}} becomes
+    "user.id") and turn list and map columns into JSON text
+    """
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    for position, field in enumerate(table.schema):
+        if pa.types.is_nested(field.type):
+            # unhashable values, which the compute kernels cannot count
+            table = table.set_column(
+                position, field.name, _to_json_text(table.column(position))
+            )
+    return table
+
+
+def _source_columns(names, columns):
+    """Top-level columns holding the requested, possibly dotted, columns"""
+    if not columns:
+        return None
+    return list(
+        dict.fromkeys(
+            column if column in names else column.split(".")[0] for column in columns
+        )
+    )
+
+
+def _select_flat(table, columns) -> pa.Table:
+    """Flatten the table, then keep the requested columns"""
+    source_columns = _source_columns(table.column_names, columns)
+    if source_columns:
+        table = table.select(source_columns)
+    table = flatten_table(table)
+    return table.select(columns) if columns else table
+
+
+def table_from_pandas(df) -> pa.Table:
+    """Convert a dataframe to a table, stringifying columns of mixed types"""
+    arrays = []
+    for col_name in df.columns:
+        try:
+            arrays.append(pa.array(df[col_name], from_pandas=True))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            values = [None if pd.isnull(v) else str(v) for v in df[col_name]]
+            arrays.append(pa.array(values, type=pa.string()))
+    table = pa.Table.from_arrays(arrays, names=[str(name) for name in df.columns])
+    return flatten_table(table)
+
+
+def _get_mapped_bytes(table, source) -> int:
+    """Number of bytes of the table's buffers that live in the memory map"""
+    source.seek(0)
+    mapped_buffer = source.read_buffer()
+    start = mapped_buffer.address
+    end = start + mapped_buffer.size
+    mapped_bytes = 0
+    for column in table.columns:
+        for chunk in column.chunks:
+            for buffer in chunk.buffers():
+                if buffer is not None and start <= buffer.address < end:
+                    mapped_bytes += buffer.size
+    return mapped_bytes
+
+
+def read_mapped_table(path, columns=None):
+    """
+    Memory-map an Arrow IPC / Feather file. Uncompressed column buffers point
+    straight into the map, so they are paged in by the OS instead of being
+    copied onto the heap. Returns the table and the bytes it maps
+    """
+    source = pa.memory_map(str(path), "r")
+    try:
+        table = pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        # feather v1 files are not in the IPC file format
+        from pyarrow import feather
+
+        table = feather.read_table(str(path), memory_map=True)
+    table = _select_flat(table, columns)
+    return table, _get_mapped_bytes(table, source)
+
+
+def read_table(path, input_format, columns=None, **load_params) -> pa.Table:
+    """
+    Read a csv, txt, json lines or parquet file with the Arrow readers.
+    Returns None for formats Arrow cannot read
+    """
+    if input_format == "parquet":
+        import pyarrow.parquet as pq
+
+        source_columns = None
+        if columns:
+            source_columns = _source_columns(pq.read_schema(str(path)).names, columns)
+        table = pq.read_table(str(path), columns=source_columns, memory_map=True)
+        # a stored pandas index is not a data column
+        table = table.drop(
+            [name for name in table.column_names if name.startswith("__index_level_")]
+        )
+        return _select_flat(table, columns)
+    elif input_format in ("csv", "txt"):
+        from pyarrow import csv
+
+        delimiter = load_params.get("sep", load_params.get("delimiter", ","))
+        if input_format == "txt" and "sep" not in load_params:
+            raise ValueError("Please provide a valid delimiter for this text file")
+        return csv.read_csv(
+            str(path),
+            parse_options=csv.ParseOptions(delimiter=delimiter),
+            # read empty fields as missing, like pandas does
+            convert_options=csv.ConvertOptions(
+                include_columns=columns, strings_can_be_null=True
+            ),
+        )
+    elif input_format == "json" and load_params.get("lines"):
+        from pyarrow import json as arrow_json
+
+        table = arrow_json.read_json(str(path))
+        return _select_flat(table, columns)
+    return None
+
+
+def append_constant_column(table, col_name, value) -> pa.Table:
+    """Add a column holding the same value in every row, e.g. a partition key"""
+    array = pa.array([value] * table.num_rows, type=pa.string())
+    return table.append_column(col_name, array)
+
+
+def concat_tables(tables) -> pa.Table:
+    """Concatenate tables, filling columns missing from some of them with nulls"""
+    try:
+        return pa.concat_tables(tables, promote_options="default")
+    except TypeError:
+        # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+
+def get_column_kind(array) -> str:
+    """Kind of column ('numeric', 'string', 'temporal', 'boolean') for an array"""
+    arrow_type = array.type
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    if pa.types.is_boolean(arrow_type):
+        return "boolean"
+    elif (
+        pa.types.is_integer(arrow_type)
+        or pa.types.is_floating(arrow_type)
+        or pa.types.is_decimal(arrow_type)
+    ):
+        return "numeric"
+    elif pa.types.is_temporal(arrow_type) and not pa.types.is_duration(arrow_type):
+        return "temporal"
+    return "string"
+
+
+def convert_dates(array):
+    """Cast a string array to timestamps if every value is an ISO-8601 date"""
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        return array
+    if array.null_count == len(array):
+        return array
+    try:
+        return pc.cast(array, pa.timestamp("ns"))
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return array
+
+
+def profile_column(array, kind) -> dict:
+    """Compute the Column statistics for an array of the given kind"""
+    if pa.types.is_dictionary(array.type):
+        array = pc.cast(array, array.type.value_type)
+    stats = {"count": pc.count(array).as_py(), "missing": array.null_count}
+    if kind == "numeric":
+        stats.update(_numeric_stats(array))
+    elif kind == "temporal":
+        stats.update(_temporal_stats(array))
+    elif kind == "boolean":
+        stats.update(_boolean_stats(array))
+    else:
+        stats.update(_string_stats(array, stats["count"]))
+    return stats
+
+
+def _numeric_stats(array) -> dict:
+    if pa.types.is_decimal(array.type):
+        array = pc.cast(array, pa.float64())
+    if pa.types.is_floating(array.type):
+        # pandas counts NaN as missing, arrow does not
+        array = pc.if_else(pc.is_nan(array), pa.scalar(None, array.type), array)
+    min_max = pc.min_max(array)
+    count = pc.count(array).as_py()
+    mean = _as_float(pc.mean(array))
+    skew = np.nan
+    if count > 2:
+        m2 = _as_float(pc.variance(array, ddof=0))
+        deltas = pc.subtract(pc.cast(array, pa.float64()), mean)
+        m3 = _as_float(pc.mean(pc.power(deltas, 3)))
+        if m2 == 0:
+            skew = 0.0
+        else:
+            skew = math.sqrt(count * (count - 1)) / (count - 2) * m3 / m2 ** 1.5
+    return {
+        "count": count,
+        "missing": array.null_count,
+        "min": min_max["min"].as_py(),
+        "max": min_max["max"].as_py(),
+        "std": _as_float(pc.stddev(array, ddof=1)),
+        "mean": mean,
+        "zeros": pc.sum(pc.equal(array, 0)).as_py() or 0,
+        "skew": skew,
+        "quantiles": _quantiles(array),
+    }
+
+
+def _string_stats(array, count) -> dict:
+    try:
+        if pa.types.is_binary(array.type) or pa.types.is_large_binary(array.type):
+            lengths = pc.binary_length(array)
+        else:
+            lengths = pc.utf8_length(array)
+        text_length_mean = _as_float(pc.mean(lengths))
+        text_length_std = _as_float(pc.stddev(lengths, ddof=1))
+        text_length_med = np.nan
+        if lengths.null_count < len(lengths):
+            text_length_med = _as_float(
+                pc.quantile(lengths, q=0.5, interpolation="midpoint")[0]
+            )
+        text_length_quantiles = _quantiles(lengths)
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+        LOGGER.error(
+            "Cannot compute text length: Column likely contains a non-string type"
+        )
+        text_length_mean = text_length_std = text_length_med = None
+        text_length_quantiles = None
+    unique = pc.count_distinct(array).as_py()
+    return {
+        "text_length_mean": text_length_mean,
+        "text_length_std": text_length_std,
+        "text_length_med": text_length_med,
+        "text_length_quantiles": text_length_quantiles,
+        "unique": unique,
+        "duplicates": count - unique,
+    }
+
+
+def _temporal_quantiles(array) -> dict:
+    """QUANTILES of a date or timestamp array, computed as for pandas columns"""
+    tz = getattr(array.type, "tz", None)
+    micros = pc.cast(array.drop_null(), pa.timestamp("us", tz), safe=False)
+    values = pc.cast(micros, pa.int64()).to_numpy().astype("float64")
+    levels = list(QUANTILES.values())
+    return to_timestamps(quantile_summary(exact_quantiles(values, levels)), tz)
+
+
+def _temporal_stats(array) -> dict:
+    min_max = pc.min_max(array)
+    col_min, col_max = min_max["min"].as_py(), min_max["max"].as_py()
+    return {
+        "min": pd.NaT if col_min is None else pd.Timestamp(col_min),
+        "max": pd.NaT if col_max is None else pd.Timestamp(col_max),
+        # mirrors TemporalColumn: rows minus distinct values
+        "unique": len(array) - pc.count_distinct(array, mode="all").as_py(),
+        "quantiles": _temporal_quantiles(array),
+    }
+
+
+def _boolean_stats(array) -> dict:
+    value_counts = pc.value_counts(array.drop_null())
+    values = value_counts.field("values").to_pylist()
+    counts = value_counts.field("counts").to_pylist()
+    top = np.nan
+    if counts:
+        top = values[counts.index(max(counts))]
+    return {"top": top, "unique": len(values)}
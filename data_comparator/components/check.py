@@ -4,111 +4,169 @@
     Module for the data type checks
 ### DEVELOPER NOTES:
 """
-import re
 import os
-import string
 import pandas as pd
 import numpy as np
-from dateutil.parser import parse
 import logging
+from functools import wraps
+
+from .dates import date_mask, guess_date_formats
+from .numeric_kernel import scan_numeric
+from .string_kernel import TextStats
+from .instrumentation import span, data_bytes
 
 logging.basicConfig(
     format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
 )
 LOGGER = logging.getLogger(__name__)
+
+# distinct values checked for dates at once, doubled for each further batch
+DATE_BATCH_SIZE = 16
+OPTIONAL_STRING_CHECKS = [
+    "white_space",
+    "capitalized",
+    "special_char",
+    "odd_text_length_diff",
+    "field_length",
+    "contains",
+]
 # =============================================================================
 # LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
 # =============================================================================
 
 
+def _traced(check):
+    """Record each run of a check as a span on the active tracer"""
+
+    @wraps(check)
+    def traced_check(column, *args, **kwargs):
+        with span(check.__name__, "check", column.name) as counters:
+            counters["rows"] = int(column.count + column.missing)
+            counters["bytes"] = data_bytes(column.data)
+            return check(column, *args, **kwargs)
+
+    return traced_check
+
+
+def _iter_text_stats(column, row_limit=None):
+    """
+    TextStats of each chunk of the column, or the profile's own when it
+    covers every row, so loaded columns are not scanned again
+    """
+    if column.text_stats is not None and not (row_limit and row_limit > 0):
+        yield column.text_stats
+        return
+    for rows in column.iter_data(row_limit):
+        yield TextStats(rows)
+
+
+def _decoded(value):
+    return value.decode() if type(value) == bytes else value
+
+
+def _last_match(stats, mask):
+    """Position of the distinct value matching 'mask' seen last, if any"""
+    matches = np.flatnonzero(mask)
+    if len(matches) == 0:
+        return None
+    return matches[np.argmax(stats.last_rows[matches])]
+
+
+def _first_non_date(stats, matches, date_formats, is_date: np.ndarray):
+    """
+    First of the distinct value positions 'matches' that is not a date, if
+    any. Dates are looked for in growing batches, since the first match
+    usually settles it; 'is_date' caches the answers (-1 when unknown)
+    """
+    start, batch_size = 0, DATE_BATCH_SIZE
+    while start < len(matches):
+        batch = matches[start : start + batch_size]
+        unknown = batch[is_date[batch] < 0]
+        if len(unknown) > 0:
+            is_date[unknown] = date_mask(stats.values.iloc[unknown], date_formats)
+        non_dates = batch[is_date[batch] == 0]
+        if len(non_dates) > 0:
+            return non_dates[0]
+        start += batch_size
+        batch_size *= 2
+    return None
+
+
+def _optional_string_masks(stats, column, validations, cases) -> dict:
+    """{check: boolean array over the distinct values} for the optional checks"""
+    masks = {}
+    for case in cases:
+        if case in ["white_space", "capitalized", "special_char"]:
+            masks[case] = stats.flags[case]
+        elif case == "odd_text_length_diff":
+            if column.text_length_mean is None:
+                # no text lengths were profiled
+                masks[case] = np.zeros(len(stats.values), dtype=bool)
+                continue
+            diff = np.abs(stats.texts.str.len() - column.text_length_mean)
+            masks[case] = (diff > 2 * column.text_length_med).to_numpy(dtype=bool)
+        elif case == "field_length":
+            lengths = stats.texts.str.len()
+            masks[case] = (lengths != validations[case]["value"]).to_numpy(dtype=bool)
+        elif case == "contains":
+            words = validations[case]["value"].split(",")
+            masks[case] = stats.texts.isin(words).to_numpy(dtype=bool)
+    return masks
+
+
+@_traced
 def check_string_column(column, validations, row_limit=None):
-    rows = column.data
-
     string_checks = {}
     for case, settings in validations.items():
         doCheck = (len(settings["fields"]) == 0) or ("name" in settings["fields"])
         if settings["enabled"] and doCheck:
             string_checks[case] = ""
 
-    spec_chars = set(string.punctuation)
-
     LOGGER.info("Performing check for string column...")
-    rows = rows if not row_limit else rows[0:row_limit]
-    for index, row_content in rows.iteritems():
-        skip = False
-        # check for missing data
-        if pd.isnull(row_content):
+    # each check is a boolean mask over the distinct values of each chunk,
+    # built from the column's TextStats, instead of a test on every row
+    for stats in _iter_text_stats(column, row_limit):
+        if len(stats.values) == 0:
             continue
-
-        # check for byte type
-        if type(row_content) == bytes:
-            # string_checks["bytes_data"] = row_content
-            row_content = row_content.decode()
-
-        # check for numeric data
-        if not re.search(r".[a-zA-Z].", str(row_content)):
-            try:
-                float(row_content)
-                string_checks["numeric_data"] = row_content
-                skip = True
-            except Exception:
-                pass
-
-        # check for time data
-        try:
-            parse(row_content)
-            # string_checks["temporal_data"] = row_content
-            skip = True
-        except Exception:
-            pass
-
-        # empty text
-        if len(row_content.replace(" ", "")) == 0:
-            string_checks["empty_text"] = index
-            skip = True
-
-        if not skip:  # optional checks below
-            # white space
-            if "white_space" in string_checks:
-                if not string_checks["white_space"]:
-                    if row_content != row_content.replace(" ", ""):
-                        string_checks["white_space"] = row_content
-
-            # all caps
-            if "capitalized" in string_checks:
-                if not string_checks["capitalized"]:
-                    if row_content == row_content.upper():
-                        string_checks["capitalized"] = row_content
-
-            # special characters
-            if "special_char" in string_checks:
-                if not string_checks["special_char"]:
-                    if any(char in spec_chars for char in row_content):
-                        string_checks["special_char"] = row_content
-
-            # suspicious difference in text length
-            if "odd_text_length_diff" in string_checks:
-                if not string_checks["odd_text_length_diff"]:
-                    diff = abs(len(row_content) - column.text_length_mean)
-                    if diff > (2 * column.text_length_med):
-                        string_checks["odd_text_length_diff"] = row_content
-
-            if "field_length" in string_checks:
-                if not string_checks["field_length"]:
-                    if len(row_content) != validations["field_length"]["value"]:
-                        string_checks["field_length"] = row_content
-
-            if "contains" in string_checks:
-                if not string_checks["contains"]:
-                    if row_content in validations["contains"]["value"].split(","):
-                        string_checks["contains"] = row_content
+        flags = stats.flags
+
+        # numeric data and empty text report the last match (later chunks
+        # hold later rows), added in the order their first match appears
+        reported_last = ["numeric_data", "empty_text"]
+        for case in sorted(reported_last, key=lambda name: flags[name].argmax()):
+            position = _last_match(stats, flags[case])
+            if position is None:
+                continue
+            elif case == "numeric_data":
+                string_checks[case] = _decoded(stats.values.iloc[position])
+            else:
+                string_checks[case] = stats.index[stats.last_rows[position]]
+
+        # optional checks report the first match that is text, and neither
+        # numeric, empty nor a date
+        pending = [
+            case
+            for case in OPTIONAL_STRING_CHECKS
+            if case in string_checks and not string_checks[case]
+        ]
+        if not pending:
+            continue
+        checked = ~(flags["numeric_data"] | flags["non_string"] | flags["empty_text"])
+        masks = _optional_string_masks(stats, column, validations, pending)
+        date_formats = guess_date_formats(stats.values)
+        is_date = np.full(len(stats.values), -1, dtype="int8")
+        for case in pending:
+            position = _first_non_date(
+                stats, np.flatnonzero(checked & masks[case]), date_formats, is_date
+            )
+            if position is not None:
+                string_checks[case] = stats.texts.iloc[position]
 
     return string_checks
 
 
+@_traced
 def check_numeric_column(column, validations):
-    df = column.data.to_frame()
-
     LOGGER.info("Performing check for numeric column...")
     numeric_checks = {}
     for case, settings in validations.items():
@@ -116,16 +174,30 @@ def check_numeric_column(column, validations):
         if settings["enabled"] and doCheck:
             numeric_checks[case] = ""
 
-    col_skew = column.data.skew()
+    # the skew comes from the profile's moments, for loaded and streamed columns
+    col_skew = column.skew
     if "susp_skewness" in numeric_checks:
-        if (col_skew < -1) | (col_skew > 1):
+        if pd.notna(col_skew) and ((col_skew < -1) | (col_skew > 1)):
             numeric_checks["susp_skewness"] = str(col_skew)
 
+    # the outlier and threshold checks share one scan of the data
+    bounds = {}
     if "pot_outliers" in numeric_checks:
-        col_zscore = (column.data - column.data.mean()) / column.data.std(ddof=0)
-        num_pot_outliers = len(np.where(np.abs(col_zscore) > 3)[0])
-        if num_pot_outliers > 0:
-            numeric_checks["pot_outliers"] = str(num_pot_outliers)
+        # |z-score| > 3
+        spread = 3 * _population_std(column)
+        bounds["pot_outliers"] = (column.mean - spread, column.mean + spread)
+    if "value_threshold_upper" in numeric_checks:
+        threshold = float(validations["value_threshold_upper"]["value"])
+        bounds["value_threshold_upper"] = (None, threshold)
+    if "value_threshold_lower" in numeric_checks:
+        threshold = float(validations["value_threshold_lower"]["value"])
+        bounds["value_threshold_lower"] = (threshold, None)
+    outside, first_values = _scan_bounds(column, bounds)
+
+    if "pot_outliers" in numeric_checks:
+        # missing values of nullable columns are not counted
+        if outside["pot_outliers"] > 0:
+            numeric_checks["pot_outliers"] = str(outside["pot_outliers"])
 
     if "susp_zero_count" in numeric_checks:
         zero_perc = column.zeros / column.count
@@ -133,24 +205,12 @@ def check_numeric_column(column, validations):
             numeric_checks["susp_zero_count"] = str(zero_perc)
 
     if "value_threshold_upper" in numeric_checks:
-        value = None
-        try:
-            value = df[
-                df[column.name] > float(validations["value_threshold_upper"]["value"])
-            ].iloc[0][0]
-        except IndexError:
-            pass  # add logger
+        value = first_values["value_threshold_upper"]
         if value:
             numeric_checks["value_threshold_upper"] = str(value)
 
     if "value_threshold_lower" in numeric_checks:
-        value = None
-        try:
-            value = df[
-                df[column.name] < float(validations["value_threshold_lower"]["value"])
-            ].iloc[0][0]
-        except IndexError:
-            pass  # add logger
+        value = first_values["value_threshold_lower"]
         if value:
             numeric_checks["value_threshold_upper"] = str(value)
 
@@ -160,6 +220,31 @@ def check_numeric_column(column, validations):
     return numeric_checks
 
 
+def _population_std(column):
+    if column.count < 1:
+        return np.nan
+    return column.std * np.sqrt((column.count - 1) / column.count)
+
+
+def _scan_bounds(column, bounds: dict) -> tuple:
+    """
+    Number of values outside each of the (lower, upper) bounds, and the
+    first of them, from one scan of the column (chunk by chunk if streamed)
+    """
+    outside = {name: 0 for name in bounds}
+    first_values = {name: None for name in bounds}
+    if not bounds:
+        return outside, first_values
+    for rows in column.iter_data():
+        moments = scan_numeric(rows, bounds)
+        for name, position in moments.first_outside.items():
+            outside[name] += moments.outside[name]
+            if first_values[name] is None and position is not None:
+                first_values[name] = rows.iloc[position]
+    return outside, first_values
+
+
+@_traced
 def check_temporal_column(column, validations):
 
     LOGGER.info("Performing check for temporal (time, datatime, etc.) column...")
@@ -171,7 +256,10 @@ def check_temporal_column(column, validations):
 
     # check for empty fields
     if "empty_date" in temporal_checks:
-        temporal_checks["empty_date"] = column.data.empty
+        if column.data is not None:
+            temporal_checks["empty_date"] = column.data.empty
+        else:
+            temporal_checks["empty_date"] = (column.count + column.missing) == 0
 
     time_delta = column.max - column.min
 
@@ -188,6 +276,7 @@ def check_temporal_column(column, validations):
     return temporal_checks
 
 
+@_traced
 def check_boolean_column(column, validations):
     LOGGER.info("Performing check for boolean column {}...".format(column.name))
     boolean_checks = {}
@@ -0,0 +1,96 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Smallest safe numeric dtypes for loaded data (compact load mode)
+### DEVELOPER NOTES:
+    Integers are downcast to the narrowest signed type holding their range.
+    Float columns whose values are all whole numbers but have missing values
+    (integer columns read with NaN) become nullable integers; other floats
+    become float32 when every value round-trips exactly. Booleans are kept.
+"""
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+INT_DTYPES = ["int8", "int16", "int32", "int64"]
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def smallest_int_dtype(lower, upper, nullable=False):
+    """Narrowest (nullable) signed integer dtype holding [lower, upper], or None"""
+    for dtype in INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lower and upper <= info.max:
+            return dtype.capitalize() if nullable else dtype
+    return None
+
+
+def _compact_floats(raw_column):
+    floats = raw_column.to_numpy(dtype="float64", na_value=np.nan)
+    present = floats[~np.isnan(floats)]
+    if len(present) < len(floats) and len(present) > 0:
+        if np.isfinite(present).all() and (np.mod(present, 1) == 0).all():
+            # an integer column that was read as float because of missing values
+            dtype = smallest_int_dtype(present.min(), present.max(), nullable=True)
+            if dtype is not None:
+                return raw_column.astype(dtype)
+    singles = floats.astype("float32")
+    if np.array_equal(singles.astype("float64"), floats, equal_nan=True):
+        return pd.Series(singles, index=raw_column.index, name=raw_column.name)
+    if raw_column.dtype != "float64":
+        # nullable floats that cannot be narrowed go back to numpy floats
+        return pd.Series(floats, index=raw_column.index, name=raw_column.name)
+    return raw_column
+
+
+def compact_column(raw_column) -> pd.Series:
+    """The column in its smallest safe numeric dtype (non-numeric columns as is)"""
+    dtype = raw_column.dtype
+    if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+        return raw_column
+    if pd.api.types.is_float_dtype(dtype):
+        return _compact_floats(raw_column)
+    if not pd.api.types.is_integer_dtype(dtype) or raw_column.count() == 0:
+        return raw_column
+    nullable = isinstance(dtype, pd.api.extensions.ExtensionDtype)
+    target = smallest_int_dtype(raw_column.min(), raw_column.max(), nullable)
+    if target is None or target == str(dtype):
+        return raw_column
+    return raw_column.astype(target)
+
+
+def compact_frame(df, original_dtypes: dict = None) -> pd.DataFrame:
+    """
+    Downcast the numeric columns of a dataframe. The dtype each column had
+    before it was first compacted is recorded in 'original_dtypes'
+    """
+    for col_name in df.columns:
+        raw_column = df[col_name]
+        compacted = compact_column(raw_column)
+        if compacted is raw_column:
+            continue
+        if original_dtypes is not None:
+            original_dtypes.setdefault(col_name, str(raw_column.dtype))
+        df[col_name] = compacted
+    return df
+
+
+def uncompacted_bytes(df, original_dtypes: dict) -> int:
+    """Bytes a compacted dataframe would take in the dtypes it was read with"""
+    total = int(df.memory_usage(deep=True).sum())
+    for col_name, dtype in original_dtypes.items():
+        if col_name not in df.columns or str(df[col_name].dtype) == dtype:
+            continue
+        total -= int(df[col_name].memory_usage(deep=True, index=False))
+        total += len(df.index) * pd.api.types.pandas_dtype(dtype).itemsize
+    return total
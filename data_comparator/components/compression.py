@@ -0,0 +1,130 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Transparent reading of compressed sources (data.csv.gz, events.json.zst,
+    extract.txt.bz2, ...), decompressed on the fly
+### DEVELOPER NOTES:
+    Compressed files are handed to the readers as decompressing streams, so
+    nothing is ever written to a temporary file. gzip, bz2, zstd and lz4 are
+    decoded by Arrow's codecs, xz and zip by the standard library. Only
+    row-oriented formats that are read front to back can be compressed.
+"""
+import logging
+import os
+import io
+import lzma
+import struct
+import zipfile
+from pathlib import Path
+
+import pyarrow as pa
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+# file suffix: codec
+COMPRESSIONS = {
+    "gz": "gzip",
+    "bz2": "bz2",
+    "zst": "zstd",
+    "lz4": "lz4",
+    "xz": "xz",
+    "zip": "zip",
+}
+# codecs Arrow's csv and json readers detect from the file name themselves
+ARROW_COMPRESSIONS = ["gzip", "bz2", "zstd", "lz4"]
+STREAMABLE_FORMATS = ["csv", "txt", "json", "jsonl", "ndjson", "sas7bdat"]
+# decompressed bytes sampled to estimate the size of a whole file
+SIZE_SAMPLE_BYTES = 4 * 1024 * 1024
+READ_BLOCK_BYTES = 256 * 1024
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def get_compression(path):
+    """Codec of a compressed file, from its suffix, or None"""
+    if not isinstance(path, (str, Path)):
+        return None
+    return COMPRESSIONS.get(Path(path).suffix.replace(".", "").lower())
+
+
+def data_suffix(path) -> str:
+    """Suffix of the data format, ignoring a compression suffix ('csv' for a.csv.gz)"""
+    path = Path(path)
+    if get_compression(path) is None:
+        return path.suffix.replace(".", "")
+    data_format = Path(path.stem).suffix.replace(".", "")
+    if data_format and data_format not in STREAMABLE_FORMATS:
+        raise ValueError(
+            "Compressed {} files are not supported, only {}".format(
+                data_format, ", ".join(STREAMABLE_FORMATS)
+            )
+        )
+    return data_format
+
+
+def _decompress(source, compression):
+    """Decompressing binary stream over an open (compressed) file object"""
+    if compression == "xz":
+        return lzma.LZMAFile(source)
+    return pa.CompressedInputStream(pa.PythonFile(source, mode="r"), compression)
+
+
+def open_stream(path):
+    """Binary file object yielding the decompressed content of a file"""
+    compression = get_compression(path)
+    if compression is None:
+        return open(str(path), "rb")
+    elif compression == "zip":
+        archive = zipfile.ZipFile(str(path))
+        members = [info for info in archive.infolist() if not info.is_dir()]
+        if len(members) != 1:
+            raise ValueError("{} must hold exactly one file".format(path))
+        return archive.open(members[0])
+    elif compression == "xz":
+        return lzma.open(str(path), "rb")
+    return pa.CompressedInputStream(pa.OSFile(str(path)), compression)
+
+
+def open_text(path, encoding=None):
+    """Text file object over the decompressed content of a file"""
+    if get_compression(path) is None:
+        return open(str(path), "r", encoding=encoding or "utf-8")
+    return io.TextIOWrapper(open_stream(path), encoding=encoding or "utf-8")
+
+
+def estimate_size(path) -> int:
+    """
+    Uncompressed size of a file. Read from the archive where it is recorded
+    (zip, gzip under 4 GB), otherwise extrapolated from the compression ratio
+    of the first few MB
+    """
+    size = os.path.getsize(str(path))
+    compression = get_compression(path)
+    if compression is None or size == 0:
+        return size
+    if compression == "zip":
+        with zipfile.ZipFile(str(path)) as archive:
+            return sum(info.file_size for info in archive.infolist())
+    if compression == "gzip":
+        with open(str(path), "rb") as raw:
+            raw.seek(-4, os.SEEK_END)
+            # ISIZE trailer: the uncompressed size modulo 2**32
+            recorded = struct.unpack("<I", raw.read(4))[0]
+        if recorded >= size:
+            return recorded
+    with open(str(path), "rb") as raw:
+        stream = _decompress(raw, compression)
+        decompressed = 0
+        while decompressed < SIZE_SAMPLE_BYTES:
+            block = stream.read(READ_BLOCK_BYTES)
+            if not block:
+                # the whole file fit in the sample
+                return decompressed
+            decompressed += len(block)
+        consumed = max(raw.tell(), 1)
+    return int(size * decompressed / consumed)
@@ -5,15 +5,47 @@
 ### DEVELOPER NOTES:
 """
 import logging
-import os
 import sys
 from datetime import datetime
 from pathlib import Path
 import re
+import copy
 import json
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import pandas as pd
 
+from .aggregate import (
+    NumericAggregate,
+    StringAggregate,
+    TemporalAggregate,
+    BooleanAggregate,
+    count_distinct,
+    histogram_quantiles,
+    length_histogram_stats,
+    numeric_quantiles,
+    row_length_histogram,
+    temporal_quantiles,
+)
+from . import arrow_engine
+from . import spark_engine
+from . import sas_reader
+from . import json_reader
+from . import compression
+from .partition import discover_files, infer_format
+from .sampling import Sampler
+from .encoding import encode_strings
+from .compact import compact_frame, uncompacted_bytes
+from .instrumentation import Tracer, activate, data_bytes
+from .sketches import DEFAULT_PRECISION, QUANTILES
+from .numeric_kernel import scan_numeric
+from .string_kernel import TextStats
+from .dates import infer_date_format, is_text_column, to_dates
+from .profile_cache import get_profile_cache
+from .transcode_cache import TRANSCODE_FORMATS, get_transcode_cache
+from .parallel import shared_frame, read_shared_column, map_columns
 from .check import (
     check_string_column,
     check_numeric_column,
@@ -29,9 +61,17 @@ ACCEPTED_INPUT_FORMATS = [
     "pandas",
     "json",
     "txt",
+    "arrow",
+    "feather",
 ]
+# formats loaded zero-copy from a memory map
+MAPPED_FORMATS = ["arrow", "feather"]
 COMP_DIR = Path(__file__).parent
 VALID_FILE = str(COMP_DIR / "validations_config.json")
+ENGINES = ["pandas", "arrow", "spark"]
+MAX_FILE_SIZE = 800000000
+MAX_CHUNKSIZE = 200000000
+DEFAULT_CHUNKSIZE = 100000
 
 logging.basicConfig(
     stream=sys.stdout, format="%(asctime)s - %(message)s", level=logging.DEBUG
@@ -43,30 +83,346 @@ LOGGER = logging.getLogger(__name__)
 # =============================================================================
 
 
+def _get_path_format(path) -> str:
+    suffix = compression.data_suffix(path)
+    if suffix not in ACCEPTED_INPUT_FORMATS and Path(path).is_dir():
+        # (partitioned) dataset directory, use the format of its files
+        suffix = infer_format(path)
+    if suffix in json_reader.JSON_LINES_FORMATS:
+        suffix = "json"
+    if suffix not in ACCEPTED_INPUT_FORMATS:
+        raise ValueError("File type not supported")
+    return suffix
+
+
+def get_source_columns(data_src: object, **load_params) -> list:
+    """
+    Read only the column names of a data source, without loading its data.
+    Returns None when the names cannot be read cheaply
+    """
+    if "DataFrame" in str(data_src.__class__):
+        return list(data_src.columns)
+    try:
+        path = Path(data_src)
+        input_format = _get_path_format(path)
+        if path.is_dir():
+            files = discover_files(path)
+            if not files:
+                return None
+            file_path, partition = files[0]
+            file_cols = get_source_columns(file_path, **load_params)
+            return None if file_cols is None else file_cols + list(partition)
+        elif input_format == "parquet":
+            import pyarrow.parquet as pq
+
+            schema = pq.read_schema(str(path))
+            return [
+                name for name in schema.names if not name.startswith("__index_level_")
+            ]
+        elif input_format in ("csv", "txt"):
+            params = {
+                key: value
+                for key, value in load_params.items()
+                if key in ("sep", "delimiter", "header", "names", "encoding")
+            }
+            with compression.open_stream(path) as source:
+                return list(pd.read_csv(source, nrows=0, **params).columns)
+        elif input_format == "json" and json_reader.is_json_lines(path):
+            return json_reader.infer_schema(path, load_params.get("encoding"))
+        elif input_format == "sas7bdat":
+            with compression.open_stream(path) as source:
+                with pd.read_sas(source, format="sas7bdat", iterator=True) as reader:
+                    return list(reader.column_names)
+        elif input_format in MAPPED_FORMATS:
+            table, _ = arrow_engine.read_mapped_table(path)
+            return table.column_names
+    except (TypeError, ValueError, OSError, AttributeError) as e:
+        LOGGER.debug("Could not read column names: {}".format(e))
+    return None
+
+
+def _column_options(col_type, distinct_precision) -> dict:
+    """Keyword arguments for building a column (or aggregate) of the given type"""
+    if distinct_precision is None or col_type not in DISTINCT_COUNTED_TYPES:
+        return {}
+    return {"distinct_precision": distinct_precision}
+
+
+def _profile_shared_column(col_name, path, ds_name, distinct_precision=None):
+    """Profile one column of a shared Arrow file in a worker process"""
+    raw_column = Dataset.convert_dates(read_shared_column(path, col_name))
+    col_type = Dataset._get_column_type(raw_column)
+    col = col_type(raw_column, ds_name, **_column_options(col_type, distinct_precision))
+    # only the statistics are sent back to the parent process
+    col.data = None
+    if isinstance(col, StringColumn):
+        col.text_stats = None
+    return col
+
+
+def _check_shared_column(col_name, path, ds_name):
+    """Perform the checks for one column of a shared Arrow file in a worker process"""
+    raw_column = Dataset.convert_dates(read_shared_column(path, col_name))
+    col = Dataset._get_column_type(raw_column)(raw_column, ds_name)
+    return col.perform_check()
+
+
+class ColumnRegistry(MutableMapping):
+    """
+    Mapping of column names to Column objects. Columns are registered with a
+    builder and only profiled the first time they are accessed
+    """
+
+    def __init__(self):
+        self._columns = {}
+        self._builders = {}
+        self._type_hints = {}
+        # called with no arguments after a registered column is built
+        self.on_build = None
+
+    def register(self, col_name, builder, col_type=None):
+        """Register a column to be built on first access"""
+        self._columns[col_name] = None
+        self._builders[col_name] = builder
+        self._type_hints[col_name] = col_type
+
+    def __getitem__(self, col_name):
+        col = self._columns[col_name]
+        if col is None:
+            col = self._builders.pop(col_name)()
+            self._columns[col_name] = col
+            self._type_hints.pop(col_name, None)
+            if self.on_build is not None:
+                self.on_build()
+        return col
+
+    def __setitem__(self, col_name, col):
+        self._builders.pop(col_name, None)
+        self._type_hints.pop(col_name, None)
+        self._columns[col_name] = col
+
+    def __delitem__(self, col_name):
+        self._builders.pop(col_name, None)
+        self._type_hints.pop(col_name, None)
+        del self._columns[col_name]
+
+    def __contains__(self, col_name):
+        return col_name in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __repr__(self):
+        return repr(
+            {
+                col_name: col if col is not None else "<not profiled>"
+                for col_name, col in self._columns.items()
+            }
+        )
+
+    def is_profiled(self, col_name) -> bool:
+        return self._columns[col_name] is not None
+
+    def get_type(self, col_name, profile=True):
+        """
+        Column class for the given name, profiling it only if unavoidable.
+        Returns None for unresolved columns when profile is False
+        """
+        col_type = self._type_hints.get(col_name)
+        if col_type is None and (profile or self.is_profiled(col_name)):
+            col = self[col_name]
+            col_type = (
+                col.column_type if isinstance(col, ColumnSummary) else col.__class__
+            )
+        return col_type
+
+
 class Dataset(object):
-    def __init__(self, data_src: object, name: str, **load_params):
+    def __init__(
+        self,
+        data_src: object,
+        name: str,
+        streaming: bool = False,
+        columns: list = None,
+        workers: int = None,
+        engine: str = None,
+        partition_filters=None,
+        read_threads: int = None,
+        sample=None,
+        cache=None,
+        transcode=None,
+        encode_strings: bool = True,
+        compact: bool = False,
+        retain_data: bool = True,
+        approx_distinct=False,
+        **load_params
+    ):
+        if engine is not None and engine not in ENGINES:
+            raise ValueError("Engine {} not supported".format(engine))
         self.path = None
         self.input_format = ""
         self.size = ""
-        self.columns = {}
+        self.columns = ColumnRegistry()
         self.dataframe = None
+        # the arrow engine keeps the data as a pyarrow.Table instead
+        self.engine = engine if engine else "pandas"
+        self.table = None
+        # the spark engine leaves the data in spark and only collects summaries
+        self.spark_df = None
+        # date format of each string column, None if it is not a date column
+        self.date_formats = {}
+        # bytes of the loaded data memory-mapped from disk rather than copied
+        self.mapped_bytes = 0
         self.name = name
         self.load_time = 0.0
-        try:
-            # probably a path string
+        # per-phase and per-column timings, rows, bytes and peak memory
+        self.tracer = Tracer()
+        # number of worker processes for column profiling and checks
+        self.workers = workers
+        # rows are sampled chunk by chunk as the source is read
+        self.sampler = Sampler.from_option(sample) if sample is not None else None
+        # a chunksize (or iterator) load param implies a streamed load
+        self.streaming = (streaming or ("chunksize" in load_params)) and (
+            self.sampler is None
+        )
+        self.chunksize = load_params.pop("chunksize", DEFAULT_CHUNKSIZE)
+        load_params.pop("iterator", None)
+        self.load_params = load_params
+        # columns to read, pushed down to the reader where it supports it
+        self.selected_columns = list(columns) if columns else None
+        # (file path, partition) pairs of a dataset directory, read concurrently
+        self.partition_files = []
+        self.partition_filters = partition_filters
+        self.read_threads = read_threads
+        # on-disk profile cache, skipping the read for unchanged sources
+        self.cache = get_profile_cache(cache)
+        self.cache_key = None
+        self.from_cache = False
+        self._cached_checks = {}
+        # columnar copy of a slow-to-parse source, read in its place
+        self.transcoder = get_transcode_cache(transcode)
+        self.transcoded_path = None
+        # string columns read from a path are stored as categoricals/arrow strings
+        self.encode_strings = encode_strings
+        # numeric columns are downcast as the file is read, chunk by chunk
+        self.compact = compact
+        # dtype each compacted column was read with
+        self.compact_dtypes = {}
+        # False to keep only the column summaries and checks once profiled
+        self.retain_data = retain_data
+        # HyperLogLog precision of the string/date distinct counts, None for exact
+        self.distinct_precision = None
+        if approx_distinct:
+            self.distinct_precision = (
+                DEFAULT_PRECISION if approx_distinct is True else int(approx_distinct)
+            )
+        if isinstance(data_src, (str, Path)):
             self.path = Path(data_src)
             self.input_format = self._get_input_format()
+            if self.engine == "spark":
+                raise ValueError("The spark engine requires a pyspark dataframe")
+            if self.input_format == "json" and json_reader.is_json_lines(self.path):
+                load_params.setdefault("lines", True)
+            if self.path.is_dir():
+                self.partition_files = discover_files(self.path, partition_filters)
+                if not self.partition_files:
+                    raise ValueError("No data files found in {}".format(self.path))
+            if engine is None and self.input_format in MAPPED_FORMATS:
+                # keep memory-mapped data in arrow so it is never copied
+                self.engine = "arrow"
+            if self.cache is not None:
+                self.cache_key = self.cache.make_key(
+                    self._get_source_files(),
+                    {
+                        "format": self.input_format,
+                        "engine": self.engine,
+                        "streaming": self.streaming,
+                        "columns": self.selected_columns,
+                        "partition_filters": partition_filters,
+                        "sample": sample,
+                        "compact": compact,
+                        "distinct_precision": self.distinct_precision,
+                        "load_params": load_params,
+                    },
+                    VALID_FILE,
+                )
+                entry = self.cache.get(self.cache_key)
+                if entry is not None:
+                    self._restore_profile(entry)
+                    self._finish_load()
+                    return
             self.size = self._get_data_size(data_src, **load_params)
-            self.dataframe = self._load_data_frompath(**load_params)
-        except TypeError:
-            # probably an dataframe object
+            if self.transcoder is not None:
+                self.transcoded_path = self._get_transcoded_copy(**load_params)
+            if self.sampler is not None:
+                self.dataframe = self._encode_string_columns(
+                    self._sample_frompath(columns=self.selected_columns, **load_params)
+                )
+                if self.compact:
+                    self.dataframe = compact_frame(self.dataframe, self.compact_dtypes)
+                if self.engine == "arrow":
+                    self.table = arrow_engine.table_from_pandas(self.dataframe)
+                    self.dataframe = None
+            elif self.streaming:
+                self._stream_columns(columns=self.selected_columns, **load_params)
+            elif self.engine == "arrow":
+                self.table = self._load_table_frompath(
+                    columns=self.selected_columns, **load_params
+                )
+            else:
+                self.dataframe = self._encode_string_columns(
+                    self._load_data_frompath(
+                        columns=self.selected_columns, **load_params
+                    )
+                )
+        else:
+            # a pandas or pyspark dataframe
+            self.streaming = False
             self.input_format = str(data_src.__class__)
-            if "DataFrame" in self.input_format:
-                self.dataframe = self._load_data_fromdf(data_src)
+            if "pyspark" in self.input_format and engine in (None, "spark"):
+                # profile inside spark instead of collecting to the driver
+                self.engine = "spark"
+                self.spark_df = self._load_spark_df(
+                    data_src, columns=self.selected_columns
+                )
+            elif "DataFrame" in self.input_format:
+                self.dataframe = self._load_data_fromdf(
+                    data_src, columns=self.selected_columns
+                )
+                if self.sampler is not None:
+                    self.dataframe = self.sampler.sample_frame(
+                        self.dataframe, self.chunksize
+                    )
                 # count object types in size
                 self.size = self.dataframe.memory_usage(deep=True).sum()
+                if self.engine == "arrow":
+                    self.table = arrow_engine.table_from_pandas(self.dataframe)
+                    self.dataframe = None
+            else:
+                raise TypeError(
+                    "Data source type {} not supported".format(self.input_format)
+                )
+
+        self._finish_load()
 
-        self._prepare_columns()
+    def _finish_load(self):
+        """Steps after the data (or its cached profile) is loaded"""
+        if not self.from_cache:
+            if not self.streaming and self.spark_df is None:
+                self._prepare_columns()
+            if self.cache_key is not None:
+                if self.sampler is not None:
+                    # a sample cannot be drawn again for the columns left out
+                    self.profile_columns()
+                self._store_profile()
+        if self.cache_key is not None:
+            # columns profiled later are added to the cached profile
+            self.columns.on_build = self._store_profile
+        if not self.retain_data:
+            self._release_data()
 
     def __getitem__(self, item):
         try:
@@ -95,11 +451,128 @@ class Dataset(object):
     def from_yaml(cls, constructor, node):
         return cls(*node.value.split("-"))
 
+    def _get_source_files(self) -> list:
+        if self.partition_files:
+            return [file_path for file_path, _ in self.partition_files]
+        return [self.path]
+
+    def _restore_profile(self, entry: dict):
+        LOGGER.debug("\nLoading profile of {} from cache...".format(self.path))
+        self.from_cache = True
+        self.streaming = False
+        self.size = entry["size"]
+        self.load_time = entry["load_time"]
+        if self.sampler is not None:
+            self.sampler.population_rows = entry["population_rows"]
+        self._cached_checks = entry["checks"]
+        for col_name in entry["column_names"]:
+            col = entry["columns"].get(col_name)
+            if col is None:
+                # not profiled when the entry was written
+                self.columns.register(
+                    col_name, partial(self._profile_uncached_column, col_name)
+                )
+                continue
+            col.ds_name = self.name
+            # checks that were not cached re-read the column from the source
+            col._source = partial(self._iter_column_chunks, col_name)
+            self.columns[col_name] = col
+
+    def _profile_uncached_column(self, col_name):
+        """
+        Profile a column missing from the cached profile. The first such column
+        reads every missing column from the source
+        """
+        if self.dataframe is None and self.table is None:
+            LOGGER.debug("\nLoading the uncached columns of {}...".format(self.path))
+            missing = [
+                raw_col_name
+                for raw_col_name in self.columns
+                if not self.columns.is_profiled(raw_col_name)
+            ]
+            # keep the load time of the cached profile
+            load_time = self.load_time
+            if self.transcoder is not None:
+                self.transcoded_path = self._get_transcoded_copy(**self.load_params)
+            if self.engine == "arrow":
+                self.table = self._load_table_frompath(
+                    columns=missing, **self.load_params
+                )
+            else:
+                self.dataframe = self._encode_string_columns(
+                    self._load_data_frompath(columns=missing, **self.load_params)
+                )
+            self.load_time = load_time
+        if self.table is not None:
+            return self._profile_arrow_column(col_name)
+        return self._profile_column(col_name)
+
+    def _store_profile(self):
+        """
+        Write the statistics of the columns profiled so far and the check
+        results to the profile cache. Columns left out are profiled from the
+        source when a load from the cache first accesses them
+        """
+        columns = {}
+        for col_name in self.columns:
+            if not self.columns.is_profiled(col_name):
+                continue
+            col = copy.copy(self.columns[col_name])
+            col.data = None
+            col._source = None
+            if isinstance(col, StringColumn):
+                col.text_stats = None
+            columns[col_name] = col
+        entry = {
+            "column_names": list(self.columns),
+            "columns": columns,
+            "checks": self._cached_checks,
+            "size": self.size,
+            "load_time": self.load_time,
+            "population_rows": self.sampler.population_rows if self.sampler else None,
+        }
+        self.cache.put(self.cache_key, entry, source=self.path.resolve())
+
+    @property
+    def read_format(self) -> str:
+        """Format the data is read in: arrow when reading a transcoded copy"""
+        return "arrow" if self.transcoded_path is not None else self.input_format
+
+    @property
+    def read_path(self):
+        if self.transcoded_path is not None and not self.transcoded_path.exists():
+            # evicted from the transcode cache since the load; read the source
+            LOGGER.debug(
+                "Transcoded copy of {} is gone, reading the source".format(self.path)
+            )
+            self.transcoded_path = None
+        return self.transcoded_path if self.transcoded_path is not None else self.path
+
+    def _get_transcoded_copy(self, **load_params):
+        """
+        Path of the columnar copy of the source, written on the first load.
+        None if the source is not transcoded
+        """
+        if self.input_format not in TRANSCODE_FORMATS or self.partition_files:
+            return None
+        if compression.estimate_size(self.path) > MAX_FILE_SIZE:
+            LOGGER.debug("{} is too large to transcode".format(self.path))
+            return None
+        key = self.transcoder.make_key(
+            [self.path], {"format": self.input_format, "load_params": load_params}
+        )
+        transcoded_path = self.transcoder.get(key)
+        if transcoded_path is None:
+            LOGGER.debug("\nTranscoding {} to arrow...".format(self.path))
+            # every column is kept so the copy serves any projection
+            table = arrow_engine.table_from_pandas(
+                self._read_file(self.path, **load_params)
+            )
+            transcoded_path = self.transcoder.put(key, table, source=self.path)
+        return transcoded_path
+
     def _get_input_format(self) -> str:
-        suffix = self.path.suffix.replace(".", "")
-        if suffix not in ACCEPTED_INPUT_FORMATS:
-            raise ValueError("File type not supported")
-        return suffix
+        return _get_path_format(self.path)
 
     def _format_size(self, size):
         "Return the given bytes as a human friendly KB, MB, GB, or TB string"
@@ -124,98 +597,698 @@ class Dataset(object):
 
     def _get_data_size(self, data_src: object, **load_params) -> int:
         size = 0
-        if self.path.is_dir():
-            for file in os.listdir(data_src):
-                abs_path = os.path.join(data_src, file)
-                size += os.path.getsize(abs_path)
+        if self.partition_files:
+            # only the partitions left after pruning are read
+            for file_path, partition in self.partition_files:
+                size += compression.estimate_size(file_path)
         else:
-            size = os.path.getsize(data_src)
+            # compressed files are checked on their (estimated) uncompressed size
+            size = compression.estimate_size(data_src)
         if size < 1:
             raise ValueError("File size of {} is too small".format(size))
-        if size > 800000000 and "chunksize" in list(load_params.keys()):
-            chunksize = load_params["chunksize"]
-            if chunksize > 200000000:
-                raise ValueError("chunksize {} is too large".format(chunksize))
-        elif size > 800000000:
-            raise ValueError("File size of {} is too large".format(size))
+        if self.streaming or self.sampler is not None:
+            # read chunk by chunk, only a chunk (or the sample) is held
+            if self.chunksize > MAX_CHUNKSIZE:
+                raise ValueError("chunksize {} is too large".format(self.chunksize))
+        elif size > MAX_FILE_SIZE and not self._keeps_mapped_table():
+            raise ValueError(
+                "File size of {} is too large; load it with streaming=True".format(size)
+            )
 
         formatted_size = self._format_size(size)
         return formatted_size
 
-    def _load_data_frompath(self, **load_params) -> pd.DataFrame:
-        LOGGER.debug("\nLoading raw data into dataset object...")
-        data = None
-        start_time = datetime.now()
-        if self.input_format == "sas7bdat":
-            data = pd.read_sas(str(self.path), **load_params)
-        elif self.input_format == "csv":
-            data = pd.read_csv(str(self.path), **load_params)
-        elif self.input_format == "txt":
+    def _keeps_mapped_table(self) -> bool:
+        """
+        True when the data stays a memory-mapped arrow table, paged in by the
+        OS rather than loaded; the pandas engine copies it onto the heap
+        """
+        return self.engine == "arrow" and self.read_format in MAPPED_FORMATS
+
+    def _push_down_columns(self, columns, load_params):
+        """
+        Translate a column selection into the reader's own projection parameter.
+        Returns the reader parameters and the columns still to select after reading
+        """
+        if not columns:
+            return load_params, None
+        if self.read_format in ("csv", "txt"):
+            return {**load_params, "usecols": columns}, None
+        elif self.read_format == "parquet" or self.read_format in MAPPED_FORMATS:
+            return {**load_params, "columns": columns}, None
+        # the sas and json readers cannot project columns
+        return load_params, columns
+
+    def _split_partition_columns(self, columns, partition):
+        """Split a column selection into file columns and partition keys"""
+        if not columns:
+            return None, list(partition)
+        file_columns = [col for col in columns if col not in partition]
+        return file_columns, [col for col in columns if col in partition]
+
+    def _map_partitions(self, func, files):
+        """Run func(file path, partition) for each file on a pool of threads"""
+        with ThreadPoolExecutor(max_workers=self.read_threads) as executor:
+            return list(executor.map(lambda file: func(*file), files))
+
+    def _read_file(self, path, columns=None, **load_params) -> pd.DataFrame:
+        if compression.get_compression(path) is not None:
+            # decompressed on the fly, never to a temporary file
+            with compression.open_stream(path) as source:
+                return self._read_file(source, columns, **load_params)
+        if isinstance(path, Path):
+            path = str(path)
+        load_params, columns = self._push_down_columns(columns, load_params)
+        if self.read_format == "sas7bdat":
+            # read in chunks so only the selected columns are ever held in full
+            chunks = list(
+                sas_reader.iter_chunks(
+                    path, DEFAULT_CHUNKSIZE, columns, self.workers, **load_params
+                )
+            )
+            data = pd.concat(chunks) if chunks else pd.read_sas(path, **load_params)
+            columns = None
+        elif self.read_format == "csv":
+            data = pd.read_csv(path, **load_params)
+        elif self.read_format == "txt":
             if "sep" not in list(load_params.keys()):
                 raise ValueError("Please provide a valid delimiter for this text file")
-            data = pd.read_table(str(self.path), **load_params)
-        elif self.input_format == "parquet":
-            data = pd.read_parquet(str(self.path), engine="pyarrow", **load_params)
-        elif self.input_format == "json":
-            data = pd.read_json(str(self.path), **load_params)
+            data = pd.read_table(path, **load_params)
+        elif self.read_format == "parquet":
+            data = pd.read_parquet(path, engine="pyarrow", **load_params)
+        elif self.read_format == "json" and json_reader.supports_params(load_params):
+            if load_params.get("lines"):
+                chunks = list(
+                    json_reader.iter_chunks(
+                        path, DEFAULT_CHUNKSIZE, columns, **load_params
+                    )
+                )
+                data = pd.concat(chunks) if chunks else pd.DataFrame(columns=columns)
+            else:
+                data = json_reader.read_json(path, columns, **load_params)
+            columns = None
+        elif self.read_format == "json":
+            data = pd.read_json(path, **load_params)
+        elif self.read_format in MAPPED_FORMATS:
+            table, _ = arrow_engine.read_mapped_table(path, load_params.get("columns"))
+            data = table.to_pandas()
         else:
-            raise ValueError("Path type {} not recognized".format(self.input_format))
+            raise ValueError("Path type {} not recognized".format(self.read_format))
+        if columns:
+            data = data[columns]
+        return data
+
+    def _read_compact_file(self, path, columns=None, **load_params) -> pd.DataFrame:
+        """
+        Read a file in compact mode. Each chunk is downcast before the next one
+        is read, so the file is never held in full in the dtypes it is read with
+        """
+        if self.read_format == "json" and not load_params.get("lines"):
+            # only line-delimited json can be read in chunks
+            return compact_frame(
+                self._read_file(path, columns, **load_params), self.compact_dtypes
+            )
+        chunks = [
+            compact_frame(chunk, self.compact_dtypes)
+            for chunk in self._iter_file_chunks(path, columns, **load_params)
+        ]
+        if not chunks:
+            return self._read_file(path, columns, **load_params)
+        # chunks narrowed to different dtypes are widened by concat
+        data = pd.concat(chunks, ignore_index=True)
+        return compact_frame(data, self.compact_dtypes)
+
+    def _read_frame(self, path, columns=None, **load_params) -> pd.DataFrame:
+        if self.compact:
+            return self._read_compact_file(path, columns, **load_params)
+        return self._read_file(path, columns, **load_params)
+
+    def _read_partition(self, path, partition, columns=None, **load_params):
+        file_columns, keys = self._split_partition_columns(columns, partition)
+        data = self._read_frame(path, file_columns, **load_params)
+        for key in keys:
+            data[key] = partition[key]
+        return data[columns] if columns else data
+
+    def _load_data_frompath(self, columns=None, **load_params) -> pd.DataFrame:
+        LOGGER.debug("\nLoading raw data into dataset object...")
+        data = None
+        start_time = datetime.now()
+        with self.tracer.span("load_data", "read") as counters:
+            if self.partition_files:
+                frames = self._map_partitions(
+                    partial(self._read_partition, columns=columns, **load_params),
+                    self.partition_files,
+                )
+                data = pd.concat(frames, ignore_index=True)
+            else:
+                data = self._read_frame(self.read_path, columns, **load_params)
+            counters["rows"] = len(data.index)
+            counters["bytes"] = data_bytes(data)
         end_time = datetime.now()
         self.load_time = str(end_time - start_time)
         return data
 
-    def _load_data_fromdf(self, df) -> pd.DataFrame:
+    def _encode_string_columns(self, data) -> pd.DataFrame:
+        """Encode the string columns of a loaded frame, leaving date columns to convert"""
+        if not self.encode_strings:
+            return data
+        date_columns = []
+        for col_name in data.columns:
+            if is_text_column(data[col_name]):
+                if col_name not in self.date_formats:
+                    with self.tracer.span(
+                        "infer_date_format", "type_inference", col_name
+                    ) as counters:
+                        counters["rows"] = len(data.index)
+                        self.date_formats[col_name] = infer_date_format(data[col_name])
+                if self.date_formats[col_name] is not None:
+                    date_columns.append(col_name)
+        return encode_strings(data, skip_columns=date_columns)
+
+    def _read_table_file(self, path, columns=None, **load_params):
+        """Read a file into an arrow table, returning the table and its mapped bytes"""
+        mapped_bytes = 0
+        table = None
+        codec = compression.get_compression(path)
+        if self.read_format in MAPPED_FORMATS:
+            table, mapped_bytes = arrow_engine.read_mapped_table(path, columns)
+        elif codec is None or codec in compression.ARROW_COMPRESSIONS:
+            # the arrow readers decompress the codecs they detect from the name
+            table = arrow_engine.read_table(
+                path, self.read_format, columns, **load_params
+            )
+        if table is None:
+            # no arrow reader for this format
+            table = arrow_engine.table_from_pandas(
+                self._read_file(path, columns, **load_params)
+            )
+        return table, mapped_bytes
+
+    def _read_table_partition(self, path, partition, columns=None, **load_params):
+        file_columns, keys = self._split_partition_columns(columns, partition)
+        table, mapped_bytes = self._read_table_file(path, file_columns, **load_params)
+        for key in keys:
+            table = arrow_engine.append_constant_column(table, key, partition[key])
+        return (table.select(columns) if columns else table), mapped_bytes
+
+    def _load_table_frompath(self, columns=None, **load_params):
+        LOGGER.debug("\nLoading raw data into arrow table...")
+        start_time = datetime.now()
+        with self.tracer.span("load_table", "read") as counters:
+            if self.partition_files:
+                results = self._map_partitions(
+                    partial(self._read_table_partition, columns=columns, **load_params),
+                    self.partition_files,
+                )
+                table = arrow_engine.concat_tables([table for table, _ in results])
+                self.mapped_bytes = sum(mapped_bytes for _, mapped_bytes in results)
+            else:
+                table, self.mapped_bytes = self._read_table_file(
+                    self.read_path, columns, **load_params
+                )
+            counters["rows"] = table.num_rows
+            counters["bytes"] = data_bytes(table)
+        end_time = datetime.now()
+        self.load_time = str(end_time - start_time)
+        return table
+
+    def _load_spark_df(self, df, columns=None):
+        LOGGER.debug("\nProfiling spark dataframe in spark...")
+        start_time = datetime.now()
+        if columns:
+            df = df.select(*["`{}`".format(col_name) for col_name in columns])
+        if self.sampler is not None:
+            df = self.sampler.sample_spark(df)
+        # spark reads and profiles the data in one pass
+        with self.tracer.span("profile_spark_frame", "profile"):
+            profiles = spark_engine.profile_frame(df)
+        for col_name, (kind, stats) in profiles.items():
+            self.columns[col_name] = COLUMN_KINDS[kind].from_stats(
+                col_name,
+                stats,
+                self.name,
+                source=partial(spark_engine.iter_column, df, col_name, self.chunksize),
+            )
+        end_time = datetime.now()
+        self.load_time = str(end_time - start_time)
+        return df
+
+    def _load_data_fromdf(self, df, columns=None) -> pd.DataFrame:
         LOGGER.debug("\nLoading raw data into dataset object...")
         data = None
         start_time = datetime.now()
-        if "pyspark" in self.input_format:
-            data = df.toPandas()
-        elif "pandas" in self.input_format:
-            data = df
-        else:
-            raise ValueError("object type not recognized")
+        with self.tracer.span("load_dataframe", "read") as counters:
+            if "pyspark" in self.input_format:
+                data = (df.select(*columns) if columns else df).toPandas()
+            elif "pandas" in self.input_format:
+                data = df[columns] if columns else df
+            else:
+                raise ValueError("object type not recognized")
+            counters["rows"] = len(data.index)
+            counters["bytes"] = data_bytes(data)
         end_time = datetime.now()
         self.load_time = str(end_time - start_time)
         return data
 
-    def convert_dates(self, raw_column):
-        if (raw_column.dtype == "object") or (raw_column.dtype == "O"):
-            try:
-                raw_column = pd.to_datetime(raw_column)
-            except (ValueError, TypeError, AttributeError) as e:
-                pass
-            except OverflowError:
-                raw_column = raw_column.astype("str")
-        return raw_column
+    def _sample_frompath(self, columns=None, **load_params) -> pd.DataFrame:
+        LOGGER.debug("\nSampling raw data into dataset object...")
+        start_time = datetime.now()
+        chunks = self._iter_chunks(columns=columns, **load_params)
+        for chunk in self.tracer.trace_chunks(chunks, "read_chunk"):
+            self.sampler.update(chunk)
+        data = self.sampler.result()
+        end_time = datetime.now()
+        self.load_time = str(end_time - start_time)
+        return data
+
+    def _iter_chunks(self, columns=None, **load_params):
+        """Yield the data at the dataset path as a series of dataframes"""
+        if not self.partition_files:
+            yield from self._iter_file_chunks(self.read_path, columns, **load_params)
+            return
+        for path, partition in self.partition_files:
+            yield from self._iter_partition_chunks(
+                path, partition, columns, **load_params
+            )
+
+    def _iter_partition_chunks(self, path, partition, columns=None, **load_params):
+        file_columns, keys = self._split_partition_columns(columns, partition)
+        for chunk in self._iter_file_chunks(path, file_columns, **load_params):
+            for key in keys:
+                chunk[key] = partition[key]
+            yield chunk[columns] if columns else chunk
+
+    def _iter_file_chunks(self, path, columns=None, **load_params):
+        """Yield the data of a single file as a series of dataframes"""
+        if compression.get_compression(path) is not None:
+            with compression.open_stream(path) as source:
+                yield from self._iter_file_chunks(source, columns, **load_params)
+            return
+        if isinstance(path, Path):
+            path = str(path)
+        chunksize = self.chunksize
+        load_params, columns = self._push_down_columns(columns, load_params)
+        if self.read_format == "sas7bdat":
+            yield from sas_reader.iter_chunks(
+                path, chunksize, columns, self.workers, **load_params
+            )
+        elif self.read_format in ("csv", "txt"):
+            if self.read_format == "txt" and "sep" not in load_params:
+                raise ValueError("Please provide a valid delimiter for this text file")
+            with pd.read_csv(path, chunksize=chunksize, **load_params) as reader:
+                for chunk in reader:
+                    yield chunk
+        elif self.read_format == "parquet":
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(path)
+            for batch in parquet_file.iter_batches(
+                batch_size=chunksize, columns=load_params.get("columns")
+            ):
+                yield batch.to_pandas()
+        elif self.read_format == "json":
+            if not load_params.get("lines"):
+                raise ValueError(
+                    "Only line-delimited json (lines=True) can be streamed"
+                )
+            if json_reader.supports_params(load_params):
+                yield from json_reader.iter_chunks(
+                    path, chunksize, columns, **load_params
+                )
+                return
+            with pd.read_json(path, chunksize=chunksize, **load_params) as reader:
+                for chunk in reader:
+                    yield chunk if columns is None else chunk[columns]
+        elif self.read_format in MAPPED_FORMATS:
+            table, _ = arrow_engine.read_mapped_table(path, load_params.get("columns"))
+            for offset in range(0, table.num_rows, chunksize):
+                # slices are zero-copy; only the chunk is converted to pandas
+                yield table.slice(offset, chunksize).to_pandas()
+        else:
+            raise ValueError("Path type {} not recognized".format(self.read_format))
+
+    def _iter_column_chunks(self, col_name):
+        """Re-read a single column of a streamed dataset chunk by chunk"""
+        for chunk in self._iter_chunks(columns=[col_name], **self.load_params):
+            yield chunk[col_name]
+
+    def _aggregate_chunks(self, chunks, col_types=None):
+        """Fold a series of dataframe chunks into one aggregate per column"""
+        aggregates = {}
+        col_types = {} if col_types is None else dict(col_types)
+        for chunk in self.tracer.trace_chunks(chunks, "read_chunk"):
+            for raw_col_name in chunk.columns:
+                raw_column = self._convert_column_dates(chunk[raw_col_name])
+                if raw_col_name not in col_types:
+                    # the first chunk decides the column type
+                    col_types[raw_col_name] = self._get_column_type(raw_column)
+                if raw_col_name not in aggregates:
+                    aggregate_type = col_types[raw_col_name].aggregate_type
+                    aggregates[raw_col_name] = aggregate_type(
+                        raw_col_name,
+                        **_column_options(aggregate_type, self.distinct_precision)
+                    )
+                with self.tracer.span(
+                    "aggregate_chunk", "profile", raw_col_name, fold=True
+                ) as counters:
+                    aggregates[raw_col_name].update(raw_column)
+                    counters["rows"] = len(raw_column)
+                    counters["bytes"] = data_bytes(raw_column)
+        return aggregates, col_types
+
+    def _aggregate_partitions(self, columns=None, **load_params):
+        """Aggregate each partition on its own thread and merge the results"""
+        first_file, other_files = self.partition_files[0], self.partition_files[1:]
+        # the first partition decides the column types for all of them
+        aggregates, col_types = self._aggregate_chunks(
+            self._iter_partition_chunks(*first_file, columns, **load_params)
+        )
+        partition_aggregates = self._map_partitions(
+            lambda path, partition: self._aggregate_chunks(
+                self._iter_partition_chunks(path, partition, columns, **load_params),
+                col_types,
+            ),
+            other_files,
+        )
+        for part_aggregates, part_col_types in partition_aggregates:
+            for raw_col_name, aggregate in part_aggregates.items():
+                if raw_col_name in aggregates:
+                    aggregates[raw_col_name].merge(aggregate)
+                else:
+                    aggregates[raw_col_name] = aggregate
+                    col_types[raw_col_name] = part_col_types[raw_col_name]
+        return aggregates, col_types
+
+    def _stream_columns(self, columns=None, **load_params):
+        LOGGER.debug("\nStreaming raw data into dataset object...")
+        start_time = datetime.now()
+        if self.partition_files:
+            aggregates, col_types = self._aggregate_partitions(columns, **load_params)
+        else:
+            aggregates, col_types = self._aggregate_chunks(
+                self._iter_chunks(columns=columns, **load_params)
+            )
+
+        if len(aggregates) == 0:
+            raise ValueError("No columns found for this data source")
+        for raw_col_name, aggregate in aggregates.items():
+            LOGGER.debug(raw_col_name)
+            self.columns[raw_col_name] = col_types[raw_col_name].from_aggregate(
+                aggregate,
+                self.name,
+                source=partial(self._iter_column_chunks, raw_col_name),
+            )
+        end_time = datetime.now()
+        self.load_time = str(end_time - start_time)
+
+    @staticmethod
+    def convert_dates(raw_column, date_format=None):
+        """
+        Convert a string column to dates if a sample of it shares a date
+        format (inferred unless given) and every value matches that format
+        """
+        if not is_text_column(raw_column):
+            return raw_column
+        if date_format is None:
+            date_format = infer_date_format(raw_column)
+        if date_format is None:
+            return raw_column
+        return to_dates(raw_column, date_format)
+
+    def _convert_column_dates(self, raw_column):
+        """convert_dates, inferring the date format of each column only once"""
+        if not is_text_column(raw_column):
+            return raw_column
+        # called for every chunk of a streamed column, so chunk spans are folded
+        with self.tracer.span(
+            "convert_dates", "type_inference", raw_column.name, fold=True
+        ) as counters:
+            counters["rows"] = len(raw_column)
+            if raw_column.name not in self.date_formats:
+                self.date_formats[raw_column.name] = infer_date_format(raw_column)
+            date_format = self.date_formats[raw_column.name]
+            if date_format is None:
+                return raw_column
+            return to_dates(raw_column, date_format)
+
+    @staticmethod
+    def _get_column_type(raw_column):
+        # nullable numeric dtypes are capitalized (Int8, Float32)
+        if re.search(r"(int)", str(raw_column.dtype), re.IGNORECASE):
+            return NumericColumn
+        elif re.search(r"(float)", str(raw_column.dtype), re.IGNORECASE):
+            return NumericColumn
+        elif re.search(r"(str)", str(raw_column.dtype)):
+            return StringColumn
+        elif re.search(r"time|ns", str(raw_column.dtype)):
+            return TemporalColumn
+        elif re.search(r"(bool)", str(raw_column.dtype)):
+            return BooleanColumn
+        return StringColumn
+
+    def _get_column_type_hint(self, raw_column):
+        """Column type known from the dtype alone, or None if dates must be sniffed"""
+        dtype = raw_column.dtype
+        if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            return None
+        return self._get_column_type(raw_column)
+
+    def _profile_column(self, raw_col_name):
+        LOGGER.debug("Profiling column {}".format(raw_col_name))
+        with self.tracer.span("profile_column", "profile", raw_col_name) as counters:
+            raw_column = self._convert_column_dates(self.dataframe[raw_col_name])
+            counters["rows"] = len(raw_column)
+            counters["bytes"] = data_bytes(raw_column)
+            col_type = self._get_column_type(raw_column)
+            return col_type(
+                raw_column,
+                self.name,
+                **_column_options(col_type, self.distinct_precision)
+            )
+
+    def _profile_arrow_column(self, col_name):
+        LOGGER.debug("Profiling column {}".format(col_name))
+        with self.tracer.span("profile_column", "profile", col_name) as counters:
+            with self.tracer.span("convert_dates", "type_inference", col_name):
+                array = arrow_engine.convert_dates(self.table.column(col_name))
+            counters["rows"] = len(array)
+            counters["bytes"] = data_bytes(array)
+            kind = arrow_engine.get_column_kind(array)
+            return COLUMN_KINDS[kind].from_stats(
+                col_name,
+                arrow_engine.profile_column(array, kind),
+                self.name,
+                source=partial(self._iter_arrow_column, col_name),
+            )
+
+    def _iter_arrow_column(self, col_name):
+        """Convert a single column of the arrow table to pandas for the checks"""
+        array = arrow_engine.convert_dates(self.table.column(col_name))
+        raw_column = array.to_pandas()
+        raw_column.name = col_name
+        yield raw_column
+
+    def _prepare_arrow_columns(self):
+        LOGGER.debug("\nPreparing arrow columns...")
+        if self.table.num_columns == 0:
+            raise TypeError("No columns found for this table")
+        for col_name in self.table.column_names:
+            kind = arrow_engine.get_column_kind(self.table.column(col_name))
+            self.columns.register(
+                col_name,
+                partial(self._profile_arrow_column, col_name),
+                # string columns may still turn out to be dates
+                None if kind == "string" else COLUMN_KINDS[kind],
+            )
 
     def _prepare_columns(self):
+        if self.table is not None:
+            self._prepare_arrow_columns()
+            return
         LOGGER.debug("\nPreparing columns...")
         if len(self.dataframe.columns) == 0:
             raise TypeError("No columns found for this dataframe")
         for raw_col_name in self.dataframe.columns:
-            LOGGER.debug(raw_col_name)
-            raw_column = self.convert_dates(self.dataframe[raw_col_name])
-            if re.search(r"(int)", str(raw_column.dtype)):
-                self.columns[raw_col_name] = NumericColumn(raw_column, self.name)
-            elif re.search(r"(float)", str(raw_column.dtype)):
-                self.columns[raw_col_name] = NumericColumn(raw_column, self.name)
-            elif re.search(r"(str)", str(raw_column.dtype)):
-                self.columns[raw_col_name] = StringColumn(raw_column, self.name)
-            elif re.search(r"time|ns", str(raw_column.dtype)):
-                self.columns[raw_col_name] = TemporalColumn(raw_column, self.name)
-            elif re.search(r"(bool)", str(raw_column.dtype)):
-                self.columns[raw_col_name] = BooleanColumn(raw_column, self.name)
-            else:
-                self.columns[raw_col_name] = StringColumn(raw_column, self.name)
+            # columns are profiled lazily, on first access
+            self.columns.register(
+                raw_col_name,
+                partial(self._profile_column, raw_col_name),
+                self._get_column_type_hint(self.dataframe[raw_col_name]),
+            )
+        if self.workers and self.workers > 1:
+            self._profile_columns_parallel()
+
+    def _profile_columns_parallel(self):
+        LOGGER.debug("\nProfiling columns on {} workers...".format(self.workers))
+        with self.tracer.span("profile_columns_parallel", "profile") as counters:
+            counters["rows"] = len(self.dataframe.index)
+            with shared_frame(self.dataframe) as (path, shared_names):
+                cols = map_columns(
+                    _profile_shared_column,
+                    shared_names,
+                    self.workers,
+                    path,
+                    self.name,
+                    self.distinct_precision,
+                )
+        for raw_col_name, col in cols.items():
+            raw_column = self.dataframe[raw_col_name]
+            if isinstance(col, TemporalColumn):
+                raw_column = self._convert_column_dates(raw_column)
+            col.data = raw_column
+            self.columns[raw_col_name] = col
+
+    def profile_columns(self, col_names: list = None):
+        """Profile the given columns (default: all of them) not accessed yet"""
+        col_names = list(self.columns) if col_names is None else col_names
+        pending = [
+            raw_col_name
+            for raw_col_name in col_names
+            if not self.columns.is_profiled(raw_col_name)
+        ]
+        # write the cached profile once for the whole batch
+        on_build, self.columns.on_build = self.columns.on_build, None
+        try:
+            for raw_col_name in pending:
+                self.columns[raw_col_name]
+        finally:
+            self.columns.on_build = on_build
+        if pending and on_build is not None:
+            on_build()
+        return self.columns
+
+    def perform_checks(self, col_names: list = None) -> dict:
+        """
+        Perform the checks for the given columns (default: all of them),
+        on the worker processes when the dataset was loaded with workers
+        """
+        col_names = list(self.columns) if col_names is None else list(col_names)
+        checks = {
+            col_name: self._cached_checks[col_name]
+            for col_name in col_names
+            if col_name in self._cached_checks
+        }
+        pending = [col_name for col_name in col_names if col_name not in checks]
+        if pending and self.workers and self.workers > 1 and self.dataframe is not None:
+            with self.tracer.span("check_columns_parallel", "check") as counters:
+                counters["rows"] = len(self.dataframe.index)
+                with shared_frame(self.dataframe[pending]) as (path, shared_names):
+                    checks.update(
+                        map_columns(
+                            _check_shared_column,
+                            shared_names,
+                            self.workers,
+                            path,
+                            self.name,
+                        )
+                    )
+        self.profile_columns(
+            [col_name for col_name in pending if col_name not in checks]
+        )
+        # the check functions record their spans into this dataset's tracer
+        with activate(self.tracer):
+            for col_name in pending:
+                if col_name not in checks:
+                    checks[col_name] = self.columns[col_name].perform_check()
+        if pending and self.cache_key is not None:
+            self._cached_checks.update(
+                {col_name: checks[col_name] for col_name in pending}
+            )
+            self._store_profile()
+        return {col_name: checks[col_name] for col_name in col_names}
+
+    def _release_data(self):
+        """
+        Replace every column with a data-free ColumnSummary and drop the loaded
+        data. The checks are performed first, while the data is still there
+        """
+        LOGGER.debug("\nReleasing the data of {}...".format(self.name))
+        self.profile_columns()
+        checks = self.perform_checks()
+        for col_name in list(self.columns):
+            self.columns[col_name] = ColumnSummary(
+                self.columns[col_name], checks[col_name]
+            )
+        self.dataframe = None
+        self.table = None
+        if self.sampler is not None:
+            self.sampler.clear()
+
+    def _get_resident_bytes(self) -> int:
+        """Bytes of the loaded data held in process memory (not memory-mapped)"""
+        if self.table is not None:
+            return max(self.table.nbytes - self.mapped_bytes, 0)
+        elif self.dataframe is not None:
+            return int(self.dataframe.memory_usage(deep=True).sum())
+        return 0
+
+    def _get_sample_rows(self) -> int:
+        if self.dataframe is not None:
+            return len(self.dataframe.index)
+        elif self.table is not None:
+            return self.table.num_rows
+        # spark: every column accounts for all of the sampled rows
+        col = next(iter(self.columns.values()), None)
+        return 0 if col is None else int(col.count + col.missing)
+
+    def get_sample_estimates(self) -> dict:
+        """Population estimates and confidence intervals of a sampled dataset"""
+        if self.sampler is None:
+            return {}
+        sample_rows = self._get_sample_rows()
+        return {
+            col_name: self.sampler.estimate_column(col, sample_rows)
+            for col_name, col in self.columns.items()
+        }
+
+    def get_compact_summary(self) -> dict:
+        """Memory of the loaded data before and after compaction, with the dtype changes"""
+        if not self.compact or self.dataframe is None:
+            return None
+        dtypes = {
+            col_name: "{} -> {}".format(dtype, self.dataframe[col_name].dtype)
+            for col_name, dtype in self.compact_dtypes.items()
+            if col_name in self.dataframe.columns
+            and str(self.dataframe[col_name].dtype) != dtype
+        }
+        return {
+            "memory_before": self._format_size(
+                uncompacted_bytes(self.dataframe, self.compact_dtypes)
+            ),
+            "memory_after": self._format_size(self._get_resident_bytes()),
+            "dtypes": dtypes,
+        }
+
+    def get_unique_errors(self) -> dict:
+        """Standard error of each approximate distinct count (approx_distinct)"""
+        if self.distinct_precision is None:
+            return None
+        return {
+            col_name: col.unique_error
+            for col_name, col in self.columns.items()
+            if getattr(col, "unique_error", 0)
+        }
 
     def get_summary(self):
+        sample = None
+        if self.sampler is not None:
+            sample = self.sampler.get_summary(self._get_sample_rows())
         return {
             "path": self.path,
             "format": self.input_format,
             "size": self.size,
+            "mapped_size": self._format_size(self.mapped_bytes),
+            "resident_size": self._format_size(self._get_resident_bytes()),
             "columns": self.columns,
             "ds_name": self.name,
             "load_time": self.load_time,
+            "from_cache": self.from_cache,
+            "sample": sample,
+            "estimates": self.get_sample_estimates(),
+            "compact": self.get_compact_summary(),
+            "trace": self.tracer.get_summary(),
+            "unique_errors": self.get_unique_errors(),
         }
 
     def get_cols_oftype(self, data_type):
@@ -233,26 +1306,76 @@ class Dataset(object):
         elif data_type in boolean_aliases:
             data_type = "boolean"
 
+        # unresolved (object dtype) columns can only be string or temporal
+        profile = data_type.lower() not in ("numeric", "boolean")
         cols_oftype = {}
-        for col_name, col in self.columns.items():
-            if data_type.lower() in col.data_type.lower():
-                cols_oftype[col_name] = col
+        for col_name in self.columns:
+            col_type = self.columns.get_type(col_name, profile=profile)
+            if col_type is None:
+                continue
+            if data_type.lower() in col_type.__name__.lower():
+                cols_oftype[col_name] = self.columns[col_name]
 
         return cols_oftype
 
 
 class Column(object):
-    def __init__(self, raw_column, ds_name):
+    aggregate_type = None
+
+    def __init__(self, raw_column, ds_name, count=None, missing=None):
         self.ds_name = ds_name
-        self.count = raw_column.count()
-        self.missing = raw_column.isnull().sum()
+        self.count = raw_column.count() if count is None else count
+        self.missing = raw_column.isnull().sum() if missing is None else missing
         self.data = raw_column
         self.invalid = 0
         self.name = raw_column.name
+        self._source = None
 
     def __eq__(self, other_col):
         return other_col.__class__ == self.__class__
 
+    @classmethod
+    def from_stats(cls, name, stats, ds_name, invalid=0, source=None):
+        """
+        Build a column from precomputed statistics instead of a raw column.
+        The raw data is not kept; 'source' yields it (in chunks) for the checks
+        """
+        col = cls.__new__(cls)
+        col.ds_name = ds_name
+        col.name = name
+        col.data = None
+        col.invalid = invalid
+        col.data_type = cls.__name__
+        col._source = source
+        for stat_name, stat in stats.items():
+            setattr(col, stat_name, stat)
+        return col
+
+    @classmethod
+    def from_aggregate(cls, aggregate, ds_name, source=None):
+        """Build a column from merged chunk aggregates"""
+        return cls.from_stats(
+            aggregate.name, aggregate.finalize(), ds_name, aggregate.invalid, source
+        )
+
+    def iter_data(self, row_limit=None):
+        """Yield the column data, one chunk at a time for streamed columns"""
+        if self.data is not None:
+            # like streamed columns, a row limit of 0 or less means every row
+            limited = row_limit and row_limit > 0
+            yield self.data[0:row_limit] if limited else self.data
+            return
+        if self._source is None:
+            return
+        rows_left = row_limit if (row_limit and row_limit > 0) else None
+        for chunk in self._source():
+            if rows_left is not None:
+                chunk = chunk[0:rows_left]
+                rows_left -= len(chunk)
+            yield chunk
+            if rows_left is not None and rows_left <= 0:
+                return
+
     def load_validation_settings(self):
         validation_data = None
         if not validation_data:
@@ -267,14 +1390,43 @@ class Column(object):
 
 
 class StringColumn(Column):
-    def __init__(self, raw_column, ds_name):
+    aggregate_type = StringAggregate
+    # distinct values of the loaded data; None for sketched or data-free columns
+    text_stats = None
+
+    def __init__(self, raw_column, ds_name, distinct_precision=None):
         try:
-            Column.__init__(self, raw_column, ds_name)
+            if distinct_precision is None:
+                # one factorization gives the counts, distinct values and
+                # lengths, and the pattern flags of the checks
+                self.text_stats = TextStats(raw_column)
+                Column.__init__(
+                    self,
+                    raw_column,
+                    ds_name,
+                    self.text_stats.count,
+                    self.text_stats.missing,
+                )
+                self.unique = self.text_stats.unique
+                self.unique_error = 0.0
+            else:
+                Column.__init__(self, raw_column, ds_name)
+                # estimated from a fixed-size sketch; no table of the values
+                self.unique, self.unique_error = count_distinct(
+                    raw_column.dropna(), distinct_precision
+                )
             self.data_type = self.__class__.__name__
             try:
-                self.text_length_mean = raw_column.str.len().mean()
-                self.text_length_std = raw_column.str.len().std()
-                self.text_length_med = raw_column.str.len().median()
+                if self.text_stats is None:
+                    histogram = row_length_histogram(raw_column)
+                else:
+                    histogram = self.text_stats.length_histogram()
+                (
+                    self.text_length_mean,
+                    self.text_length_std,
+                    self.text_length_med,
+                ) = length_histogram_stats(histogram)
+                self.text_length_quantiles = histogram_quantiles(histogram)
             except AttributeError:
                 LOGGER.error(
                     "Cannot use '.str': Column likely contains a non-string type"
@@ -282,8 +1434,7 @@ class StringColumn(Column):
                 self.text_length_mean = None
                 self.text_length_std = None
                 self.text_length_med = None
-            descr = raw_column.describe()
-            self.unique = descr["unique"]
+                self.text_length_quantiles = None
             self.duplicates = self.count - self.unique
         except Exception as e:
             LOGGER.error(e)
@@ -298,6 +1449,10 @@ class StringColumn(Column):
             "data_type": self.data_type,
             "text_length_mean": self.text_length_mean,
             "text_length_std": self.text_length_std,
+            **{
+                "text_length_" + name: (self.text_length_quantiles or {}).get(name)
+                for name in QUANTILES
+            },
             "unique": self.unique,
             "duplicates": self.duplicates,
             # 'top': self.top
@@ -309,14 +1464,20 @@ class StringColumn(Column):
 
 
 class NumericColumn(Column):
+    aggregate_type = NumericAggregate
+
     def __init__(self, raw_column, ds_name):
-        Column.__init__(self, raw_column, ds_name)
+        # every statistic but the quantiles comes from one fused scan
+        moments = scan_numeric(raw_column)
+        Column.__init__(self, raw_column, ds_name, moments.n, moments.missing)
         self.data_type = self.__class__.__name__
-        self.min = raw_column.min()
-        self.max = raw_column.max()
-        self.std = raw_column.std()
-        self.mean = raw_column.mean()
-        self.zeros = (raw_column == 0).sum()
+        self.min = moments.min
+        self.max = moments.max
+        self.std = moments.std
+        self.mean = moments.mean
+        self.zeros = moments.zeros
+        self.skew = moments.skew
+        self.quantiles = numeric_quantiles(raw_column)
 
     def get_summary(self) -> dict:
         return {
@@ -330,6 +1491,7 @@ class NumericColumn(Column):
             "min": self.min,
             "max": self.max,
             "std": self.std,
+            **self.quantiles,
             "zeros": self.zeros,
             "pct_zero": round(float(self.zeros / self.count) * 100, 2),
         }
@@ -340,12 +1502,20 @@ class NumericColumn(Column):
 
 
 class TemporalColumn(Column):
-    def __init__(self, raw_column, ds_name):
+    aggregate_type = TemporalAggregate
+
+    def __init__(self, raw_column, ds_name, distinct_precision=None):
         Column.__init__(self, raw_column, ds_name)
         self.data_type = self.__class__.__name__
         self.min = raw_column.min()
         self.max = raw_column.max()
-        self.unique = len(raw_column) - len(raw_column.drop_duplicates())
+        if distinct_precision is None:
+            self.unique = len(raw_column) - len(raw_column.drop_duplicates())
+            self.unique_error = 0.0
+        else:
+            distinct, self.unique_error = count_distinct(raw_column, distinct_precision)
+            self.unique = max(len(raw_column) - distinct, 0)
+        self.quantiles = temporal_quantiles(raw_column)
 
     def get_summary(self) -> dict:
         return {
@@ -356,6 +1526,7 @@ class TemporalColumn(Column):
             "data_type": self.data_type,
             "min": self.min,
             "max": self.max,
+            **self.quantiles,
             "unique": self.unique,
         }
 
@@ -365,6 +1536,8 @@ class TemporalColumn(Column):
 
 
 class BooleanColumn(Column):
+    aggregate_type = BooleanAggregate
+
     def __init__(self, raw_column, ds_name):
         Column.__init__(self, raw_column, ds_name)
         self.data_type = self.__class__.__name__
@@ -386,3 +1559,53 @@ class BooleanColumn(Column):
     def perform_check(self) -> dict:
         validation_settings = self.load_validation_settings()
         return check_boolean_column(self, validation_settings["boolean"])
+
+
+class ColumnSummary(object):
+    """
+    Data-free record of a profiled column, kept in place of the column by
+    datasets loaded with retain_data=False: its summary and check results
+    """
+
+    __slots__ = ("ds_name", "name", "data_type", "column_type", "stats", "checks")
+
+    def __init__(self, col, checks):
+        self.ds_name = col.ds_name
+        self.name = col.name
+        self.data_type = col.data_type
+        self.column_type = col.__class__
+        self.stats = col.get_summary()
+        self.checks = checks
+
+    def __getattr__(self, stat_name):
+        # summary statistics read as attributes, as on a full column
+        if stat_name in ColumnSummary.__slots__:
+            raise AttributeError(stat_name)
+        try:
+            return self.stats[stat_name]
+        except KeyError:
+            raise AttributeError(stat_name)
+
+    def __repr__(self):
+        return "<ColumnSummary {} ({})>".format(self.name, self.data_type)
+
+    def get_summary(self) -> dict:
+        return dict(self.stats)
+
+    def perform_check(self, row_limit=-1) -> dict:
+        return dict(self.checks)
+
+
+COLUMN_KINDS = {
+    "numeric": NumericColumn,
+    "string": StringColumn,
+    "temporal": TemporalColumn,
+    "boolean": BooleanColumn,
+}
+# types whose distinct counts can be approximated
+DISTINCT_COUNTED_TYPES = (
+    StringColumn,
+    TemporalColumn,
+    StringAggregate,
+    TemporalAggregate,
+)
@@ -0,0 +1,139 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Sample-based date detection for string columns
+### DEVELOPER NOTES:
+    A small sample of each string column is probed against candidate date
+    formats. Only a column whose sample all parses with one format is then
+    converted, in a single vectorized to_datetime(format=...) pass.
+"""
+import logging
+import os
+import re
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:
+    # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+DATE_SAMPLE_SIZE = 100
+# formats tried when pandas cannot guess one from the first value
+CANDIDATE_DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%m/%d/%Y %H:%M:%S",
+    "%d-%m-%Y",
+    "%d%b%Y",
+    "%d-%b-%Y",
+    "%b %d, %Y",
+]
+# marks a column of date/datetime objects, which needs no format
+OBJECT_DATES = "objects"
+NUMBER_PATTERN = re.compile(r"^\s*[+\-]?(\d+\.?\d*|\.\d+)([eE][+\-]?\d+)?\s*$")
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def is_text_column(raw_column) -> bool:
+    dtype = raw_column.dtype
+    return pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+
+
+def _get_probe(raw_column) -> pd.Series:
+    """A few non-missing values from the top of the column"""
+    probe = raw_column.head(DATE_SAMPLE_SIZE * 10).dropna().head(DATE_SAMPLE_SIZE)
+    if probe.empty:
+        probe = raw_column.dropna().head(DATE_SAMPLE_SIZE)
+    return probe
+
+
+def _parses(values, date_format) -> bool:
+    try:
+        pd.to_datetime(values, format=date_format, errors="raise")
+        return True
+    except (ValueError, TypeError, OverflowError):
+        return False
+
+
+def infer_date_format(raw_column):
+    """
+    Date format shared by a sample of the column's values, OBJECT_DATES for
+    date/datetime objects, or None if the column does not look like dates
+    """
+    probe = _get_probe(raw_column)
+    if probe.empty:
+        return None
+    if all(isinstance(value, (date, datetime)) for value in probe):
+        return OBJECT_DATES
+    if not all(isinstance(value, str) for value in probe):
+        return None
+    # numbers and codes such as 20210101 are kept as strings
+    if all(NUMBER_PATTERN.match(value) for value in probe):
+        return None
+    guessed = guess_datetime_format(probe.iloc[0])
+    candidates = ([guessed] if guessed else []) + CANDIDATE_DATE_FORMATS
+    for date_format in dict.fromkeys(candidates):
+        if _parses(probe, date_format):
+            return date_format
+    return None
+
+
+def to_dates(raw_column, date_format):
+    """
+    Convert the column with a known format. The column is returned as is
+    if any value does not match it
+    """
+    try:
+        if date_format == OBJECT_DATES:
+            return pd.to_datetime(raw_column)
+        return pd.to_datetime(raw_column, format=date_format, errors="raise")
+    except (ValueError, TypeError, AttributeError):
+        return raw_column
+    except OverflowError:
+        return raw_column.astype("str")
+
+
+def guess_date_formats(values) -> list:
+    """
+    Formats date_mask tries: those guessed from the first few values, then
+    CANDIDATE_DATE_FORMATS
+    """
+    probe = _get_probe(values).head(5)
+    guessed = [guess_datetime_format(v) for v in probe if type(v) == str]
+    return [fmt for fmt in guessed if fmt] + CANDIDATE_DATE_FORMATS
+
+
+def date_mask(values, date_formats=None) -> np.ndarray:
+    """
+    Flag the values of a series that are date strings. Values are tried
+    against each format in turn instead of being parsed one at a time
+    """
+    if date_formats is None:
+        date_formats = guess_date_formats(values)
+    is_text = (values.map(type) == str).to_numpy()
+    mask = np.zeros(len(values), dtype=bool)
+    for date_format in dict.fromkeys(date_formats):
+        pending = is_text & ~mask
+        if not pending.any():
+            break
+        parsed = pd.to_datetime(values[pending], format=date_format, errors="coerce")
+        mask[np.flatnonzero(pending)[parsed.notna().to_numpy()]] = True
+    return mask
@@ -0,0 +1,232 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Base for the on-disk caches: source fingerprints, an entry index and
+    size-bounded least-recently-used eviction
+### DEVELOPER NOTES:
+    Each cache directory holds one file per entry and an index file with the
+    entry sizes and access times. Files are written atomically, and every
+    read-modify-write of the index holds a lock: a threading.Lock shared by
+    the caches of the same directory, and an exclusive lock on LOCK_FILE
+    for other processes (where fcntl is available).
+"""
+
+import logging
+import os
+import json
+import hashlib
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # not available on Windows
+    fcntl = None
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "DATA_COMPARATOR_CACHE", str(Path.home() / ".cache" / "data_comparator")
+)
+DEFAULT_MAX_CACHE_BYTES = 1000000000
+INDEX_FILE = "index.json"
+LOCK_FILE = "index.lock"
+HASH_BLOCK_SIZE = 65536
+HASH_BLOCKS = 16
+
+# index locks of the cache directories used in this process
+_DIR_LOCKS = {}
+_DIR_LOCKS_GUARD = threading.Lock()
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def hash_file(path, full: bool = False) -> str:
+    """
+    Content hash of a file. Unless 'full', only evenly spaced blocks
+    (including the first and last) are hashed, so large files are not read
+    in full just to be fingerprinted
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    size = os.path.getsize(path)
+    with open(path, "rb") as data_file:
+        if full or size <= HASH_BLOCK_SIZE * HASH_BLOCKS:
+            for block in iter(lambda: data_file.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        else:
+            step = (size - HASH_BLOCK_SIZE) // (HASH_BLOCKS - 1)
+            for block_num in range(HASH_BLOCKS):
+                data_file.seek(block_num * step)
+                digest.update(data_file.read(HASH_BLOCK_SIZE))
+    return digest.hexdigest()
+
+
+def _dir_lock(cache_dir) -> threading.Lock:
+    with _DIR_LOCKS_GUARD:
+        return _DIR_LOCKS.setdefault(str(Path(cache_dir).resolve()), threading.Lock())
+
+
+def fingerprint_files(paths, full_hash: bool = False) -> list:
+    """(path, size, mtime, content hash) of each source file"""
+    fingerprint = []
+    for path in paths:
+        stat = os.stat(path)
+        fingerprint.append(
+            [str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns]
+            + [hash_file(path, full_hash)]
+        )
+    return fingerprint
+
+
+class DiskCache(object):
+    # file name suffix of the cache entries
+    entry_suffix = ""
+    # directory under DEFAULT_CACHE_DIR used when no cache_dir is given
+    default_subdir = ""
+    # bumped whenever the layout of the cached entries changes
+    version = 1
+
+    def __init__(
+        self,
+        cache_dir: str = None,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        full_hash: bool = False,
+    ):
+        if cache_dir is None:
+            cache_dir = Path(DEFAULT_CACHE_DIR) / self.default_subdir
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.full_hash = full_hash
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self):
+        return "{}({}, {} entries)".format(
+            self.__class__.__name__, self.cache_dir, len(self.entries())
+        )
+
+    def _entry_path(self, key) -> Path:
+        return self.cache_dir / "{}{}".format(key, self.entry_suffix)
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.cache_dir / INDEX_FILE, "r") as index_file:
+                return json.load(index_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        self._write_atomic(
+            self.cache_dir / INDEX_FILE, json.dumps(index, indent=1).encode()
+        )
+
+    @contextmanager
+    def _index_lock(self):
+        """Hold the index of the cache directory for a read-modify-write"""
+        with _dir_lock(self.cache_dir):
+            if fcntl is None:
+                yield
+                return
+            with open(self.cache_dir / LOCK_FILE, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_atomic(self, path, content: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, str(path))
+
+    def make_key(self, paths, params: dict) -> str:
+        """Cache key of the source files and the parameters they are read with"""
+        key_content = json.dumps(
+            {
+                "version": self.version,
+                "files": fingerprint_files(paths, self.full_hash),
+                "params": params,
+            },
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.sha256(key_content.encode()).hexdigest()
+
+    def _touch(self, key) -> bool:
+        """Mark an entry as used; False if there is no such entry"""
+        with self._index_lock():
+            index = self._read_index()
+            if key not in index or not self._entry_path(key).exists():
+                return False
+            index[key]["last_access"] = time.time()
+            self._write_index(index)
+        return True
+
+    def _add_entry(self, key, size: int, source="", **meta):
+        """Index a written entry and evict the least recently used ones over the cap"""
+        with self._index_lock():
+            index = self._read_index()
+            now = time.time()
+            index[key] = {
+                "source": str(Path(source).resolve()) if source else "",
+                "bytes": size,
+                "created": index.get(key, {}).get("created", now),
+                "last_access": now,
+                **meta,
+            }
+            self._write_index(self._evict(index, keep=key))
+
+    def _evict(self, index, keep=None) -> dict:
+        total = sum(meta["bytes"] for meta in index.values())
+        by_access = sorted(index.items(), key=lambda item: item[1]["last_access"])
+        for key, meta in by_access:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            LOGGER.debug("Evicting profile cache entry {}".format(key))
+            self._remove_entry_file(key)
+            total -= meta["bytes"]
+            del index[key]
+        return index
+
+    def _remove_entry_file(self, key):
+        try:
+            os.remove(str(self._entry_path(key)))
+        except OSError:
+            pass
+
+    def entries(self) -> list:
+        """Metadata of every cache entry, most recently used first"""
+        index = self._read_index()
+        entries = [{"key": key, **meta} for key, meta in index.items()]
+        return sorted(entries, key=lambda entry: -entry["last_access"])
+
+    def invalidate(self, source=None, key=None) -> int:
+        """
+        Remove the entries of a source path (or a single key); everything
+        when neither is given. Returns the number of entries removed
+        """
+        with self._index_lock():
+            index = self._read_index()
+            if key is not None:
+                keys = [key] if key in index else []
+            elif source is not None:
+                source = str(Path(source).resolve())
+                keys = [k for k, meta in index.items() if meta["source"] == source]
+            else:
+                keys = list(index)
+            for key_to_remove in keys:
+                self._remove_entry_file(key_to_remove)
+                del index[key_to_remove]
+            self._write_index(index)
+        return len(keys)
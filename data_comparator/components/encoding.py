@@ -0,0 +1,70 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Compact in-memory encodings for the string columns of a loaded dataframe
+### DEVELOPER NOTES:
+    Low-cardinality string columns become categoricals (one small integer
+    code per row), the rest become Arrow-backed strings instead of Python
+    objects. Columns of mixed types are left as they are.
+"""
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+# encode as categorical when there are at most this many distinct values per row
+MAX_CATEGORY_RATIO = 0.5
+try:
+    # arrow-backed strings that keep NaN as the missing value, like object columns
+    ARROW_STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+except TypeError:
+    # pandas < 2.1
+    ARROW_STRING_DTYPE = "string[pyarrow]"
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def encode_string_column(raw_column):
+    """
+    Categorical version of a low-cardinality string column, arrow-backed
+    strings for the rest. Columns that are not all strings are returned as is
+    """
+    is_object = pd.api.types.is_object_dtype(raw_column.dtype)
+    if not (is_object or pd.api.types.is_string_dtype(raw_column.dtype)):
+        return raw_column
+    if pd.api.types.infer_dtype(raw_column, skipna=True) != "string":
+        return raw_column
+    codes, uniques = pd.factorize(raw_column)
+    if len(uniques) <= MAX_CATEGORY_RATIO * len(codes):
+        encoded = pd.Categorical.from_codes(codes, categories=uniques)
+        return pd.Series(encoded, index=raw_column.index, name=raw_column.name)
+    if is_object:
+        try:
+            return raw_column.astype(ARROW_STRING_DTYPE)
+        except ImportError:
+            LOGGER.debug("pyarrow is not installed, keeping object strings")
+    return raw_column
+
+
+def encode_strings(df, skip_columns=()) -> pd.DataFrame:
+    """Encode the string columns of a dataframe, except the given ones"""
+    for col_name in df.columns:
+        if col_name in skip_columns:
+            continue
+        df[col_name] = encode_string_column(df[col_name])
+    return df
+
+
+def value_counts(raw_column) -> pd.Series:
+    """Frequency of each distinct non-missing value, in order of first appearance"""
+    codes, uniques = pd.factorize(raw_column)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    return pd.Series(counts, index=np.asarray(uniques, dtype=object))
@@ -0,0 +1,241 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Per-phase and per-column instrumentation: wall and CPU time, rows and
+    bytes processed, and peak memory, exportable as JSON or a Chrome trace
+### DEVELOPER NOTES:
+    Phases are 'read', 'type_inference', 'profile', 'check' and 'compare'.
+    Spans nest (type inference runs inside column profiling), so phase totals
+    can overlap. Spans repeated for every chunk of a streamed source are
+    folded into one span per phase and column ('calls' counts them).
+    CPU time is that of the thread running the span, so work fanned out to
+    worker processes only shows up as the wall time of the enclosing span.
+    Peak memory is the process' resident set high-water mark; 'memory_growth'
+    is how much a span raised it. Code without a Dataset at hand (the checks,
+    the comparison) records into the tracer made active with 'activate'.
+"""
+import logging
+import os
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+# ru_maxrss is reported in KB on Linux and in bytes on macOS
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+_ACTIVE_TRACER = ContextVar("active_tracer", default=None)
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def _peak_rss():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT
+
+
+def data_bytes(data):
+    """
+    In-memory bytes of a dataframe, column or arrow table, without walking
+    object columns (their pointers are counted, not the strings)
+    """
+    if data is None:
+        return None
+    if hasattr(data, "nbytes") and not hasattr(data, "memory_usage"):
+        # arrow tables and arrays
+        return int(data.nbytes)
+    usage = data.memory_usage(index=False, deep=False)
+    return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+
+
+class Tracer(object):
+    def __init__(self):
+        self.spans = []
+        # folded spans, by (phase, name, column)
+        self._folded = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _start(self):
+        return _peak_rss(), time.perf_counter(), time.thread_time()
+
+    def _finish(self, started, name, phase, column, counters, fold):
+        peak_before, start, cpu_start = started
+        wall = time.perf_counter() - start
+        cpu = time.thread_time() - cpu_start
+        peak_after = _peak_rss()
+        record = {
+            "name": name,
+            "phase": phase,
+            "column": None if column is None else str(column),
+            "start": start - self._origin,
+            "wall": wall,
+            "cpu": cpu,
+            "rows": counters["rows"],
+            "bytes": counters["bytes"],
+            "peak_memory": peak_after,
+            "memory_growth": None if peak_after is None else peak_after - peak_before,
+            "thread": threading.get_ident(),
+            "calls": 1,
+        }
+        self._add(record, fold)
+
+    @contextmanager
+    def span(self, name: str, phase: str, column=None, fold: bool = False):
+        """
+        Time the enclosed block. Yields a dictionary where 'rows' and 'bytes'
+        processed can be set. With fold=True, repeated spans of the same
+        name and column are summed into one
+        """
+        counters = {"rows": None, "bytes": None}
+        started = self._start()
+        try:
+            yield counters
+        finally:
+            self._finish(started, name, phase, column, counters, fold)
+
+    def trace_chunks(self, chunks, name: str, phase: str = "read"):
+        """Yield from 'chunks', folding the time taken to produce each into one span"""
+        chunks = iter(chunks)
+        while True:
+            started = self._start()
+            chunk = next(chunks, None)
+            if chunk is None:
+                return
+            counters = {"rows": len(chunk), "bytes": data_bytes(chunk)}
+            self._finish(started, name, phase, None, counters, fold=True)
+            yield chunk
+
+    def _add(self, record: dict, fold: bool):
+        with self._lock:
+            key = (record["phase"], record["name"], record["column"])
+            if not fold or key not in self._folded:
+                self.spans.append(record)
+                if fold:
+                    self._folded[key] = record
+                return
+            folded = self._folded[key]
+            for stat_name in ["wall", "cpu", "rows", "bytes", "memory_growth"]:
+                if record[stat_name] is not None:
+                    folded[stat_name] = (folded[stat_name] or 0) + record[stat_name]
+            folded["peak_memory"] = record["peak_memory"]
+            folded["calls"] += 1
+
+    def extend(self, other):
+        """Add the spans of another tracer, e.g. a dataset's to a comparison's"""
+        offset = other._origin - self._origin
+        with self._lock:
+            for record in other.spans:
+                self.spans.append({**record, "start": record["start"] + offset})
+
+    def get_summary(self) -> dict:
+        """Totals per phase, and per phase for each column"""
+        phases = {}
+        columns = {}
+        for record in self.spans:
+            targets = [phases.setdefault(record["phase"], {})]
+            if record["column"] is not None:
+                col_phases = columns.setdefault(record["column"], {})
+                targets.append(col_phases.setdefault(record["phase"], {}))
+            for totals in targets:
+                totals["calls"] = totals.get("calls", 0) + record["calls"]
+                for stat_name in ["wall", "cpu", "rows", "bytes"]:
+                    if record[stat_name] is not None:
+                        totals[stat_name] = totals.get(stat_name, 0) + record[stat_name]
+                if record["peak_memory"] is not None:
+                    totals["peak_memory"] = max(
+                        totals.get("peak_memory", 0), record["peak_memory"]
+                    )
+        return {"phases": phases, "columns": columns}
+
+    def to_json(self, path=None) -> str:
+        """The spans as a JSON list, written to 'path' if given"""
+        content = json.dumps(self.spans, default=str, indent=2)
+        if path is not None:
+            with open(str(path), "w") as trace_file:
+                trace_file.write(content)
+        return content
+
+    def to_chrome_trace(self, path=None) -> dict:
+        """
+        The spans in the Chrome trace event format (chrome://tracing,
+        Perfetto), written to 'path' if given
+        """
+        events = []
+        for record in self.spans:
+            name = record["name"]
+            if record["column"] is not None:
+                name = "{} [{}]".format(name, record["column"])
+            events.append(
+                {
+                    "name": name,
+                    "cat": record["phase"],
+                    "ph": "X",
+                    "ts": record["start"] * 1e6,
+                    "dur": record["wall"] * 1e6,
+                    "pid": os.getpid(),
+                    "tid": record["thread"],
+                    "args": {
+                        key: record[key]
+                        for key in [
+                            "cpu",
+                            "rows",
+                            "bytes",
+                            "peak_memory",
+                            "memory_growth",
+                            "calls",
+                        ]
+                    },
+                }
+            )
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(str(path), "w") as trace_file:
+                json.dump(trace, trace_file, default=str)
+        return trace
+
+
+@contextmanager
+def activate(tracer):
+    """Make the tracer record the spans of module-level 'span' calls"""
+    token = _ACTIVE_TRACER.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _ACTIVE_TRACER.reset(token)
+
+
+@contextmanager
+def span(name: str, phase: str, column=None, fold: bool = False):
+    """Tracer.span on the active tracer; records nothing if there is none"""
+    tracer = _ACTIVE_TRACER.get()
+    if tracer is None:
+        yield {"rows": None, "bytes": None}
+        return
+    with tracer.span(name, phase, column, fold) as counters:
+        yield counters
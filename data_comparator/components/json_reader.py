@@ -0,0 +1,139 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Streaming JSON Lines reader that flattens nested records into dotted
+    columns ({"user": {"id": 1}} becomes a "user.id" column)
+### DEVELOPER NOTES:
+    Lines are parsed in batches of 'chunksize' records, so a file is never
+    held in memory as a whole. The column schema is taken from the first
+    SCHEMA_SAMPLE_SIZE records; keys first seen after that are dropped (and
+    logged) so every batch has the same columns. Lists, and objects nested
+    deeper than 'max_level', are kept as JSON text.
+"""
+import logging
+import os
+import io
+import json
+from itertools import chain, islice
+from pathlib import Path
+
+import pandas as pd
+
+from .partition import infer_format
+from .compression import data_suffix, open_text
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+JSON_LINES_FORMATS = ["jsonl", "ndjson"]
+SCHEMA_SAMPLE_SIZE = 1000
+# parameters handled by this reader; any other read_json parameter falls back to pandas
+JSON_READER_PARAMS = ["lines", "encoding", "nrows", "max_level"]
+
+try:
+    # much faster parsing when it is installed
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def is_json_lines(path) -> bool:
+    """True for .jsonl/.ndjson files, and directories of them"""
+    suffix = data_suffix(path)
+    if Path(path).is_dir():
+        suffix = infer_format(path)
+    return suffix in JSON_LINES_FORMATS
+
+
+def supports_params(load_params: dict) -> bool:
+    return all(key in JSON_READER_PARAMS for key in load_params)
+
+
+def _to_text(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+def flatten_records(records, max_level=None) -> pd.DataFrame:
+    """Flatten a list of (nested) records into a dataframe of dotted columns"""
+    data = pd.json_normalize(records, sep=".", max_level=max_level)
+    for col_name in data.columns:
+        raw_column = data[col_name]
+        if pd.api.types.is_object_dtype(raw_column.dtype):
+            nested = raw_column.map(lambda value: isinstance(value, (list, dict)))
+            if nested.any():
+                # lists and deep objects are unhashable, keep them as text
+                data[col_name] = raw_column.map(_to_text)
+    return data
+
+
+def _open_source(source, encoding=None):
+    """Text file object over a path or an open binary stream"""
+    if hasattr(source, "read"):
+        return io.TextIOWrapper(source, encoding=encoding or "utf-8")
+    return open_text(source, encoding)
+
+
+def _iter_records(source, encoding=None, nrows=None):
+    with _open_source(source, encoding) as json_file:
+        records = (_loads(line) for line in json_file if line.strip())
+        yield from islice(records, nrows)
+
+
+def infer_schema(source, encoding=None, max_level=None) -> list:
+    """Dotted column names of the first SCHEMA_SAMPLE_SIZE records"""
+    sample = list(islice(_iter_records(source, encoding), SCHEMA_SAMPLE_SIZE))
+    return list(flatten_records(sample, max_level).columns)
+
+
+def iter_chunks(source, chunksize, columns=None, **load_params):
+    """
+    Yield a JSON Lines file (a path or binary stream) as flattened dataframes
+    of 'chunksize' records
+    """
+    max_level = load_params.get("max_level")
+    records = _iter_records(
+        source, load_params.get("encoding"), load_params.get("nrows")
+    )
+    # the schema sample is held back and then read as part of the first batches
+    sample = list(islice(records, SCHEMA_SAMPLE_SIZE))
+    schema = list(flatten_records(sample, max_level).columns)
+    records = chain(sample, records)
+    dropped = set()
+    offset = 0
+    while True:
+        batch = list(islice(records, chunksize))
+        if not batch:
+            break
+        chunk = flatten_records(batch, max_level)
+        new_columns = set(chunk.columns) - set(schema) - dropped
+        if new_columns and not columns:
+            LOGGER.info(
+                "Ignoring keys not in the first {} records of {}: {}".format(
+                    SCHEMA_SAMPLE_SIZE, source, sorted(new_columns)
+                )
+            )
+            dropped |= new_columns
+        chunk = chunk.reindex(columns=columns if columns else schema)
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk.index))
+        offset += len(chunk.index)
+        yield chunk
+
+
+def read_json(source, columns=None, **load_params) -> pd.DataFrame:
+    """Read a whole JSON document (an array of records) into dotted columns"""
+    with _open_source(source, load_params.get("encoding")) as json_file:
+        document = json.load(json_file)
+    if not isinstance(document, list):
+        # a column-oriented object, as pandas reads it by default
+        data = pd.DataFrame(document)
+        return data[columns] if columns else data
+    data = flatten_records(document, load_params.get("max_level"))
+    return data.reindex(columns=columns) if columns else data
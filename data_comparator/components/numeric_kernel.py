@@ -0,0 +1,183 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Fused kernel computing every statistic of a numeric column in a single
+    pass, shared by the profile (whole or chunked columns) and the checks
+### DEVELOPER NOTES:
+    The values are scanned in blocks of BLOCK_SIZE, small enough to stay in
+    the CPU cache while the count, missing values, zeros, min, max, sum, M2,
+    M3 and the counts outside the given bounds of the block are all taken;
+    the column is thus read from memory about once. Blocks are combined
+    with the pairwise moment updates of Chan et al. / Pebay, which is also
+    how the moments of chunks and partitions are merged.
+    Integer and float columns are read in place; other dtypes (nullable,
+    arrow-backed) are converted to float64 first.
+"""
+import logging
+import os
+import math
+
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+# 64K float64 values (512 KB) per block fit in the L2 cache
+BLOCK_SIZE = 1 << 16
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+class NumericMoments(object):
+    """
+    Count, missing values, zeros, extremes and central moments of numeric
+    values, plus how many fall outside each of the given (lower, upper)
+    bounds and the row position of the first one. Moments of consecutive
+    blocks or chunks merge
+    """
+
+    def __init__(self, bounds: dict = None):
+        self.rows = 0
+        self.n = 0
+        self.missing = 0
+        self.zeros = 0
+        self.min = np.nan
+        self.max = np.nan
+        self.total = 0.0
+        # running mean, for the moment updates
+        self._mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        # {name: (lower, upper)}; either side may be None
+        self.bounds = dict(bounds or {})
+        self.outside = {name: 0 for name in self.bounds}
+        self.first_outside = {name: None for name in self.bounds}
+
+    def _combine_moments(self, n, mean, m2, m3):
+        if n == 0:
+            return
+        n_a, n_b = self.n, n
+        total = n_a + n_b
+        delta = mean - self._mean
+        self.m3 = (
+            self.m3
+            + m3
+            + delta ** 3 * n_a * n_b * (n_a - n_b) / total ** 2
+            + 3 * delta * (n_a * m2 - n_b * self.m2) / total
+        )
+        self.m2 = self.m2 + m2 + delta ** 2 * n_a * n_b / total
+        self._mean = self._mean + delta * n_b / total
+        self.n = total
+
+    def _combine_extremes(self, col_min, col_max):
+        if pd.isnull(self.min) or (not pd.isnull(col_min) and col_min < self.min):
+            self.min = col_min
+        if pd.isnull(self.max) or (not pd.isnull(col_max) and col_max > self.max):
+            self.max = col_max
+
+    def update(self, block: np.ndarray):
+        """Add the next block of values (missing values as NaN)"""
+        values = block.astype("float64", copy=False)
+        offset = self.rows
+        self.rows += len(block)
+        valid = None
+        if block.dtype.kind == "f":
+            nulls = np.isnan(values)
+            missing = int(np.count_nonzero(nulls))
+            if missing > 0:
+                self.missing += missing
+                valid = ~nulls
+        # NaN is never outside the bounds, so positions are row positions
+        for name, (lower, upper) in self.bounds.items():
+            outside = np.zeros(len(block), dtype=bool)
+            if lower is not None:
+                outside |= block < lower
+            if upper is not None:
+                outside |= block > upper
+            count = int(np.count_nonzero(outside))
+            if count > 0:
+                self.outside[name] += count
+                if self.first_outside[name] is None:
+                    self.first_outside[name] = offset + int(np.argmax(outside))
+        if valid is not None:
+            block, values = block[valid], values[valid]
+        n = len(values)
+        if n == 0:
+            return
+        self._combine_extremes(block.min(), block.max())
+        self.zeros += int(np.count_nonzero(values == 0))
+        block_total = float(values.sum())
+        mean = block_total / n
+        deltas = values - mean
+        squares = deltas * deltas
+        self.total += block_total
+        self._combine_moments(
+            n, mean, float(squares.sum()), float(np.dot(squares, deltas))
+        )
+
+    def merge(self, other):
+        """Add the moments of the rows following these ones"""
+        for name, count in other.outside.items():
+            self.outside[name] += count
+            first = other.first_outside[name]
+            if self.first_outside[name] is None and first is not None:
+                self.first_outside[name] = self.rows + first
+        self.rows += other.rows
+        self.missing += other.missing
+        self.zeros += other.zeros
+        self.total += other.total
+        self._combine_extremes(other.min, other.max)
+        self._combine_moments(other.n, other._mean, other.m2, other.m3)
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.n if self.n > 0 else np.nan
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation"""
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else np.nan
+
+    @property
+    def skew(self) -> float:
+        """Adjusted skewness, as pandas computes it"""
+        n = self.n
+        if n < 3:
+            return np.nan
+        elif self.m2 == 0:
+            return 0.0
+        m2, m3 = self.m2 / n, self.m3 / n
+        return math.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+
+
+def _as_array(raw_column) -> np.ndarray:
+    """The values of a column, in place for numpy integer and float dtypes"""
+    if isinstance(raw_column, np.ndarray):
+        return raw_column
+    dtype = raw_column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "iuf":
+        return raw_column.to_numpy()
+    return raw_column.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def scan_numeric(raw_column, bounds: dict = None) -> NumericMoments:
+    """
+    Every statistic of a numeric column in one blocked pass. 'bounds' maps
+    names to (lower, upper) limits whose outside values are counted
+    """
+    moments = NumericMoments(bounds)
+    values = _as_array(raw_column)
+    for start in range(0, len(values), BLOCK_SIZE):
+        moments.update(values[start : start + BLOCK_SIZE])
+    dtype = raw_column.dtype
+    if not isinstance(dtype, np.dtype) and pd.api.types.is_integer_dtype(dtype):
+        if moments.n > 0:
+            # nullable integers were scanned as floats
+            moments.min, moments.max = int(moments.min), int(moments.max)
+    return moments
@@ -0,0 +1,94 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Helpers for fanning column work out over a process pool
+### DEVELOPER NOTES:
+    Dataframes are handed to the workers as an Arrow IPC file that each worker
+    memory-maps, so column data is never pickled between processes.
+    Pools are never forked: datasets may be loaded on several threads at
+    once, and a forked child can deadlock on a lock (logging, pandas, arrow)
+    that another thread held at fork time. Workers come from a forkserver,
+    or are spawned where there is none.
+"""
+import logging
+import os
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import pyarrow as pa
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+# start methods safe to use from a multithreaded process, by preference
+POOL_START_METHODS = ["forkserver", "spawn"]
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def process_pool(workers) -> ProcessPoolExecutor:
+    """Pool of 'workers' processes that are not forked from this one"""
+    available = multiprocessing.get_all_start_methods()
+    start_method = next(method for method in POOL_START_METHODS if method in available)
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context(start_method)
+    )
+
+
+@contextmanager
+def shared_frame(df):
+    """
+    Write the given dataframe to a temporary Arrow IPC file for the workers.
+    Yields the file path and the names of the columns that could be shared;
+    columns Arrow cannot represent (e.g. mixed object types) are left out
+    """
+    arrays = []
+    names = []
+    for col_name in df.columns:
+        try:
+            arrays.append(pa.array(df[col_name], from_pandas=True))
+            names.append(col_name)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            LOGGER.debug("Column {} cannot be shared with Arrow".format(col_name))
+    table = pa.Table.from_arrays(arrays, names=[str(name) for name in names])
+
+    fd, path = tempfile.mkstemp(suffix=".arrow")
+    os.close(fd)
+    try:
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        del table, arrays
+        yield path, names
+    finally:
+        os.remove(path)
+
+
+def read_shared_column(path, col_name):
+    """Read a single column back from a shared Arrow IPC file as a Series"""
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+        raw_column = table.column(str(col_name)).to_pandas()
+    raw_column.name = col_name
+    return raw_column
+
+
+def map_columns(func, col_names, workers, *args):
+    """
+    Run func(col_name, *args) for every column on a pool of worker processes.
+    Returns a {col_name: result} dictionary
+    """
+    results = {}
+    with process_pool(workers) as executor:
+        futures = {
+            col_name: executor.submit(func, col_name, *args) for col_name in col_names
+        }
+        for col_name, future in futures.items():
+            results[col_name] = future.result()
+    return results
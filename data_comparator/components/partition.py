@@ -0,0 +1,135 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Discovery and pruning of (Hive-style) partitioned dataset directories
+### DEVELOPER NOTES:
+    Partition directories are named key=value (e.g. date=2024-01-01). Filters
+    are applied while walking the tree, so pruned directories are never listed.
+"""
+import logging
+import os
+import operator
+from pathlib import Path
+
+from .compression import data_suffix
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+FILTER_OPERATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda value, options: value in options,
+    "not in": lambda value, options: value not in options,
+}
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def is_data_file(file_name: str) -> bool:
+    """Skip marker and metadata files such as _SUCCESS, .crc and hidden files"""
+    return not (
+        file_name.startswith("_")
+        or file_name.startswith(".")
+        or file_name.endswith(".crc")
+    )
+
+
+def parse_partition(dir_name: str):
+    """Return the (key, value) of a key=value directory name, or None"""
+    if "=" not in dir_name:
+        return None
+    key, value = dir_name.split("=", 1)
+    return key, value
+
+
+def normalize_filters(filters) -> list:
+    """
+    Accept filters as a list of (key, op, value) tuples or as a dictionary
+    of {key: value} (or {key: [values]}) equality filters
+    """
+    if not filters:
+        return []
+    if isinstance(filters, dict):
+        return [
+            (key, "in" if isinstance(value, (list, tuple, set)) else "=", value)
+            for key, value in filters.items()
+        ]
+    normalized = []
+    for key, op, value in filters:
+        if op not in FILTER_OPERATORS:
+            raise ValueError("Partition filter operator {} not supported".format(op))
+        normalized.append((key, op, value))
+    return normalized
+
+
+def _coerce(partition_value: str, filter_value):
+    """Cast a partition value to the type of the value it is compared with"""
+    sample = filter_value
+    if isinstance(filter_value, (list, tuple, set)):
+        sample = next(iter(filter_value), "")
+    try:
+        if isinstance(sample, bool):
+            return partition_value.lower() == "true"
+        elif isinstance(sample, int):
+            return int(partition_value)
+        elif isinstance(sample, float):
+            return float(partition_value)
+    except ValueError:
+        pass
+    return partition_value
+
+
+def matches_filters(key: str, value: str, filters: list) -> bool:
+    for filter_key, op, filter_value in filters:
+        if filter_key != key:
+            continue
+        if not FILTER_OPERATORS[op](_coerce(value, filter_value), filter_value):
+            return False
+    return True
+
+
+def discover_files(root, filters=None) -> list:
+    """
+    Walk a dataset directory and return a list of (file path, partition)
+    pairs, where partition is a dictionary of the key=value directories
+    above the file. Directories failing the filters are pruned unvisited
+    """
+    filters = normalize_filters(filters)
+    files = []
+
+    def walk(directory, partition):
+        entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        for entry in entries:
+            if entry.is_dir():
+                key_value = parse_partition(entry.name)
+                if key_value is None:
+                    walk(entry.path, partition)
+                elif matches_filters(*key_value, filters):
+                    walk(entry.path, {**partition, key_value[0]: key_value[1]})
+                else:
+                    LOGGER.debug("Pruned partition {}".format(entry.path))
+            elif is_data_file(entry.name):
+                files.append((Path(entry.path), partition))
+
+    walk(str(root), {})
+    return files
+
+
+def infer_format(root) -> str:
+    """Format of a dataset directory, taken from its first data file"""
+    for dir_path, dir_names, file_names in os.walk(str(root)):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            if is_data_file(file_name) and Path(file_name).suffix:
+                return data_suffix(file_name)
+    return ""
@@ -0,0 +1,80 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Persistent on-disk cache of dataset profiles (column statistics and
+    check results), so unchanged sources are not re-read
+### DEVELOPER NOTES:
+    Entries are keyed by a fingerprint of the source files (path, size,
+    mtime and a content hash), the load parameters and the validations
+    config. Each entry is a pickle of data-free Columns.
+"""
+import logging
+import os
+import hashlib
+import pickle
+
+from .disk_cache import DiskCache
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+class ProfileCache(DiskCache):
+    entry_suffix = ".pkl"
+    default_subdir = "profiles"
+    # 2: columns carry quantiles
+    # 3: only the profiled columns are stored, with the names of all of them
+    version = 3
+
+    def make_key(self, paths, load_params: dict, config_path=None) -> str:
+        """Cache key of a source, its load parameters and the checks config"""
+        config_hash = None
+        if config_path is not None:
+            with open(config_path, "rb") as config_file:
+                config_hash = hashlib.blake2b(config_file.read(), digest_size=16)
+                config_hash = config_hash.hexdigest()
+        return DiskCache.make_key(
+            self, paths, {"load_params": load_params, "config": config_hash}
+        )
+
+    def get(self, key):
+        """The cached profile for a key, or None"""
+        if not self._touch(key):
+            return None
+        try:
+            with open(self._entry_path(key), "rb") as entry_file:
+                return pickle.load(entry_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            LOGGER.debug("Dropping unreadable cache entry {}: {}".format(key, e))
+            self.invalidate(key=key)
+            return None
+
+    def put(self, key, entry: dict, source: str = ""):
+        """Store a profile and evict the least recently used entries over the cap"""
+        content = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        self._write_atomic(self._entry_path(key), content)
+        self._add_entry(
+            key,
+            len(content),
+            source,
+            columns=len(entry.get("column_names", [])),
+            profiled=len(entry.get("columns", {})),
+            checks=len(entry.get("checks", {})),
+        )
+
+
+def get_profile_cache(cache):
+    """A ProfileCache from the 'cache' load parameter (True, a directory or a cache)"""
+    if cache is None or cache is False:
+        return None
+    elif isinstance(cache, ProfileCache):
+        return cache
+    elif cache is True:
+        return ProfileCache()
+    return ProfileCache(cache)
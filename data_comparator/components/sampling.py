@@ -0,0 +1,202 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Row sampling applied while a source is read, with confidence intervals
+    for the statistics estimated from the sample
+### DEVELOPER NOTES:
+    Every row gets a uniform random key as it streams past. Fraction sampling
+    keeps keys below the fraction; reservoir sampling keeps the 'size'
+    smallest keys seen so far, which is a uniform sample without replacement.
+    Stratified sampling applies the fraction within each stratum and tops
+    small strata up to 'min_rows'; estimates treat the sample as
+    self-weighting, so topped-up strata are slightly over-represented.
+"""
+import logging
+import os
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+SAMPLE_STRATEGIES = ["reservoir", "fraction", "stratified"]
+DEFAULT_CONFIDENCE = 0.95
+# statistics estimated as a share of the rows
+SHARE_ESTIMATES = ["count", "missing", "zeros"]
+# statistics estimated as a mean, with the attribute holding their std
+MEAN_ESTIMATES = {"mean": "std", "text_length_mean": "text_length_std"}
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+class Sampler(object):
+    def __init__(
+        self,
+        strategy: str = "fraction",
+        fraction: float = None,
+        size: int = None,
+        column: str = None,
+        min_rows: int = 1,
+        seed: int = None,
+        confidence: float = DEFAULT_CONFIDENCE,
+    ):
+        if strategy not in SAMPLE_STRATEGIES:
+            raise ValueError("Sample strategy {} not supported".format(strategy))
+        if strategy == "reservoir" and not size:
+            raise ValueError("Reservoir sampling requires a sample size")
+        if strategy in ("fraction", "stratified") and not (
+            fraction and 0 < fraction <= 1
+        ):
+            raise ValueError("Sample fraction must be between 0 and 1")
+        if strategy == "stratified" and column is None:
+            raise ValueError("Stratified sampling requires a column")
+        self.strategy = strategy
+        self.fraction = fraction
+        self.size = size
+        self.column = column
+        self.min_rows = min_rows
+        self.seed = seed
+        self.confidence = confidence
+        self.population_rows = 0
+        self._rng = np.random.default_rng(seed)
+        self._pieces = []
+        # reservoir rows, or the stratum top-up candidates, and their keys
+        self._held = None
+        self._held_keys = np.array([])
+        self._sample = None
+
+    @classmethod
+    def from_option(cls, sample):
+        """
+        Build a sampler from the 'sample' load parameter: a fraction (float),
+        a reservoir size (int) or a dictionary of Sampler arguments
+        """
+        if isinstance(sample, dict):
+            return cls(**sample)
+        elif isinstance(sample, float):
+            return cls("fraction", fraction=sample)
+        elif isinstance(sample, int):
+            return cls("reservoir", size=sample)
+        raise ValueError("Sample option {} not recognized".format(sample))
+
+    def _hold(self, chunk, keys, limit):
+        """Keep the rows with the smallest keys, per stratum when stratified"""
+        held = chunk if self._held is None else pd.concat([self._held, chunk])
+        held_keys = np.concatenate([self._held_keys, keys])
+        if self.strategy == "stratified":
+            order = np.argsort(held_keys, kind="stable")
+            strata = held[self.column].iloc[order]
+            ranks = strata.groupby(strata, dropna=False).cumcount().to_numpy()
+            keep = np.sort(order[ranks < limit])
+        elif len(held_keys) > limit:
+            keep = np.sort(np.argpartition(held_keys, limit)[:limit])
+        else:
+            keep = slice(None)
+        self._held = held.iloc[keep]
+        self._held_keys = held_keys[keep]
+
+    def update(self, chunk: pd.DataFrame):
+        """Sample the rows of the next chunk of the source"""
+        self.population_rows += len(chunk.index)
+        keys = self._rng.random(len(chunk.index))
+        if self.strategy == "reservoir":
+            self._hold(chunk, keys, self.size)
+            return
+        picked = keys < self.fraction
+        self._pieces.append(chunk[picked])
+        if self.strategy == "stratified":
+            # candidates for strata that the fraction leaves (nearly) empty
+            self._hold(chunk[~picked], keys[~picked], self.min_rows)
+
+    def sample_frame(self, df: pd.DataFrame, chunksize: int) -> pd.DataFrame:
+        """Sample a dataframe that is already in memory"""
+        for offset in range(0, len(df.index), chunksize):
+            self.update(df.iloc[offset : offset + chunksize])
+        return self.result()
+
+    def result(self) -> pd.DataFrame:
+        """The sampled rows, in the order they were read"""
+        if self._sample is not None:
+            return self._sample
+        if self.strategy == "reservoir":
+            pieces = [] if self._held is None else [self._held]
+        else:
+            pieces = self._pieces
+        if self.strategy == "stratified" and self._held is not None:
+            picked = pd.concat(pieces) if pieces else self._held.iloc[0:0]
+            picked_counts = picked[self.column].value_counts(dropna=False)
+            strata = self._held[self.column]
+            shortfall = self.min_rows - strata.map(picked_counts).fillna(0)
+            top_up = strata.groupby(strata, dropna=False).cumcount() < shortfall
+            pieces = pieces + [self._held[top_up.to_numpy()]]
+        if not pieces:
+            raise ValueError("No rows were read to sample from")
+        self._sample = pd.concat(pieces).reset_index(drop=True)
+        self._held = None
+        self._pieces = []
+        return self._sample
+
+    def clear(self):
+        """Drop the sampled rows, keeping the population row count"""
+        self._sample = None
+        self._held = None
+        self._pieces = []
+
+    def sample_spark(self, df):
+        """Sample a spark dataframe inside spark (fraction sampling only)"""
+        if self.strategy != "fraction":
+            raise ValueError("Only fraction sampling is supported for spark")
+        self.population_rows = df.count()
+        return df.sample(withReplacement=False, fraction=self.fraction, seed=self.seed)
+
+    def get_summary(self, sample_rows: int) -> dict:
+        return {
+            "strategy": self.strategy,
+            "fraction": self.fraction,
+            "size": self.size,
+            "column": self.column,
+            "population_rows": self.population_rows,
+            "sample_rows": sample_rows,
+            "confidence": self.confidence,
+        }
+
+    def estimate_column(self, col, sample_rows: int) -> dict:
+        """
+        Population estimates of a column's statistics with their confidence
+        intervals, as {stat_name: {"estimate": value, "ci": (lower, upper)}}.
+        Shares of rows are scaled to the population; means are left as is
+        """
+        rows = self.population_rows
+        if sample_rows < 1:
+            return {}
+        z = NormalDist().inv_cdf((1 + self.confidence) / 2)
+        # finite population correction
+        fpc = math.sqrt((rows - sample_rows) / (rows - 1)) if rows > 1 else 0.0
+        estimates = {}
+        for stat_name in SHARE_ESTIMATES:
+            if getattr(col, stat_name, None) is None:
+                continue
+            share = float(getattr(col, stat_name)) / sample_rows
+            margin = z * math.sqrt(share * (1 - share) / sample_rows) * fpc
+            estimates[stat_name] = {
+                "estimate": share * rows,
+                "ci": (max(share - margin, 0) * rows, min(share + margin, 1) * rows),
+            }
+        for stat_name, std_name in MEAN_ESTIMATES.items():
+            mean, std = getattr(col, stat_name, None), getattr(col, std_name, None)
+            if mean is None or std is None or pd.isnull(mean):
+                continue
+            count = max(int(col.count), 1)
+            margin = z * (0.0 if pd.isnull(std) else std) / math.sqrt(count) * fpc
+            estimates[stat_name] = {
+                "estimate": mean,
+                "ci": (mean - margin, mean + margin),
+            }
+        return estimates
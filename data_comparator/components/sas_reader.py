@@ -0,0 +1,173 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Chunked SAS7BDAT reading, decoding row ranges in parallel worker
+    processes when pyreadstat is available
+### DEVELOPER NOTES:
+    pyreadstat can start a read at any row offset (it skips whole pages
+    without decoding them), so each worker decodes its own range of rows and
+    the chunks are yielded back in file order. Without pyreadstat the pandas
+    reader is used, one chunk at a time. Either way, text columns come back
+    as strings: the byte strings of the pandas reader are decoded a column at
+    a time (through Arrow for UTF-8) instead of value by value.
+"""
+import logging
+import os
+import codecs
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .parallel import process_pool
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+# encoding used by the pandas reader when the file does not declare a known one
+DEFAULT_SAS_ENCODING = "latin-1"
+# pandas reader parameters that pyreadstat can honor
+PYREADSTAT_PARAMS = ["format", "encoding"]
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def _import_pyreadstat():
+    try:
+        import pyreadstat
+
+        return pyreadstat
+    except ImportError:
+        return None
+
+
+def _known_encoding(encoding) -> bool:
+    try:
+        codecs.lookup(encoding)
+        return True
+    except (LookupError, TypeError):
+        return False
+
+
+def decode_bytes(raw_column, encoding) -> pd.Series:
+    """Decode a column of byte strings in one pass"""
+    if codecs.lookup(encoding).name == "utf-8":
+        try:
+            decoded = pa.array(raw_column, type=pa.binary(), from_pandas=True).cast(
+                pa.string()
+            )
+            return pd.Series(
+                decoded.to_pandas(), index=raw_column.index, name=raw_column.name
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            LOGGER.debug("{} is not valid UTF-8".format(raw_column.name))
+    return raw_column.str.decode(encoding, errors="replace")
+
+
+def decode_byte_columns(df, encoding) -> pd.DataFrame:
+    """Decode every column of byte strings in the dataframe"""
+    for col_name in df.columns:
+        raw_column = df[col_name]
+        if not pd.api.types.is_object_dtype(raw_column.dtype):
+            continue
+        first = raw_column.first_valid_index()
+        if first is not None and isinstance(raw_column[first], bytes):
+            df[col_name] = decode_bytes(raw_column, encoding)
+    return df
+
+
+def count_rows(path) -> int:
+    """Number of rows in a SAS7BDAT file, read from its header"""
+    pyreadstat = _import_pyreadstat()
+    if pyreadstat is not None:
+        _, meta = pyreadstat.read_sas7bdat(str(path), metadataonly=True)
+        return meta.number_rows
+    with pd.read_sas(str(path), format="sas7bdat", iterator=True) as reader:
+        return reader.row_count
+
+
+def _read_rows(path, offset, rows, columns=None, encoding=None) -> pd.DataFrame:
+    """Decode one range of rows with pyreadstat (runs in a worker process)"""
+    import pyreadstat
+
+    data, _ = pyreadstat.read_sas7bdat(
+        path,
+        row_offset=offset,
+        row_limit=rows,
+        usecols=columns,
+        encoding=encoding,
+        dates_as_pandas_datetime=True,
+    )
+    data.index = pd.RangeIndex(offset, offset + len(data.index))
+    # pyreadstat reads blank text as empty strings, pandas as missing
+    for col_name in data.columns:
+        if pd.api.types.is_object_dtype(data[col_name].dtype):
+            data[col_name] = data[col_name].mask(data[col_name] == "", np.nan)
+    return data
+
+
+def _iter_parallel_chunks(path, chunksize, columns, workers, encoding):
+    """Decode row ranges on a pool of processes, yielding them in file order"""
+    offsets = range(0, count_rows(path), chunksize)
+    with process_pool(workers) as executor:
+        pending = deque()
+        for offset in offsets:
+            pending.append(
+                executor.submit(_read_rows, path, offset, chunksize, columns, encoding)
+            )
+            # only a couple of chunks per worker are held at once
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _iter_pandas_chunks(path, chunksize, columns=None, **load_params):
+    encoding = load_params.pop("encoding", None)
+    load_params.pop("format", None)
+    with pd.read_sas(
+        path, format="sas7bdat", chunksize=chunksize, **load_params
+    ) as reader:
+        if encoding in (None, "infer"):
+            encoding = getattr(reader, "inferred_encoding", None)
+        if not _known_encoding(encoding):
+            encoding = DEFAULT_SAS_ENCODING
+        for chunk in reader:
+            if columns is not None:
+                chunk = chunk[columns]
+            yield decode_byte_columns(chunk, encoding)
+
+
+def iter_chunks(path, chunksize, columns=None, workers=None, **load_params):
+    """
+    Yield a SAS7BDAT file as dataframes of 'chunksize' rows, decoded on
+    'workers' processes when pyreadstat is installed and workers > 1
+    """
+    if isinstance(path, Path):
+        path = str(path)
+    parallel = (
+        # decompressing streams cannot be split between workers
+        isinstance(path, str)
+        and workers is not None
+        and workers > 1
+        and all(key in PYREADSTAT_PARAMS for key in load_params)
+    )
+    if parallel and _import_pyreadstat() is None:
+        LOGGER.info(
+            "pyreadstat is not installed (pip install data-comparator[sas]); "
+            "reading {} with the pandas reader, one chunk at a time".format(path)
+        )
+        parallel = False
+    if not parallel:
+        yield from _iter_pandas_chunks(path, chunksize, columns, **load_params)
+        return
+    encoding = load_params.get("encoding")
+    if encoding == "infer":
+        encoding = None
+    yield from _iter_parallel_chunks(path, chunksize, columns, workers, encoding)
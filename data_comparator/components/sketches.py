@@ -0,0 +1,260 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Mergeable sketches for column statistics that would otherwise need every
+    value in memory at once
+### DEVELOPER NOTES:
+    Distinct counters take 64-bit value hashes (see aggregate._hash_values),
+    so a column gets the same estimate whether it is profiled whole, chunk by
+    chunk or partition by partition. HyperLogLog follows Flajolet et al.
+    (2007) with linear counting for small cardinalities; 64-bit hashes make
+    the large-range correction unnecessary.
+    TDigest is the merging variant of Dunning's t-digest: new values and the
+    current centroids are sorted together and regrouped on the arcsine scale,
+    which keeps the tails (p1, p99) at a finer resolution than the middle.
+"""
+import logging
+import os
+import math
+
+import numpy as np
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+MIN_PRECISION = 4
+MAX_PRECISION = 18
+DEFAULT_PRECISION = 14
+# centroids kept by a t-digest are about half its compression
+DEFAULT_COMPRESSION = 200
+# t-digests keep every value, and so are exact, until they have seen this many
+EXACT_LIMIT = 5000
+# summary name: quantile
+QUANTILES = {
+    "p1": 0.01,
+    "p5": 0.05,
+    "p25": 0.25,
+    "p50": 0.5,
+    "p75": 0.75,
+    "p95": 0.95,
+    "p99": 0.99,
+}
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Bit length of each uint64 value (0 for 0)"""
+    high = (values >> np.uint64(32)).astype("float64")
+    low = (values & np.uint64(0xFFFFFFFF)).astype("float64")
+    # frexp's exponent is the bit length; exact for 32-bit halves
+    return np.where(high > 0, np.frexp(high)[1] + 32, np.frexp(low)[1])
+
+
+def _sorted_unique(hashes: np.ndarray) -> np.ndarray:
+    """
+    Sorted distinct hashes; a radix sort and a neighbour comparison, several
+    times faster than np.unique on large uint64 arrays
+    """
+    hashes = np.sort(hashes, kind="stable")
+    if len(hashes) == 0:
+        return hashes
+    keep = np.empty(len(hashes), dtype=bool)
+    keep[0] = True
+    np.not_equal(hashes[1:], hashes[:-1], out=keep[1:])
+    return hashes[keep]
+
+
+class ExactDistinct(object):
+    """
+    Exact distinct counter over the sorted, distinct hashes seen so far. New
+    hashes are buffered and folded in once they outnumber the sorted ones, so
+    each hash is re-sorted a bounded number of times however many chunks come
+    """
+
+    def __init__(self):
+        self._hashes = np.empty(0, dtype="uint64")
+        self._pending = []
+        self._pending_size = 0
+
+    def _buffer(self, hashes: np.ndarray):
+        if len(hashes) == 0:
+            return
+        self._pending.append(hashes)
+        self._pending_size += len(hashes)
+        if self._pending_size >= len(self._hashes):
+            self._fold()
+
+    def _fold(self):
+        if self._pending:
+            self._hashes = _sorted_unique(
+                np.concatenate([self._hashes] + self._pending)
+            )
+            self._pending = []
+            self._pending_size = 0
+
+    def update(self, hashes: np.ndarray):
+        self._buffer(_sorted_unique(np.asarray(hashes, dtype="uint64")))
+
+    def merge(self, other):
+        for hashes in [other._hashes] + other._pending:
+            self._buffer(hashes)
+        return self
+
+    def estimate(self) -> int:
+        self._fold()
+        return len(self._hashes)
+
+    @property
+    def error(self) -> float:
+        return 0.0
+
+
+class HyperLogLog(object):
+    """
+    Approximate distinct counter using 2**precision one-byte registers,
+    whatever the number of values. Sketches of the same precision merge
+    """
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(
+                "HyperLogLog precision must be between {} and {}".format(
+                    MIN_PRECISION, MAX_PRECISION
+                )
+            )
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype="uint8")
+
+    def update(self, hashes: np.ndarray):
+        if len(hashes) == 0:
+            return
+        hashes = np.asarray(hashes, dtype="uint64")
+        # the first bits pick the register, the rest give the rank
+        index = (hashes >> np.uint64(64 - self.precision)).astype("int64")
+        rest = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+        rank = 64 - self.precision + 1 - _bit_length(rest)
+        np.maximum.at(self.registers, index, rank.astype("uint8"))
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches of different precisions")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.power(2.0, -self.registers.astype("float64")).sum()
+        empty = int((self.registers == 0).sum())
+        if raw <= 2.5 * m and empty > 0:
+            # linear counting is more accurate for small cardinalities
+            return int(round(m * math.log(m / empty)))
+        return int(round(raw))
+
+    @property
+    def error(self) -> float:
+        """Relative standard error of the estimate"""
+        return 1.04 / math.sqrt(len(self.registers))
+
+
+def distinct_counter(precision: int = None):
+    """HyperLogLog sketch of the given precision, or an exact counter for None"""
+    if precision is None:
+        return ExactDistinct()
+    return HyperLogLog(precision)
+
+
+def exact_quantiles(values: np.ndarray, levels) -> np.ndarray:
+    """
+    Quantiles of the non-NaN values, interpolated linearly between ranks as
+    pandas does (NaN when empty)
+    """
+    values = np.asarray(values, dtype="float64")
+    values = np.sort(values[~np.isnan(values)])
+    levels = np.asarray(levels, dtype="float64")
+    if len(values) == 0:
+        return np.full(len(levels), np.nan)
+    return np.interp(levels * (len(values) - 1), np.arange(len(values)), values)
+
+
+class TDigest(object):
+    """
+    Approximate quantiles of a stream of numbers from a bounded number of
+    weighted centroids. Digests merge, whatever the order of the values, and
+    are exact (see exact_quantiles) until they see over EXACT_LIMIT values
+    """
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0, dtype="float64")
+        self.weights = np.empty(0, dtype="float64")
+        self.min = np.nan
+        self.max = np.nan
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def update(self, values: np.ndarray):
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self._add(values, np.ones(len(values)), values.min(), values.max())
+
+    def merge(self, other):
+        if len(other.means) > 0:
+            self._add(other.means, other.weights, other.min, other.max)
+        return self
+
+    def _add(self, means, weights, new_min, new_max):
+        self.min = new_min if np.isnan(self.min) else min(self.min, new_min)
+        self.max = new_max if np.isnan(self.max) else max(self.max, new_max)
+        # new values are buffered next to the centroids, and compressed
+        # with them once there are more than EXACT_LIMIT of them in all
+        self.means = np.concatenate([self.means, means])
+        self.weights = np.concatenate([self.weights, weights])
+        if len(self.means) > EXACT_LIMIT:
+            self.means, self.weights = self._compressed()
+
+    def _compressed(self) -> tuple:
+        """Sorted centroid means and weights, grouped unless still exact"""
+        order = np.argsort(self.means, kind="stable")
+        means, weights = self.means[order], self.weights[order]
+        if self.count <= EXACT_LIMIT:
+            # nothing has been compressed yet: the centroids are the values
+            return means, weights
+        # centroids share a group while the arcsine scale of their centre
+        # quantile stays within one unit
+        centres = (np.cumsum(weights) - weights / 2) / weights.sum()
+        scale = self.compression / (2 * np.pi) * np.arcsin(2 * centres - 1)
+        groups = np.floor(scale - scale[0]).astype("int64")
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(groups)) + 1])
+        group_weights = np.add.reduceat(weights, starts)
+        return np.add.reduceat(means * weights, starts) / group_weights, group_weights
+
+    def quantiles(self, levels) -> np.ndarray:
+        """Estimated values at the given quantile levels (NaN when empty)"""
+        levels = np.asarray(levels, dtype="float64")
+        if len(self.means) == 0:
+            return np.full(len(levels), np.nan)
+        means, weights = self._compressed()
+        last = self.count - 1
+        # row position of each centroid's centre; single values sit at their
+        # own row, so small digests match linear interpolation (pandas' default)
+        centres = np.cumsum(weights) - (weights + 1) / 2
+        positions = np.concatenate([[0], centres, [last]])
+        values = np.concatenate([[self.min], means, [self.max]])
+        return np.interp(levels * last, positions, values)
@@ -0,0 +1,254 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Spark-native column profiling, so Spark dataframes are never collected
+### DEVELOPER NOTES:
+    Every column statistic is computed by a single aggregation over the Spark
+    dataframe; only the resulting one-row summary is brought to the driver.
+    pyspark is imported lazily since it is an optional dependency.
+    Array, map and struct columns are profiled (and checked) as their string
+    form, since Spark's text functions only accept strings and binary.
+"""
+import logging
+import os
+import math
+
+import numpy as np
+import pandas as pd
+
+from .sketches import QUANTILES
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+NUMERIC_TYPES = [
+    "ByteType",
+    "ShortType",
+    "IntegerType",
+    "LongType",
+    "FloatType",
+    "DoubleType",
+    "DecimalType",
+]
+FLOATING_TYPES = ["FloatType", "DoubleType"]
+TEMPORAL_TYPES = ["DateType", "TimestampType", "TimestampNTZType"]
+COMPLEX_TYPES = ["ArrayType", "MapType", "StructType"]
+ROWS_ALIAS = "__rows__"
+# percentile_approx's relative error is about 1 / accuracy (spark's default)
+PERCENTILE_ACCURACY = 10000
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def get_column_kind(data_type) -> str:
+    """Kind of column ('numeric', 'string', 'temporal', 'boolean') for a Spark type"""
+    type_name = data_type.__class__.__name__
+    if type_name == "BooleanType":
+        return "boolean"
+    elif type_name in NUMERIC_TYPES:
+        return "numeric"
+    elif type_name in TEMPORAL_TYPES:
+        return "temporal"
+    return "string"
+
+
+def is_complex_type(data_type) -> bool:
+    return data_type.__class__.__name__ in COMPLEX_TYPES
+
+
+def _column_aggregations(col_name, data_type, kind) -> dict:
+    """Aggregate expressions computing the raw statistics of one column"""
+    from pyspark.sql import functions as F
+
+    col = F.col("`{}`".format(col_name))
+    # SQL text of the column, for the aggregations only available as expressions
+    col_sql = "`{}`".format(col_name)
+    levels = list(QUANTILES.values())
+    if is_complex_type(data_type):
+        col = col.cast("string")
+        col_sql = "cast({} as string)".format(col_sql)
+    elif data_type.__class__.__name__ in FLOATING_TYPES:
+        # pandas counts NaN as missing, spark does not
+        col = F.when(F.isnan(col), F.lit(None)).otherwise(col)
+    aggs = {"count": F.count(col)}
+    if kind == "numeric":
+        col = col.cast("double")
+        aggs.update(
+            {
+                "min": F.min(col),
+                "max": F.max(col),
+                "mean": F.avg(col),
+                "std": F.stddev_samp(col),
+                "zeros": F.sum(F.when(col == 0, 1).otherwise(0)),
+                "skewness": F.skewness(col),
+                "quantiles": F.percentile_approx(col, levels, PERCENTILE_ACCURACY),
+            }
+        )
+    elif kind == "string":
+        lengths = F.length(col)
+        aggs.update(
+            {
+                "text_length_mean": F.avg(lengths),
+                "text_length_std": F.stddev_samp(lengths),
+                # exact median; string lengths only take a few distinct values
+                "text_length_med": F.expr(
+                    "percentile(length({}), 0.5)".format(col_sql)
+                ),
+                "text_length_quantiles": F.expr(
+                    "percentile(length({}), array({}))".format(
+                        col_sql, ", ".join(str(level) for level in levels)
+                    )
+                ),
+                "unique": F.approx_count_distinct(col),
+            }
+        )
+    elif kind == "temporal":
+        aggs.update(
+            {
+                "min": F.min(col),
+                "max": F.max(col),
+                "distinct": F.approx_count_distinct(col),
+                "quantiles": F.percentile_approx(col, levels, PERCENTILE_ACCURACY),
+            }
+        )
+    elif kind == "boolean":
+        aggs.update(
+            {
+                "trues": F.sum(F.when(col, 1).otherwise(0)),
+                "falses": F.sum(F.when(~col, 1).otherwise(0)),
+            }
+        )
+    return aggs
+
+
+def _as_float(value):
+    return np.nan if value is None else float(value)
+
+
+def _as_timestamp(value):
+    return pd.NaT if value is None else pd.Timestamp(value)
+
+
+def _quantiles(values, convert=_as_float) -> dict:
+    """{summary name: value} for the QUANTILES returned by a percentile aggregation"""
+    if values is None:
+        values = [None] * len(QUANTILES)
+    return dict(zip(QUANTILES, (convert(value) for value in values)))
+
+
+def finalize_stats(raw_stats: dict, kind: str, rows: int) -> dict:
+    """Turn the raw aggregated values of a column into its Column statistics"""
+    count = raw_stats["count"]
+    stats = {"count": count, "missing": rows - count}
+    if kind == "numeric":
+        skew = np.nan
+        if count > 2 and not raw_stats["std"]:
+            skew = 0.0
+        elif count > 2:
+            # spark returns the population skewness, pandas the adjusted one
+            skew = math.sqrt(count * (count - 1)) / (count - 2) * raw_stats["skewness"]
+        stats.update(
+            {
+                "min": _as_float(raw_stats["min"]),
+                "max": _as_float(raw_stats["max"]),
+                "std": _as_float(raw_stats["std"]),
+                "mean": _as_float(raw_stats["mean"]),
+                "zeros": raw_stats["zeros"] or 0,
+                "skew": skew,
+                "quantiles": _quantiles(raw_stats.get("quantiles")),
+            }
+        )
+    elif kind == "string":
+        # an estimate can exceed the number of values it was made from
+        unique = min(raw_stats["unique"], count)
+        stats.update(
+            {
+                "text_length_mean": _as_float(raw_stats["text_length_mean"]),
+                "text_length_std": _as_float(raw_stats["text_length_std"]),
+                "text_length_med": _as_float(raw_stats["text_length_med"]),
+                "text_length_quantiles": _quantiles(
+                    raw_stats.get("text_length_quantiles")
+                ),
+                "unique": unique,
+                "duplicates": max(count - unique, 0),
+            }
+        )
+    elif kind == "temporal":
+        col_min, col_max = raw_stats["min"], raw_stats["max"]
+        # mirrors TemporalColumn: rows minus distinct values (missing included)
+        distinct = min(raw_stats["distinct"], count) + (1 if rows > count else 0)
+        stats.update(
+            {
+                "min": pd.NaT if col_min is None else pd.Timestamp(col_min),
+                "max": pd.NaT if col_max is None else pd.Timestamp(col_max),
+                "unique": max(rows - distinct, 0),
+                "quantiles": _quantiles(raw_stats.get("quantiles"), _as_timestamp),
+            }
+        )
+    elif kind == "boolean":
+        counts = {True: raw_stats["trues"] or 0, False: raw_stats["falses"] or 0}
+        values = [value for value, value_count in counts.items() if value_count]
+        stats.update(
+            {
+                "top": max(values, key=counts.get) if values else np.nan,
+                "unique": len(values),
+            }
+        )
+    return stats
+
+
+def profile_frame(df, columns=None) -> dict:
+    """
+    Profile the columns of a Spark dataframe with one aggregation job.
+    Returns a {col_name: (kind, stats)} dictionary
+    """
+    from pyspark.sql import functions as F
+
+    fields = [
+        field for field in df.schema.fields if not columns or field.name in columns
+    ]
+    kinds = {field.name: get_column_kind(field.dataType) for field in fields}
+    aggregations = [F.count(F.lit(1)).alias(ROWS_ALIAS)]
+    aliases = {}
+    for index, field in enumerate(fields):
+        # aliases are positional, column names may contain anything
+        col_aggs = _column_aggregations(field.name, field.dataType, kinds[field.name])
+        for stat_name, expr in col_aggs.items():
+            alias = "c{}_{}".format(index, stat_name)
+            aliases[alias] = (field.name, stat_name)
+            aggregations.append(expr.alias(alias))
+    summary = df.agg(*aggregations).collect()[0].asDict()
+
+    rows = summary[ROWS_ALIAS]
+    raw_stats = {col_name: {} for col_name in kinds}
+    for alias, (col_name, stat_name) in aliases.items():
+        raw_stats[col_name][stat_name] = summary[alias]
+    return {
+        col_name: (kind, finalize_stats(raw_stats[col_name], kind, rows))
+        for col_name, kind in kinds.items()
+    }
+
+
+def iter_column(df, col_name, chunksize):
+    """
+    Stream a single column to the driver as a series of pandas Series,
+    holding at most one chunk in memory
+    """
+    from pyspark.sql import functions as F
+
+    col = F.col("`{}`".format(col_name))
+    if is_complex_type(df.schema[col_name].dataType):
+        # as profiled; rows and lists are not hashable
+        col = col.cast("string")
+    values = []
+    for row in df.select(col).toLocalIterator():
+        values.append(row[0])
+        if len(values) >= chunksize:
+            yield pd.Series(values, name=col_name)
+            values = []
+    if values:
+        yield pd.Series(values, name=col_name)
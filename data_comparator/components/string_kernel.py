@@ -0,0 +1,165 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    String statistics kernel: a single factorization of a text column gives
+    its distinct values with their counts and last rows, the text length
+    distribution, and the pattern flags read by the string checks
+### DEVELOPER NOTES:
+    Only the factorization reads every row; everything else works on the
+    distinct values with vectorized .str operations (pyarrow compute kernels
+    for arrow-backed strings), so its cost follows the number of distinct
+    values. The flags are computed on first use, since only the checks need
+    them, and follow check_string_column: numeric text is what Python's
+    float() accepts, without a letter between two other characters; empty
+    text is blank once spaces are removed. Bytes are decoded as UTF-8 first.
+    Values that are not text (e.g. numbers in an object column) are rare and
+    get their flags one at a time.
+"""
+import logging
+import os
+import re
+import string
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+SPECIAL_CHARS_PATTERN = "[{}]".format(re.escape(string.punctuation))
+# a letter between two characters rules out numeric text
+LETTERS_PATTERN = r".[a-zA-Z]."
+# the text Python's float() accepts (ASCII digits only)
+_DIGITS = r"[0-9](?:_?[0-9])*"
+FLOAT_PATTERN = (
+    r"\s*[+-]?(?:(?:{d}(?:\.(?:{d})?)?|\.{d})(?:[eE][+-]?{d})?"
+    r"|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])\s*"
+).format(d=_DIGITS)
+FLAGS = [
+    "numeric_data",
+    "empty_text",
+    "white_space",
+    "capitalized",
+    "special_char",
+    "non_string",
+]
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def _is_numeric_value(value) -> bool:
+    """check_string_column's numeric test, for a single value"""
+    if re.search(LETTERS_PATTERN, str(value)):
+        return False
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def _distinct_values(uniques) -> pd.Series:
+    values = pd.Series(uniques)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(values.cat.categories.dtype)
+    return values
+
+
+class TextStats(object):
+    """
+    Distinct non-missing values of a column in order of first appearance,
+    with their counts, the position of their last row and their text length
+    """
+
+    def __init__(self, raw_column):
+        codes, uniques = pd.factorize(raw_column)
+        positions = np.flatnonzero(codes >= 0)
+        self.rows = len(codes)
+        self.index = raw_column.index
+        self.values = _distinct_values(uniques)
+        self.counts = np.bincount(codes[positions], minlength=len(self.values))
+        self.last_rows = np.full(len(self.values), -1)
+        np.maximum.at(self.last_rows, codes[positions], positions)
+        try:
+            self.lengths = self.values.str.len().to_numpy(
+                dtype="float64", na_value=np.nan
+            )
+        except AttributeError:
+            # not a text column
+            self.lengths = None
+        self._texts = None
+        self._flags = None
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def missing(self) -> int:
+        return self.rows - self.count
+
+    @property
+    def unique(self) -> int:
+        return len(self.values)
+
+    def length_histogram(self) -> Counter:
+        """
+        {text length: rows} histogram, as aggregate.text_length_histogram.
+        Raises AttributeError for columns that are not text
+        """
+        if self.lengths is None:
+            raise AttributeError("Column values are not text")
+        weights = pd.Series(self.counts).groupby(self.lengths).sum()
+        return Counter({int(k): int(v) for k, v in weights.items() if v > 0})
+
+    @property
+    def texts(self) -> pd.Series:
+        """The values as text, bytes decoded; NaN for values that are not text"""
+        if self._texts is not None:
+            return self._texts
+        if pd.api.types.infer_dtype(self.values, skipna=True) in ("string", "empty"):
+            self._texts = self.values
+            return self._texts
+        is_text = self.values.map(type).isin([str, bytes]).to_numpy()
+        texts = self.values.map(
+            lambda value: value.decode() if type(value) == bytes else value
+        )
+        self._texts = texts.where(is_text).astype(object)
+        return self._texts
+
+    @property
+    def flags(self) -> dict:
+        """{flag name: boolean array over the distinct values}, see FLAGS"""
+        if self._flags is not None:
+            return self._flags
+        texts = self.texts
+        # the distinct values are never missing, so NaN marks what is not text
+        is_text = texts.notna().to_numpy()
+        flags = {
+            name: flag.fillna(False).to_numpy(dtype=bool, copy=True)
+            for name, flag in {
+                "numeric_data": texts.str.fullmatch(FLOAT_PATTERN),
+                "letters": texts.str.contains(LETTERS_PATTERN, regex=True),
+                "empty_text": texts.str.fullmatch(" *"),
+                "white_space": texts.str.contains(" ", regex=False),
+                "capitalized": texts.str.upper() == texts,
+                "special_char": texts.str.contains(SPECIAL_CHARS_PATTERN, regex=True),
+            }.items()
+        }
+        flags["numeric_data"] &= ~flags.pop("letters")
+        flags["non_string"] = ~is_text
+        for position in np.flatnonzero(~is_text):
+            flags["numeric_data"][position] = _is_numeric_value(
+                self.values.iloc[position]
+            )
+        self._flags = flags
+        return flags
+
+    def flag_counts(self) -> dict:
+        """Number of rows with each flag"""
+        return {name: int(self.counts[flag].sum()) for name, flag in self.flags.items()}
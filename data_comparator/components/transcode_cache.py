@@ -0,0 +1,66 @@
+"""
+### CODE OWNERS: Demerrick Moton
+### OBJECTIVE:
+    Columnar (Arrow IPC) copies of slow-to-parse sources such as SAS7BDAT
+    and CSV files, reused while the source is unchanged
+### DEVELOPER NOTES:
+    Copies are written uncompressed so they can be memory-mapped and
+    projected without reading the columns that are not selected.
+"""
+import logging
+import os
+import tempfile
+
+import pyarrow as pa
+
+from .disk_cache import DiskCache
+
+logging.basicConfig(
+    format="%(asctime)s - %(message)s", level=os.environ.get("LOGLEVEL", "INFO")
+)
+LOGGER = logging.getLogger(__name__)
+
+TRANSCODE_FORMATS = ["sas7bdat", "csv", "txt", "json"]
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+class TranscodeCache(DiskCache):
+    entry_suffix = ".arrow"
+    default_subdir = "transcoded"
+
+    def get(self, key):
+        """Path of the columnar copy for a key, or None"""
+        if not self._touch(key):
+            return None
+        return self._entry_path(key)
+
+    def put(self, key, table: pa.Table, source: str = ""):
+        """Write a table as the columnar copy of a source"""
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+        os.close(fd)
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, str(self._entry_path(key)))
+        self._add_entry(
+            key,
+            os.path.getsize(self._entry_path(key)),
+            source,
+            columns=table.num_columns,
+            rows=table.num_rows,
+        )
+        return self._entry_path(key)
+
+
+def get_transcode_cache(transcode):
+    """A TranscodeCache from the 'transcode' load parameter (True, a directory or a cache)"""
+    if transcode is None or transcode is False:
+        return None
+    elif isinstance(transcode, TranscodeCache):
+        return transcode
+    elif transcode is True:
+        return TranscodeCache()
+    return TranscodeCache(transcode)
@@ -8,13 +8,17 @@
 """
 # pylint: disable=no-member
 import logging
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
 import pandas as pd
 
-from .components.dataset import Dataset, Column
+from .components.dataset import Dataset, Column, ColumnSummary, get_source_columns
 from .components.comparison import Comparison
 from .components.data_cupboard import DataCupboard
+from .components.profile_cache import ProfileCache
+from .components.instrumentation import Tracer, activate, span
 
 logging.basicConfig(format="%(asctime)s - %(message)s", level=logging.INFO)
 LOGGER = logging.getLogger(__name__)
@@ -35,6 +39,51 @@ def load_dataset(data_source, data_source_name: str = "", **load_params):
         data_source_name: 
             Custom name for the resulting dataset. Default will 
             be provided if null
+        columns:
+            Subset of columns to read. It is pushed down to the reader
+            (parquet columns, csv/txt usecols) so other columns are never read
+        workers:
+            Number of worker processes used to profile the columns.
+            Columns are profiled lazily, on first access, by default.
+            sas7bdat files are also decoded on these workers when
+            pyreadstat is installed
+        engine:
+            "pandas" (default) or "arrow" to keep the data in a pyarrow
+            Table and profile it with pyarrow.compute kernels. Spark
+            dataframes default to "spark", which profiles them in Spark
+            instead of collecting them with toPandas()
+        partition_filters:
+            Filters for a partitioned (key=value) dataset directory, e.g.
+            [("date", ">=", "2024-01-01")] or {"region": ["east", "west"]}.
+            Pruned partitions are never read
+        read_threads:
+            Number of threads used to read the files of a dataset directory
+        sample:
+            Sample the rows as they are read: a fraction (e.g. 0.01), a
+            reservoir size (e.g. 100000) or a dictionary such as
+            {"strategy": "stratified", "column": "region", "fraction": 0.05}.
+            The dataset summary reports estimates with confidence intervals
+        cache:
+            True (or a cache directory) to keep the column statistics and
+            check results on disk; reloading an unchanged source with the
+            same parameters then skips the read
+        transcode:
+            True (or a cache directory) to keep an Arrow copy of sas7bdat,
+            csv, txt and json sources; later loads of the unchanged source
+            read the copy instead of parsing it again
+        encode_strings:
+            store the string columns of a file as categoricals (few distinct
+            values) or arrow strings; True by default
+        compact:
+            True to read numeric columns into their smallest safe dtypes
+            (int8/16/32, nullable integers, float32), chunk by chunk
+        retain_data:
+            False to profile and check every column at load time and then
+            drop the data, keeping only the summaries and check results
+        approx_distinct:
+            True (or a HyperLogLog precision from 4 to 18, 14 by default)
+            to estimate the distinct counts of string and date columns with
+            a fixed-size sketch instead of an exact hash table
         other input parameters for the given datas source type:
             e.g. usecols=['id', 'username'] for csv data source
     Output:
@@ -61,8 +110,16 @@ def load_dataset(data_source, data_source_name: str = "", **load_params):
     return dataset
 
 
+def _create_dataset(src, src_name, load_params):
+    LOGGER.info("Creating dataset '{}'".format(src_name))
+    return Dataset(data_src=src, name=src_name, **load_params)
+
+
 def load_datasets(
-    *data_sources, data_source_names: list = None, load_params_list: list = None
+    *data_sources,
+    data_source_names: list = None,
+    load_params_list: list = None,
+    load_threads: int = None
 ):
     """
     Load multiple data sources to add to the set of saved datasets
@@ -73,24 +130,27 @@ def load_datasets(
             be provided if null
         load_params_list: list of load parameters for each dataset \
             e.g. [{'cols': ['col1', col2']}, {}]
+        load_threads: Number of sources loaded at once, each on its own \
+            thread. Default is all of them; 1 loads them one after another
     Output:
         Resulting datasets
     """
     assert data_sources, "Valid data source must be provided"
 
     src_names = []
+    tasks = []
+    datasets = DATA_CUPBOARD.read_data("dataset")
     for i, src in enumerate(data_sources):
         src_name = None
-        load_params = None
-        dataset = None
+        load_params = {}
         if data_source_names:
             try:
                 src_name = data_source_names[i]
             except IndexError:
                 print("Number of names must match number of data sources")
         else:
-            datasets = DATA_CUPBOARD.read_data("dataset")
-            dataset_index = len(datasets)
+            # named up front, as if each was saved before the next is named
+            dataset_index = len(datasets) + i
             src_name = "dataset_" + str(dataset_index)
             src_names.append(src_name)
 
@@ -99,15 +159,16 @@ def load_datasets(
                 load_params = load_params_list[i]
             except IndexError:
                 print("Number of load parameters must match number of data sources")
-            dataset = Dataset(data_src=src, name=src_name, **load_params)
-        else:
-            dataset = Dataset(data_src=src, name=src_name)
-
-        LOGGER.info("Creating dataset '{}'".format(src_name))
+        tasks.append((src, src_name, load_params))
 
-        DATA_CUPBOARD.write_data("dataset", src_name, dataset)
+    # readers spend most of their time in I/O and in pandas/arrow code that
+    # releases the GIL, so the sources are loaded on threads
+    with ThreadPoolExecutor(max_workers=load_threads or len(tasks)) as executor:
+        futures = [executor.submit(_create_dataset, *task) for task in tasks]
+        for (_, src_name, _), future in zip(tasks, futures):
+            DATA_CUPBOARD.write_data("dataset", src_name, future.result())
 
-        LOGGER.info("Done loading datasets")
+    LOGGER.info("Done loading datasets")
 
     if not data_source_names:
         data_source_names = src_names
@@ -186,6 +247,33 @@ def remove_dataset(src_name):
     LOGGER.info("Done removing dataset {}".format(src_name))
 
 
+def get_profile_cache_entries(cache_dir: str = None):
+    """
+    Return the entries of the on-disk profile cache
+    Parameters:
+        cache_dir: profile cache directory (default: \
+            ~/.cache/data_comparator/profiles)
+    Output:
+        List of entries (key, source, bytes, created, last_access, ...), \
+            most recently used first
+    """
+    return ProfileCache(cache_dir).entries()
+
+
+def invalidate_profile_cache(data_source=None, cache_dir: str = None):
+    """
+    Remove the cached profiles of a data source, or the whole cache
+    Parameters:
+        data_source: path of the data source (default: all entries)
+        cache_dir: profile cache directory (default: \
+            ~/.cache/data_comparator/profiles)
+    Output:
+        Number of entries removed
+    """
+    LOGGER.info("Invalidating cached profiles...")
+    return ProfileCache(cache_dir).invalidate(source=data_source)
+
+
 def _get_compare_df(
     comp: Comparison, col1_checks: dict, col2_checks: dict, add_diff_col
 ):
@@ -199,6 +287,13 @@ def _get_compare_df(
     Output:
         comparison dataframe
     """
+    with span("compare_columns", "compare", comp.name):
+        return _build_compare_df(comp, col1_checks, col2_checks, add_diff_col)
+
+
+def _build_compare_df(
+    comp: Comparison, col1_checks: dict, col2_checks: dict, add_diff_col
+):
     col1 = comp.col1
     col2 = comp.col2
     col1_values = list(col1.get_summary().values()) + list(col1_checks.values())
@@ -234,6 +329,44 @@ def _get_compare_df(
     return _df
 
 
+def _get_compare_columns(data_source1, data_source2, cols_to_compare):
+    """
+    Work out the columns each data source needs for a comparison
+    Parameters:
+        data_source1: first raw data source
+        data_source2: second raw data source
+        cols_to_compare: list of column name pairs, or None to compare \
+            the columns the two sources have in common
+    Output:
+        column lists for each source (None to read every column)
+    """
+    src_cols1 = get_source_columns(data_source1)
+    src_cols2 = get_source_columns(data_source2)
+
+    if cols_to_compare is None:
+        if src_cols1 is None or src_cols2 is None:
+            return None, None
+        common_cols = [col for col in src_cols1 if col in set(src_cols2)]
+        return common_cols, common_cols
+
+    cols1 = list(dict.fromkeys(pair[0] for pair in cols_to_compare))
+    cols2 = list(dict.fromkeys(pair[1] for pair in cols_to_compare))
+    # leave unknown names out so they are reported once the data is loaded
+    if src_cols1 is not None:
+        cols1 = [col for col in cols1 if col in src_cols1]
+    if src_cols2 is not None:
+        cols2 = [col for col in cols2 if col in src_cols2]
+    return cols1, cols2
+
+
+def _prepare_compare_columns(dataset, col_names, perform_check):
+    """Profile the columns of one side of a comparison, and check them if asked"""
+    col_names = list(dict.fromkeys(col_names))
+    for col_name in col_names:
+        dataset.columns[col_name]
+    return dataset.perform_checks(col_names) if perform_check else {}
+
+
 def compare(
     data_source1,
     data_source2,
@@ -243,6 +376,10 @@ def compare(
     perform_check: bool = False,
     save_comp: bool = True,
     add_diff_col: bool = False,
+    workers: int = None,
+    sample=None,
+    trace: Tracer = None,
+    load_threads: int = None,
 ):
     """
     A function for comparing two raw data sources
@@ -260,22 +397,47 @@ def compare(
             global variable
         add_diff_col: Set as True to add a column showing the \
             different between the two columns
+        workers: Number of worker processes used to profile and check \
+            the columns of each dataset
+        sample: Sample both sources as they are read (see load_dataset)
+        trace: Tracer recording the time, rows and memory of every phase \
+            of the comparison, from reading both sources to building the \
+            comparison dataframes
+        load_threads: Set to 1 to load, profile and check the two sources \
+            one after the other instead of at the same time
     Output:
         Dataframe of compared variables
     """
     _df = None
     assert data_source1 and data_source2, "Two datasets must be provided for comparison"
 
+    compare_by_col = False
+    cols_to_compare = list()
+    if col_pairs:
+        if type(col_pairs) == list and len(col_pairs) > 0:
+            cols_to_compare = col_pairs
+        elif type(col_pairs) == tuple and len(col_pairs) == 2:
+            cols_to_compare = [col_pairs]
+        else:
+            LOGGER.warn("Invalid column pairs entry {}".format(col_pairs))
+
+    # only read the columns the comparison needs
+    cols1, cols2 = _get_compare_columns(
+        data_source1, data_source2, cols_to_compare if col_pairs else None
+    )
+
     # need to first process raw data sources into dataset objects
     ds1, ds2 = load_datasets(
         data_source1,
         data_source2,
         data_source_names=[ds_name1, ds_name2] if (ds_name1 or ds_name2) else None,
-        load_params_list=[{}, {}],
+        load_params_list=[
+            {"columns": cols1, "workers": workers, "sample": sample},
+            {"columns": cols2, "workers": workers, "sample": sample},
+        ],
+        load_threads=load_threads,
     )
 
-    compare_by_col = False
-    cols_to_compare = list()
     if not col_pairs:
         # name the comparison object after the single column
         compare_by_col = True
@@ -287,13 +449,19 @@ def compare(
 
         common_cols = list(set(ds1_cols).intersection(ds2_cols))
         cols_to_compare = [(col, col) for col in common_cols]
-    else:
-        if type(col_pairs) == list and len(col_pairs) > 0:
-            cols_to_compare = col_pairs
-        elif type(col_pairs) == tuple and len(col_pairs) == 2:
-            cols_to_compare = [col_pairs]
-        else:
-            LOGGER.warn("Invalid column pairs entry {}".format(col_pairs))
+
+    # profile (and check) every compared column up front, both sides at once
+    with ThreadPoolExecutor(max_workers=load_threads or 2) as executor:
+        futures = [
+            executor.submit(
+                _prepare_compare_columns,
+                ds,
+                [pair[i] for pair in cols_to_compare if pair[i] in ds.columns],
+                perform_check,
+            )
+            for i, ds in enumerate([ds1, ds2])
+        ]
+        ds1_checks, ds2_checks = [future.result() for future in futures]
 
     for pair in cols_to_compare:
         col_name1 = pair[0]
@@ -312,15 +480,23 @@ def compare(
         col2_checks = {}
 
         if perform_check:
-            col1_checks = col1.perform_check()
-            col2_checks = col2.perform_check()
+            col1_checks = ds1_checks[col_name1]
+            col2_checks = ds2_checks[col_name2]
 
         _comp = Comparison(col1, col2, compare_by_col)
-        _df = _get_compare_df(_comp, col1_checks, col2_checks, add_diff_col)
+        # record the comparison span into the given tracer, if any
+        with activate(trace) if trace is not None else nullcontext():
+            _df = _get_compare_df(_comp, col1_checks, col2_checks, add_diff_col)
 
         if save_comp:
             DATA_CUPBOARD.write_data("comparison", _comp.name, _comp)
 
+    if trace is not None:
+        # the read, profile and check spans were recorded by each dataset
+        trace.extend(ds1.tracer)
+        if ds2 is not ds1:
+            trace.extend(ds2.tracer)
+
     return _df
 
 
@@ -346,8 +522,8 @@ def compare_ds(
     Output:
         Dataframe of compared variables
     """
-    assert isinstance(col1, Column), "Column 1 is not a valid column"
-    assert isinstance(col2, Column), "Column 2 is not a valid column"
+    assert isinstance(col1, (Column, ColumnSummary)), "Column 1 is not a valid column"
+    assert isinstance(col2, (Column, ColumnSummary)), "Column 2 is not a valid column"
 
     col1_checks = {}
     col2_checks = {}
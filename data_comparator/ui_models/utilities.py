@@ -22,11 +22,12 @@ from matplotlib.backends.backend_qt5agg import (
 )
 
 import data_comparator.data_comparator as dc
+from data_comparator.components.partition import infer_format
 
 UI_DIR = Path(__file__).parent.parent / "ui"
 DETAIL_DLG_DIR = str(UI_DIR / "data_detail_dialog.ui")
 INPUT_PARAMS_DLG_DIR = str(UI_DIR / "input_parameters_dialog.ui")
-ACCEPTED_INPUT_FORMATS = ["sas7bdat", "csv", "parquet", "json"]
+ACCEPTED_INPUT_FORMATS = ["sas7bdat", "csv", "parquet", "json", "arrow", "feather"]
 NON_PLOT_ROWS = ["ds_name", "name", "data_type"]
 
 DATASET1 = None
@@ -79,19 +80,28 @@ class FileLoader():
             return
 
         data_path = Path(fname)
-        if (".part-" in fname) or ("._SUCCESS" in fname):
-            data_path = data_path.parent_fileloader
+        if (
+            (".part-" in fname)
+            or ("._SUCCESS" in fname)
+            or ("=" in data_path.parent.name)
+        ):
+            # part of a (partitioned) dataset directory, load the whole dataset
+            data_path = data_path.parent
+            while "=" in data_path.name:
+                data_path = data_path.parent
 
         self._set_input_params()
 
         file_type = data_path.name.split(".")[-1]
+        if file_type not in ACCEPTED_INPUT_FORMATS and data_path.is_dir():
+            file_type = infer_format(data_path)
         ds_postfix = "_ds" + str(self.ds_num)
         dataset_name = data_path.stem + ds_postfix
 
         assert (
             file_type in ACCEPTED_INPUT_FORMATS
         ), "Select file type was {}, but must be in format {}".format(
-            ",".join([" *." + frmt for frmt in ACCEPTED_INPUT_FORMATS])
+            file_type, ",".join([" *." + frmt for frmt in ACCEPTED_INPUT_FORMATS])
         )
         try:
             self.dataset = dc.load_dataset(
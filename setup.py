@@ -17,6 +17,8 @@ setuptools.setup(
         "data_comparator.components": ["validations_config.json"],
         "data_comparator.ui": ["*.ui", "*.html"],
     },
+    # parallel SAS7BDAT decoding; the pandas reader is used without it
+    extras_require={"sas": ["pyreadstat"]},
     entry_points={"console_scripts": ["data_comparator=data_comparator.app:main"],},
     description="Data profiling tool with a focus on dataset comparisons",
     long_description=open("README.md").read(),
@@ -0,0 +1,89 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from data_comparator.components.aggregate import (
+    NumericAggregate,
+    StringAggregate,
+    TemporalAggregate,
+    BooleanAggregate,
+)
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def aggregate_in_chunks(aggregate_type, raw_column, n_chunks):
+    """Update one aggregate per chunk and merge them all together"""
+    aggregates = []
+    for chunk in np.array_split(np.arange(len(raw_column)), n_chunks):
+        aggregate = aggregate_type(raw_column.name)
+        aggregate.update(raw_column.iloc[chunk])
+        aggregates.append(aggregate)
+    merged = aggregates[0]
+    for aggregate in aggregates[1:]:
+        merged.merge(aggregate)
+    return merged.finalize()
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+def test_numeric_aggregate():
+    raw_column = pd.Series(np.random.default_rng(1).gamma(2, size=500), name="n")
+    raw_column[[5, 50]] = np.nan
+    raw_column[[7, 8]] = 0
+    stats = aggregate_in_chunks(NumericAggregate, raw_column, 7)
+
+    assert stats["count"] == raw_column.count()
+    assert stats["missing"] == 2
+    assert stats["zeros"] == 2
+    assert stats["min"] == raw_column.min()
+    assert stats["max"] == raw_column.max()
+    assert stats["mean"] == pytest.approx(raw_column.mean())
+    assert stats["std"] == pytest.approx(raw_column.std())
+    assert stats["skew"] == pytest.approx(raw_column.skew())
+    # small enough for the quantile sketch to be exact
+    assert stats["quantiles"]["p25"] == pytest.approx(raw_column.quantile(0.25))
+    assert stats["quantiles"]["p99"] == pytest.approx(raw_column.quantile(0.99))
+
+
+@pytest.mark.unit
+def test_string_aggregate():
+    raw_column = pd.Series(["a", "bb", "bb", None, "cccc", "a", "dd"], name="s")
+    stats = aggregate_in_chunks(StringAggregate, raw_column, 3)
+
+    lengths = raw_column.str.len()
+    assert stats["unique"] == raw_column.nunique()
+    assert stats["duplicates"] == raw_column.count() - raw_column.nunique()
+    assert stats["text_length_mean"] == pytest.approx(lengths.mean())
+    assert stats["text_length_std"] == pytest.approx(lengths.std())
+    assert stats["text_length_med"] == lengths.median()
+    assert stats["text_length_quantiles"]["p25"] == lengths.quantile(0.25)
+    assert stats["text_length_quantiles"]["p95"] == lengths.quantile(0.95)
+
+
+@pytest.mark.unit
+def test_temporal_aggregate():
+    raw_column = pd.Series(
+        pd.to_datetime(["2020-01-01", "2020-03-01", None, "2020-01-01", "2019-05-05"]),
+        name="t",
+    )
+    stats = aggregate_in_chunks(TemporalAggregate, raw_column, 2)
+
+    assert stats["min"] == raw_column.min()
+    assert stats["max"] == raw_column.max()
+    assert stats["unique"] == len(raw_column) - len(raw_column.drop_duplicates())
+    assert stats["quantiles"]["p50"] == raw_column.quantile(0.5)
+
+
+@pytest.mark.unit
+def test_boolean_aggregate():
+    raw_column = pd.Series([True, True, False, True], name="b")
+    stats = aggregate_in_chunks(BooleanAggregate, raw_column, 2)
+
+    assert stats["top"] == True
+    assert stats["unique"] == 2
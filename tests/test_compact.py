@@ -0,0 +1,105 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from data_comparator.components.dataset import Dataset
+from data_comparator.components.compact import (
+    compact_column,
+    compact_frame,
+    smallest_int_dtype,
+    uncompacted_bytes,
+)
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "lower, upper, nullable, dtype",
+    [
+        (0, 1, False, "int8"),
+        (-129, 1, False, "int16"),
+        (0, 40000, True, "Int32"),
+        (0, 2 ** 40, False, "int64"),
+        (0, 2 ** 64, False, None),
+    ],
+)
+def test_smallest_int_dtype(lower, upper, nullable, dtype):
+    assert smallest_int_dtype(lower, upper, nullable) == dtype
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        ([0, 1, 1, 0], "int8"),
+        ([1.0, np.nan, 300.0], "Int16"),
+        ([0.5, 1.25, np.nan], "float32"),
+        ([0.1, 0.2], "float64"),
+        ([True, False], "bool"),
+        (["a", "b"], "object"),
+    ],
+)
+def test_compact_column(values, dtype):
+    raw_column = pd.Series(values, dtype=object if dtype == "object" else None)
+    compacted = compact_column(raw_column)
+
+    assert str(compacted.dtype) == dtype
+    assert compacted.astype(object).where(compacted.notna(), None).tolist() == [
+        None if pd.isnull(value) else value for value in values
+    ]
+
+
+@pytest.mark.unit
+def test_uncompacted_bytes_counts_original_dtypes():
+    df = pd.DataFrame({"flag": [0, 1] * 50, "name": ["a", "b"] * 50})
+    original = df.memory_usage(deep=True).sum()
+    original_dtypes = {}
+    compacted = compact_frame(df.copy(), original_dtypes)
+
+    assert original_dtypes == {"flag": "int64"}
+    assert compacted.memory_usage(deep=True).sum() < original
+    assert uncompacted_bytes(compacted, original_dtypes) == original
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_compact_load_keeps_profile(tmp_path, file_format):
+    df = pd.DataFrame(
+        {
+            "flag": [0, 1, 1, 0, 1, 0],
+            "count": [1.0, None, 3.0, 250.0, 5.0, 6.0],
+            "half": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0],
+            "price": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+        }
+    )
+    path = tmp_path / "flags.{}".format(file_format)
+    if file_format == "csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_parquet(path)
+    compact = Dataset(path, "flags", compact=True, engine="pandas")
+    plain = Dataset(path, "flags", engine="pandas")
+
+    assert compact.dataframe.dtypes.astype(str).tolist() == [
+        "int8",
+        "Int16",
+        "float32",
+        "float64",
+    ]
+    for col_name in df.columns:
+        assert compact[col_name].get_summary() == plain[col_name].get_summary()
+    assert compact.perform_checks() == plain.perform_checks()
+    summary = compact.get_summary()["compact"]
+    assert summary["dtypes"] == {
+        "flag": "int64 -> int8",
+        "count": "float64 -> Int16",
+        "half": "float64 -> float32",
+    }
+    assert plain.get_summary()["compact"] is None
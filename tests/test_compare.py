@@ -0,0 +1,142 @@
+import pytest
+import logging
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import data_comparator.data_comparator as dc
+from data_comparator.components.dataset import get_source_columns
+from data_comparator.components.disk_cache import DiskCache
+from data_comparator.components.profile_cache import ProfileCache
+
+LOGGER = logging.getLogger(__name__)
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+@pytest.fixture
+def wide_paths(tmp_path):
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame(
+        {"col_{}".format(i): rng.normal(size=50) for i in range(20)},
+    )
+    parquet_path = tmp_path / "wide.parquet"
+    csv_path = tmp_path / "wide.csv"
+    df.to_parquet(parquet_path)
+    df.drop(columns=["col_19"]).to_csv(csv_path, index=False)
+    return parquet_path, csv_path
+
+
+@pytest.fixture(autouse=True)
+def clear_cupboard():
+    yield
+    dc.clear_all()
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+def test_get_source_columns(wide_paths):
+    parquet_path, csv_path = wide_paths
+    assert len(get_source_columns(parquet_path)) == 20
+    assert len(get_source_columns(csv_path)) == 19
+    assert get_source_columns(pd.DataFrame({"a": [1]})) == ["a"]
+
+
+@pytest.mark.unit
+def test_compare_reads_only_paired_columns(wide_paths):
+    parquet_path, csv_path = wide_paths
+    dc.compare(
+        parquet_path,
+        csv_path,
+        col_pairs=[("col_1", "col_2"), ("col_3", "col_3")],
+        ds_name1="wide_parquet",
+        ds_name2="wide_csv",
+    )
+    ds1 = dc.get_dataset("wide_parquet")
+    ds2 = dc.get_dataset("wide_csv")
+    assert list(ds1.dataframe.columns) == ["col_1", "col_3"]
+    assert sorted(ds2.dataframe.columns) == ["col_2", "col_3"]
+
+
+@pytest.mark.unit
+def test_compare_reads_only_common_columns(wide_paths):
+    parquet_path, csv_path = wide_paths
+    dc.compare(parquet_path, csv_path, ds_name1="wide_parquet", ds_name2="wide_csv")
+    ds1 = dc.get_dataset("wide_parquet")
+    assert "col_19" not in ds1.dataframe.columns
+    assert len(ds1.dataframe.columns) == 19
+
+
+@pytest.mark.unit
+def test_compare_unknown_column_still_reported(wide_paths):
+    parquet_path, csv_path = wide_paths
+    with pytest.raises(AssertionError):
+        dc.compare(parquet_path, csv_path, col_pairs=("col_19", "col_19"))
+
+
+@pytest.mark.unit
+def test_load_datasets_loads_sources_concurrently(wide_paths, monkeypatch):
+    # each load waits for the other, so a sequential load would time out
+    barrier = threading.Barrier(2, timeout=10)
+    dataset_type = dc.Dataset
+
+    def create_dataset(data_src, name, **load_params):
+        barrier.wait()
+        return dataset_type(data_src, name, **load_params)
+
+    monkeypatch.setattr(dc, "Dataset", create_dataset)
+    ds1, ds2 = dc.load_datasets(*wide_paths)
+    assert ds1.name == "dataset_0" and ds2.name == "dataset_1"
+    assert len(ds1.columns) == 20
+    assert len(ds2.columns) == 19
+
+
+@pytest.mark.unit
+def test_concurrent_loads_share_a_cache(tmp_path, monkeypatch):
+    paths = []
+    for i in range(4):
+        path = tmp_path / "part_{}.csv".format(i)
+        pd.DataFrame({"value": np.arange(10) + i}).to_csv(path, index=False)
+        paths.append(path)
+    read_index = DiskCache._read_index
+
+    def slow_read_index(cache):
+        # every load reads the index before any of them writes it back
+        index = read_index(cache)
+        time.sleep(0.05)
+        return index
+
+    monkeypatch.setattr(DiskCache, "_read_index", slow_read_index)
+    cache_dir = tmp_path / "cache"
+    dc.load_datasets(*paths, load_params_list=[{"cache": cache_dir}] * 4)
+
+    cache = ProfileCache(cache_dir)
+    entry_files = list(cache_dir.glob("*" + ProfileCache.entry_suffix))
+    assert len(cache.entries()) == 4
+    assert len(entry_files) == 4
+
+
+@pytest.mark.unit
+def test_concurrent_loads_with_worker_processes(wide_paths):
+    parallel = dc.load_datasets(*wide_paths, load_params_list=[{"workers": 2}] * 2)
+    serial = dc.load_datasets(*wide_paths, load_threads=1)
+
+    for parallel_ds, serial_ds in zip(parallel, serial):
+        assert parallel_ds.perform_checks() == serial_ds.perform_checks()
+
+
+@pytest.mark.unit
+def test_compare_sequential_load_matches_concurrent(wide_paths):
+    parquet_path, csv_path = wide_paths
+    names = {"ds_name1": "wide_parquet", "ds_name2": "wide_csv"}
+    concurrent_df = dc.compare(parquet_path, csv_path, perform_check=True, **names)
+    sequential_df = dc.compare(
+        parquet_path, csv_path, perform_check=True, load_threads=1, **names
+    )
+    assert concurrent_df.equals(sequential_df)
@@ -0,0 +1,102 @@
+import pytest
+
+import bz2
+import gzip
+import lzma
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from data_comparator.components.dataset import Dataset
+from data_comparator.components import compression
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def _write_compressed(path, content: bytes):
+    codec = compression.get_compression(path)
+    if codec == "gzip":
+        path.write_bytes(gzip.compress(content))
+    elif codec == "bz2":
+        path.write_bytes(bz2.compress(content))
+    elif codec == "xz":
+        path.write_bytes(lzma.compress(content))
+    elif codec == "zip":
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr(path.stem, content)
+    else:
+        with pa.CompressedOutputStream(str(path), codec) as stream:
+            stream.write(content)
+
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {"price": rng.normal(size=500), "region": rng.choice(["north", "south"], 500)}
+    )
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "file_name, data_format, codec",
+    [
+        ("a.csv.gz", "csv", "gzip"),
+        ("a.json.zst", "json", "zstd"),
+        ("a.txt.bz2", "txt", "bz2"),
+        ("a.csv", "csv", None),
+    ],
+)
+def test_data_suffix_and_compression(file_name, data_format, codec):
+    assert compression.data_suffix(file_name) == data_format
+    assert compression.get_compression(file_name) == codec
+
+
+@pytest.mark.unit
+def test_columnar_formats_cannot_be_compressed():
+    with pytest.raises(ValueError):
+        compression.data_suffix("a.parquet.gz")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("suffix", ["gz", "bz2", "zst", "xz", "zip"])
+def test_estimate_size(tmp_path, suffix):
+    content = b"".join(b"%d,row\n" % i for i in range(400000))
+    path = tmp_path / "rows.csv.{}".format(suffix)
+    _write_compressed(path, content)
+
+    estimate = compression.estimate_size(path)
+    assert estimate == pytest.approx(len(content), rel=0.25)
+    with compression.open_stream(path) as stream:
+        assert stream.read() == content
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("suffix", ["gz", "zst", "xz"])
+@pytest.mark.parametrize("load_params", [{}, {"chunksize": 100}, {"engine": "arrow"}])
+def test_load_compressed_csv(tmp_path, sample_df, suffix, load_params):
+    path = tmp_path / "sample.csv.{}".format(suffix)
+    _write_compressed(path, sample_df.to_csv(index=False).encode())
+    ds = Dataset(path, "sample", **load_params)
+
+    assert ds.input_format == "csv"
+    assert ds["price"].count == 500
+    assert ds["price"].mean == pytest.approx(sample_df["price"].mean())
+    assert ds["region"].unique == 2
+    assert "region" in ds.perform_checks()
+
+
+@pytest.mark.unit
+def test_load_compressed_json_lines(tmp_path, sample_df):
+    path = tmp_path / "sample.jsonl.gz"
+    _write_compressed(path, sample_df.to_json(orient="records", lines=True).encode())
+    ds = Dataset(path, "sample", chunksize=100)
+
+    assert ds["price"].mean == pytest.approx(sample_df["price"].mean())
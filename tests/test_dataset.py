@@ -0,0 +1,283 @@
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from data_comparator.components import dataset
+from data_comparator.components.parallel import process_pool
+from data_comparator.components.dataset import Dataset, ColumnSummary
+
+LOGGER = logging.getLogger(__name__)
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    n_rows = 1000
+    df = pd.DataFrame(
+        {
+            "price": rng.normal(size=n_rows),
+            "flag": rng.integers(0, 5, n_rows),
+            "region": rng.choice(["north", "south", "east", None], n_rows),
+            "active": rng.choice([True, False], n_rows),
+        }
+    )
+    df.loc[3, "price"] = np.nan
+    return df
+
+
+@pytest.fixture
+def sample_paths(sample_df, tmp_path):
+    csv_path = tmp_path / "sample.csv"
+    parquet_path = tmp_path / "sample.parquet"
+    sample_df.to_csv(csv_path, index=False)
+    sample_df.to_parquet(parquet_path)
+    return {"csv": csv_path, "parquet": parquet_path}
+
+
+def assert_summaries_match(col1, col2):
+    summary1 = col1.get_summary()
+    summary2 = col2.get_summary()
+    assert summary1.keys() == summary2.keys()
+    for key, value in summary1.items():
+        if key == "ds_name":
+            continue
+        if isinstance(value, float):
+            assert value == pytest.approx(summary2[key], nan_ok=True), key
+        else:
+            assert value == summary2[key], key
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("input_format", ["csv", "parquet"])
+def test_streaming_matches_eager(sample_paths, input_format):
+    path = sample_paths[input_format]
+    eager_ds = Dataset(path, "eager")
+    streamed_ds = Dataset(path, "streamed", streaming=True, chunksize=97)
+
+    assert streamed_ds.dataframe is None
+    assert list(streamed_ds.columns) == list(eager_ds.columns)
+    for col_name in eager_ds.columns:
+        assert_summaries_match(eager_ds[col_name], streamed_ds[col_name])
+
+
+@pytest.mark.unit
+def test_chunksize_implies_streaming(sample_paths):
+    ds = Dataset(sample_paths["csv"], "chunked", chunksize=250)
+    assert ds.streaming
+    assert ds["price"].data is None
+
+
+@pytest.mark.unit
+def test_reader_errors_are_raised(sample_paths):
+    # not taken for a dataframe source that failed to load
+    with pytest.raises(TypeError, match="sample_seed"):
+        Dataset(sample_paths["csv"], "bad_param", sample_seed=1)
+    with pytest.raises(TypeError, match="not supported"):
+        Dataset([1, 2, 3], "bad_source")
+    assert Dataset(str(sample_paths["csv"]), "text_path")["price"].count == 999
+
+
+@pytest.mark.unit
+def test_streamed_numeric_check(sample_paths):
+    eager_ds = Dataset(sample_paths["csv"], "eager")
+    streamed_ds = Dataset(sample_paths["csv"], "streamed", chunksize=97)
+    assert eager_ds["price"].perform_check() == streamed_ds["price"].perform_check()
+
+
+@pytest.mark.unit
+def test_columns_profiled_lazily(sample_df):
+    ds = Dataset(sample_df, "lazy")
+
+    assert list(ds.columns) == list(sample_df.columns)
+    assert "price" in ds.columns
+    assert not any(ds.columns.is_profiled(col_name) for col_name in ds.columns)
+
+    price = ds["price"]
+    assert ds.columns.is_profiled("price")
+    assert not ds.columns.is_profiled("flag")
+    assert ds["price"] is price
+    assert price.get_summary()["mean"] == pytest.approx(sample_df["price"].mean())
+
+
+@pytest.mark.unit
+def test_get_cols_oftype_uses_dtype_hints(sample_df):
+    ds = Dataset(sample_df, "lazy")
+
+    numeric_cols = ds.get_cols_oftype("numeric")
+    assert sorted(numeric_cols) == ["flag", "price"]
+    assert not ds.columns.is_profiled("region")
+    assert not ds.columns.is_profiled("active")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("input_format", ["csv", "parquet"])
+@pytest.mark.parametrize("streaming", [False, True])
+def test_column_projection(sample_paths, input_format, streaming):
+    ds = Dataset(
+        sample_paths[input_format],
+        "projected",
+        streaming=streaming,
+        columns=["region", "price"],
+    )
+    assert sorted(ds.columns) == ["price", "region"]
+    if not streaming:
+        assert sorted(ds.dataframe.columns) == ["price", "region"]
+
+
+@pytest.mark.unit
+def test_parallel_profiling_matches_serial(sample_df):
+    serial_ds = Dataset(sample_df, "serial")
+    parallel_ds = Dataset(sample_df, "parallel", workers=2)
+
+    assert all(parallel_ds.columns.is_profiled(col) for col in parallel_ds.columns)
+    for col_name in serial_ds.columns:
+        assert_summaries_match(serial_ds[col_name], parallel_ds[col_name])
+        assert parallel_ds[col_name].data is not None
+
+
+@pytest.mark.unit
+def test_parallel_checks_match_serial(sample_df):
+    serial_ds = Dataset(sample_df, "serial")
+    parallel_ds = Dataset(sample_df, "parallel", workers=2)
+
+    col_names = ["price", "flag", "active"]
+    assert parallel_ds.perform_checks(col_names) == serial_ds.perform_checks(col_names)
+
+
+@pytest.mark.unit
+def test_worker_processes_are_not_forked():
+    # forking while other threads load datasets can deadlock the child
+    with process_pool(1) as executor:
+        assert executor._mp_context.get_start_method() != "fork"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("input_format", ["csv", "parquet"])
+def test_arrow_engine_matches_pandas(sample_paths, input_format):
+    path = sample_paths[input_format]
+    pandas_ds = Dataset(path, "pandas")
+    arrow_ds = Dataset(path, "arrow", engine="arrow")
+
+    assert arrow_ds.dataframe is None
+    assert arrow_ds.table.num_rows == len(pandas_ds.dataframe.index)
+    for col_name in pandas_ds.columns:
+        assert_summaries_match(pandas_ds[col_name], arrow_ds[col_name])
+    assert arrow_ds["price"].perform_check() == pandas_ds["price"].perform_check()
+
+
+@pytest.mark.unit
+def test_arrow_engine_detects_dates(tmp_path):
+    path = tmp_path / "dates.csv"
+    pd.DataFrame({"day": ["2021-01-01", "2021-06-30", None]}).to_csv(path, index=False)
+    ds = Dataset(path, "dates", engine="arrow")
+
+    assert ds["day"].data_type == "TemporalColumn"
+    assert ds["day"].min == pd.Timestamp("2021-01-01")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4"])
+def test_memory_mapped_feather(sample_df, tmp_path, compression):
+    from pyarrow import feather
+
+    path = tmp_path / "sample.feather"
+    feather.write_feather(sample_df, str(path), compression=compression)
+    pandas_ds = Dataset(sample_df, "pandas")
+    mapped_ds = Dataset(path, "mapped")
+
+    assert mapped_ds.engine == "arrow"
+    summary = mapped_ds.get_summary()
+    if compression == "uncompressed":
+        assert mapped_ds.mapped_bytes > 0
+        assert summary["resident_size"] == mapped_ds._format_size(0)
+    else:
+        # compressed buffers have to be decompressed onto the heap
+        assert mapped_ds.mapped_bytes == 0
+    for col_name in pandas_ds.columns:
+        assert_summaries_match(pandas_ds[col_name], mapped_ds[col_name])
+
+
+@pytest.mark.unit
+def test_size_limit_applies_to_feather_read_into_pandas(
+    sample_df, tmp_path, monkeypatch
+):
+    from pyarrow import feather
+
+    path = tmp_path / "sample.feather"
+    feather.write_feather(sample_df, str(path), compression="uncompressed")
+    monkeypatch.setattr(dataset, "MAX_FILE_SIZE", 1000)
+
+    # mapped, so the limit does not apply
+    assert Dataset(path, "mapped")["price"].count == 999
+    with pytest.raises(ValueError, match="too large"):
+        Dataset(path, "copied", engine="pandas")
+
+
+@pytest.fixture
+def partitioned_path(sample_df, tmp_path):
+    root = tmp_path / "partitioned"
+    for flag, part_df in sample_df.groupby("flag"):
+        part_dir = root / "flag={}".format(flag)
+        part_dir.mkdir(parents=True)
+        part_df.drop(columns="flag").to_parquet(part_dir / "part-0.parquet")
+    (root / "_SUCCESS").touch()
+    return root
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "load_params",
+    [{}, {"engine": "arrow"}, {"chunksize": 50}],
+    ids=["pandas", "arrow", "streaming"],
+)
+def test_partitioned_directory(sample_df, partitioned_path, load_params):
+    ds = Dataset(partitioned_path, "partitioned", read_threads=2, **load_params)
+    full_ds = Dataset(sample_df, "full")
+
+    assert ds.input_format == "parquet"
+    assert len(ds.partition_files) == sample_df["flag"].nunique()
+    assert sorted(ds.columns) == sorted(full_ds.columns)
+    # partition keys are read as strings
+    assert ds["flag"].data_type == "StringColumn"
+    assert ds["flag"].unique == sample_df["flag"].nunique()
+    for col_name in ["price", "region", "active"]:
+        assert_summaries_match(full_ds[col_name], ds[col_name])
+
+
+@pytest.mark.unit
+def test_partition_filters_prune_directories(sample_df, partitioned_path):
+    ds = Dataset(partitioned_path, "pruned", partition_filters=[("flag", ">=", 3)])
+
+    assert [partition for _, partition in ds.partition_files] == [
+        {"flag": "3"},
+        {"flag": "4"},
+    ]
+    assert ds["price"].count == sample_df.loc[sample_df["flag"] >= 3, "price"].count()
+    with pytest.raises(ValueError):
+        Dataset(partitioned_path, "empty", partition_filters={"flag": "9"})
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("load_params", [{}, {"engine": "arrow"}, {"streaming": True}])
+def test_summary_only_dataset_drops_data(sample_paths, load_params):
+    full_ds = Dataset(sample_paths["parquet"], "full", **load_params)
+    ds = Dataset(sample_paths["parquet"], "summary", retain_data=False, **load_params)
+
+    assert ds.dataframe is None and ds.table is None
+    assert ds.get_summary()["resident_size"] == "0.0 Byte"
+    for col_name in full_ds.columns:
+        col = ds.columns[col_name]
+        assert isinstance(col, ColumnSummary)
+        assert not hasattr(col, "__dict__")
+        assert_summaries_match(full_ds.columns[col_name], col)
+        assert col.perform_check() == full_ds.columns[col_name].perform_check()
+    assert list(ds.get_cols_oftype("numeric")) == ["price", "flag"]
@@ -0,0 +1,63 @@
+import pytest
+
+import pandas as pd
+
+from data_comparator.components.dataset import Dataset
+from data_comparator.components.dates import (
+    OBJECT_DATES,
+    date_mask,
+    infer_date_format,
+)
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values, date_format",
+    [
+        (["2021-01-01", None, "2021-12-31"], "%Y-%m-%d"),
+        (["2021-01-01 10:30:00", "2021-02-01 00:00:00"], "%Y-%m-%d %H:%M:%S"),
+        (["01JAN2021", "05FEB2020"], "%d%b%Y"),
+        (["12/31/2021", "01/02/2021"], "%m/%d/%Y"),
+        ([pd.Timestamp("2021-01-01").date(), None], OBJECT_DATES),
+        (["north", "south"], None),
+        (["20210101", "20211231"], None),
+        ([None, None], None),
+    ],
+)
+def test_infer_date_format(values, date_format):
+    assert infer_date_format(pd.Series(values, dtype=object)) == date_format
+
+
+@pytest.mark.unit
+def test_date_mask_flags_date_strings():
+    values = pd.Series(["2021-01-03", "north", None, "03/01/2021", 5], dtype=object)
+
+    assert date_mask(values).tolist() == [True, False, False, True, False]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("load_params", [{}, {"chunksize": 2}])
+def test_date_format_is_cached_per_column(tmp_path, load_params):
+    path = tmp_path / "dates.csv"
+    pd.DataFrame(
+        {
+            "day": ["2021-01-01", "2021-06-30", None, "2021-03-01", "2021-04-01"],
+            "mixed": ["2021-01-01", "2021-06-30", "2021-01-02", "soon", "later"],
+        }
+    ).to_csv(path, index=False)
+    ds = Dataset(path, "dates", **load_params)
+
+    assert ds["day"].data_type == "TemporalColumn"
+    assert ds["day"].min == pd.Timestamp("2021-01-01")
+    assert ds["day"].max == pd.Timestamp("2021-06-30")
+    assert ds.date_formats["day"] == "%Y-%m-%d"
+    if not load_params:
+        # values outside the inferred format keep the column a string
+        assert ds["mixed"].data_type == "StringColumn"
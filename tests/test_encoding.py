@@ -0,0 +1,74 @@
+import pytest
+
+import pandas as pd
+
+from data_comparator.components.dataset import Dataset, StringColumn
+from data_comparator.components.encoding import encode_string_column, value_counts
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+def test_encode_string_column_picks_encoding_by_cardinality():
+    repeated = pd.Series(["a", "b", None, "a", "b", "a"], dtype=object, name="x")
+    distinct = pd.Series(["a", "b", "c", None], dtype=object, name="y")
+    mixed = pd.Series(["a", 1, "a", "a"], dtype=object, name="z")
+
+    encoded = encode_string_column(repeated)
+    assert isinstance(encoded.dtype, pd.CategoricalDtype)
+    assert encoded.cat.categories.tolist() == ["a", "b"]
+    assert encoded.cat.codes.tolist() == [0, 1, -1, 0, 1, 0]
+    assert pd.api.types.is_string_dtype(encode_string_column(distinct).dtype)
+    assert encode_string_column(mixed) is mixed
+
+
+@pytest.mark.unit
+def test_value_counts_in_order_of_appearance():
+    counts = value_counts(pd.Series(["b", "a", None, "b", "b"], dtype=object))
+
+    assert counts.index.tolist() == ["b", "a"]
+    assert counts.tolist() == [3, 1]
+
+
+@pytest.mark.unit
+def test_string_stats_match_rows_when_encoded():
+    values = ["north", "south", None, "north", "up", "north", "south"]
+    raw = pd.Series(values, dtype=object, name="dir")
+    plain = StringColumn(raw, "ds")
+    encoded = StringColumn(encode_string_column(raw), "ds")
+
+    for col in (plain, encoded):
+        lengths = raw.str.len()
+        assert col.text_length_mean == pytest.approx(lengths.mean())
+        assert col.text_length_std == pytest.approx(lengths.std())
+        assert col.text_length_med == lengths.median()
+        assert col.unique == 3
+        assert col.duplicates == 3
+
+
+@pytest.mark.unit
+def test_encoded_load_keeps_profile_and_checks(tmp_path):
+    path = tmp_path / "codes.csv"
+    pd.DataFrame(
+        {
+            "code": ["AA", "b b", "12", "AA", "12", "b b", "AA", "12"],
+            "day": ["2021-01-0{}".format(i) for i in range(1, 9)],
+        }
+    ).to_csv(path, index=False)
+    encoded = Dataset(path, "codes")
+    plain = Dataset(path, "codes", encode_strings=False)
+
+    assert isinstance(encoded.dataframe["code"].dtype, pd.CategoricalDtype)
+    assert encoded["day"].data_type == "TemporalColumn"
+    for col_name in ["code", "day"]:
+        assert encoded[col_name].get_summary() == plain[col_name].get_summary()
+    checks = encoded.perform_checks()
+    assert checks == plain.perform_checks()
+    # the last numeric row is reported, as for a row-by-row check
+    assert checks["code"]["numeric_data"] == "12"
+    assert checks["code"]["capitalized"] == "AA"
@@ -0,0 +1,120 @@
+import pytest
+import json
+
+import numpy as np
+import pandas as pd
+
+import data_comparator.data_comparator as dc
+from data_comparator.components.dataset import Dataset
+from data_comparator.components.instrumentation import Tracer, activate, span
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+@pytest.fixture
+def sample_path(tmp_path):
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame(
+        {
+            "price": rng.normal(size=500),
+            "region": rng.choice(["north", "south"], 500),
+            "opened": ["2021-01-{:02d}".format(day % 28 + 1) for day in range(500)],
+        }
+    )
+    path = tmp_path / "sample.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def clear_cupboard():
+    yield
+    dc.clear_all()
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+def test_span_records_counters():
+    tracer = Tracer()
+    with tracer.span("load", "read", "price") as counters:
+        counters["rows"] = 10
+        counters["bytes"] = 80
+    (record,) = tracer.spans
+
+    assert record["phase"] == "read"
+    assert record["column"] == "price"
+    assert record["rows"] == 10
+    assert record["bytes"] == 80
+    assert record["wall"] >= 0
+    assert record["cpu"] >= 0
+
+
+@pytest.mark.unit
+def test_folded_spans_are_summed():
+    tracer = Tracer()
+    for _ in range(3):
+        with tracer.span("chunk", "read", fold=True) as counters:
+            counters["rows"] = 5
+
+    assert len(tracer.spans) == 1
+    assert tracer.spans[0]["calls"] == 3
+    assert tracer.spans[0]["rows"] == 15
+
+
+@pytest.mark.unit
+def test_module_span_without_active_tracer_records_nothing():
+    tracer = Tracer()
+    with span("compare_columns", "compare"):
+        pass
+    with activate(tracer):
+        with span("compare_columns", "compare"):
+            pass
+
+    assert len(tracer.spans) == 1
+
+
+@pytest.mark.unit
+def test_dataset_summary_has_phases(sample_path):
+    ds = Dataset(sample_path, "ds")
+    ds.profile_columns()
+    ds.perform_checks()
+    trace = ds.get_summary()["trace"]
+
+    assert {"read", "type_inference", "profile", "check"} <= set(trace["phases"])
+    assert trace["phases"]["read"]["rows"] == 500
+    assert set(trace["columns"]) == {"price", "region", "opened"}
+    assert "check" in trace["columns"]["price"]
+
+
+@pytest.mark.unit
+def test_streamed_chunks_are_folded(sample_path):
+    ds = Dataset(sample_path, "ds", chunksize=100)
+    read_chunk = [
+        record for record in ds.tracer.spans if record["name"] == "read_chunk"
+    ]
+
+    assert len(read_chunk) == 1
+    assert read_chunk[0]["rows"] == 500
+    assert ds.get_summary()["trace"]["columns"]["price"]["profile"]["calls"] == 5
+
+
+@pytest.mark.unit
+def test_compare_trace_exports(sample_path, tmp_path):
+    tracer = Tracer()
+    dc.compare(sample_path, sample_path, perform_check=True, trace=tracer)
+    phases = tracer.get_summary()["phases"]
+
+    assert {"read", "profile", "check", "compare"} <= set(phases)
+    assert phases["compare"]["calls"] == 3
+    assert len(json.loads(tracer.to_json())) == len(tracer.spans)
+
+    chrome_path = tmp_path / "trace.json"
+    tracer.to_chrome_trace(chrome_path)
+    with open(chrome_path) as trace_file:
+        events = json.load(trace_file)["traceEvents"]
+    assert len(events) == len(tracer.spans)
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
@@ -0,0 +1,99 @@
+import pytest
+
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from data_comparator.components.dataset import Dataset, get_source_columns
+from data_comparator.components import json_reader
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+@pytest.fixture
+def events_path(tmp_path):
+    path = tmp_path / "events.jsonl"
+    with open(path, "w") as events_file:
+        for i in range(10):
+            record = {
+                "id": i,
+                "user": {"name": ["ann", "bob"][i % 2], "geo": {"lat": i / 2}},
+                "tags": ["a", "b"][: i % 3],
+            }
+            if i == 8:
+                record["late"] = True
+            events_file.write(json.dumps(record) + "\n")
+        events_file.write("\n")
+    return path
+
+
+def _records(path):
+    with open(path) as events_file:
+        return [json.loads(line) for line in events_file if line.strip()]
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+def test_flatten_records_into_dotted_columns():
+    data = json_reader.flatten_records(
+        [{"a": {"b": 1, "c": {"d": "x"}}, "e": [1, 2]}, {"a": {"b": 2}}]
+    )
+
+    assert list(data.columns) == ["e", "a.b", "a.c.d"]
+    assert data["a.b"].tolist() == [1, 2]
+    assert data["e"].tolist()[0] == "[1, 2]"
+
+
+@pytest.mark.unit
+def test_iter_chunks_keeps_the_sampled_schema(events_path, monkeypatch):
+    monkeypatch.setattr(json_reader, "SCHEMA_SAMPLE_SIZE", 5)
+    chunks = list(json_reader.iter_chunks(events_path, 4))
+
+    assert [len(chunk.index) for chunk in chunks] == [4, 4, 2]
+    for chunk in chunks:
+        assert list(chunk.columns) == ["id", "tags", "user.name", "user.geo.lat"]
+    assert pd.concat(chunks).index.tolist() == list(range(10))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("load_params", [{}, {"chunksize": 3}])
+def test_load_json_lines(events_path, load_params):
+    ds = Dataset(events_path, "events", **load_params)
+
+    assert set(ds.columns) == {"id", "tags", "user.name", "user.geo.lat", "late"}
+    assert ds["user.geo.lat"].data_type == "NumericColumn"
+    assert ds["user.geo.lat"].max == 4.5
+    assert ds["user.name"].unique == 2
+    assert ds["tags"].unique == 3
+    assert ds["late"].count == 1
+    assert get_source_columns(events_path) == list(ds.columns)
+
+
+@pytest.mark.unit
+def test_load_nested_data_with_arrow(events_path, tmp_path):
+    ds = Dataset(events_path, "events", engine="arrow")
+
+    assert set(ds.columns) == {"id", "tags", "user.name", "user.geo.lat", "late"}
+    assert ds["user.geo.lat"].max == 4.5
+    assert ds["user.name"].unique == 2
+    # lists are profiled as JSON text, as with the pandas engine
+    assert ds["tags"].unique == 3
+    assert (
+        ds["tags"].text_length_mean
+        == Dataset(events_path, "events")["tags"].text_length_mean
+    )
+
+    parquet_path = tmp_path / "events.parquet"
+    pq.write_table(pa.Table.from_pylist(_records(events_path)), parquet_path)
+    ds = Dataset(
+        parquet_path, "events", engine="arrow", columns=["user.geo.lat", "tags"]
+    )
+    assert list(ds.columns) == ["user.geo.lat", "tags"]
+    assert ds["user.geo.lat"].data_type == "NumericColumn"
+    assert ds["tags"].unique == 3
@@ -0,0 +1,87 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from data_comparator.components import numeric_kernel
+from data_comparator.components.numeric_kernel import scan_numeric
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    # many blocks per column, so the block merging is exercised
+    monkeypatch.setattr(numeric_kernel, "BLOCK_SIZE", 64)
+
+
+def sample_column(dtype):
+    rng = np.random.default_rng(9)
+    values = np.round(rng.gamma(2, size=1000) * 10)
+    values[rng.random(1000) < 0.2] = 0
+    if dtype == "int64":
+        return pd.Series(values.astype("int64"))
+    raw_column = pd.Series(values).astype(dtype)
+    return raw_column.mask(rng.random(1000) < 0.1)
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dtype", ["int64", "float64", "float32", "Int64", "double[pyarrow]"]
+)
+def test_scan_matches_pandas(dtype):
+    raw_column = sample_column(dtype)
+    moments = scan_numeric(raw_column)
+    as_float = raw_column.astype("float64")
+
+    assert moments.n == raw_column.count()
+    assert moments.missing == raw_column.isnull().sum()
+    assert moments.zeros == (raw_column == 0).sum()
+    assert moments.min == raw_column.min()
+    assert moments.max == raw_column.max()
+    assert moments.mean == pytest.approx(as_float.mean())
+    assert moments.std == pytest.approx(as_float.std())
+    assert moments.skew == pytest.approx(as_float.skew())
+
+
+@pytest.mark.unit
+def test_bounds_count_and_first_position():
+    raw_column = sample_column("float64")
+    bounds = {"upper": (None, 40.0), "outliers": (5.0, 40.0)}
+    moments = scan_numeric(raw_column, bounds)
+
+    assert moments.outside["upper"] == (raw_column > 40).sum()
+    assert moments.outside["outliers"] == ((raw_column < 5) | (raw_column > 40)).sum()
+    first = raw_column.index.get_loc(raw_column[raw_column > 40].index[0])
+    assert moments.first_outside["upper"] == first
+
+
+@pytest.mark.unit
+def test_merged_chunks_match_whole_column():
+    raw_column = sample_column("float64")
+    bounds = {"upper": (None, 40.0)}
+    whole = scan_numeric(raw_column, bounds)
+    merged = scan_numeric(raw_column[:300], bounds)
+    merged.merge(scan_numeric(raw_column[300:], bounds))
+
+    for stat_name in ["rows", "n", "missing", "zeros", "min", "max"]:
+        assert getattr(merged, stat_name) == getattr(whole, stat_name)
+    for stat_name in ["mean", "std", "skew"]:
+        assert getattr(merged, stat_name) == pytest.approx(getattr(whole, stat_name))
+    assert merged.outside == whole.outside
+    assert merged.first_outside == whole.first_outside
+
+
+@pytest.mark.unit
+def test_empty_column():
+    moments = scan_numeric(pd.Series([np.nan, np.nan]))
+
+    assert moments.n == 0
+    assert moments.missing == 2
+    assert np.isnan(moments.min) and np.isnan(moments.mean)
+    assert np.isnan(moments.std) and np.isnan(moments.skew)
@@ -0,0 +1,133 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+
+import data_comparator.data_comparator as dc
+from data_comparator.components.dataset import ColumnSummary, Dataset
+from data_comparator.components.profile_cache import ProfileCache
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+@pytest.fixture
+def sample_path(tmp_path):
+    rng = np.random.default_rng(0)
+    path = tmp_path / "sample.csv"
+    pd.DataFrame(
+        {
+            "price": rng.normal(size=200),
+            "region": rng.choice(["north", "south", None], 200),
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ProfileCache(tmp_path / "cache")
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+def test_unchanged_source_is_loaded_from_cache(sample_path, cache, monkeypatch):
+    first = Dataset(sample_path, "first", cache=cache)
+    first_checks = first.perform_checks()
+
+    def fail_read(*args, **kwargs):
+        raise AssertionError("source was read")
+
+    monkeypatch.setattr(Dataset, "_load_data_frompath", fail_read)
+    second = Dataset(sample_path, "second", cache=cache)
+
+    assert second.from_cache and not first.from_cache
+    assert second.dataframe is None
+    for col_name in first.columns:
+        assert second[col_name].get_summary() == {
+            **first[col_name].get_summary(),
+            "ds_name": "second",
+        }
+    assert second.perform_checks() == first_checks
+
+
+@pytest.mark.unit
+def test_cached_load_without_data_keeps_summaries(sample_path, cache):
+    first = Dataset(sample_path, "first", cache=cache, retain_data=False)
+    second = Dataset(sample_path, "second", cache=cache, retain_data=False)
+
+    assert second.from_cache and not first.from_cache
+    for ds in [first, second]:
+        assert ds.dataframe is None
+        for col_name in ds.columns:
+            assert isinstance(ds[col_name], ColumnSummary)
+    assert second.perform_checks() == first.perform_checks()
+
+
+@pytest.mark.unit
+def test_cache_key_follows_source_and_params(sample_path, cache):
+    Dataset(sample_path, "first", cache=cache)
+
+    assert (
+        Dataset(sample_path, "projected", columns=["price"], cache=cache).from_cache
+        is False
+    )
+    pd.DataFrame({"price": [1.0, 2.0]}).to_csv(sample_path, index=False)
+    changed = Dataset(sample_path, "changed", cache=cache)
+
+    assert not changed.from_cache
+    assert changed["price"].count == 2
+    assert len(cache.entries()) == 3
+
+
+@pytest.mark.unit
+def test_cache_eviction_and_invalidation(sample_path, tmp_path):
+    cache = ProfileCache(tmp_path / "cache", max_bytes=1)
+    Dataset(sample_path, "first", cache=cache)
+    Dataset(sample_path, "projected", columns=["price"], cache=cache)
+
+    # only the most recent entry survives a cap smaller than one entry
+    assert len(cache.entries()) == 1
+    assert dc.get_profile_cache_entries(cache.cache_dir)[0]["columns"] == 1
+    assert dc.invalidate_profile_cache(sample_path, cache.cache_dir) == 1
+    assert cache.entries() == []
+
+
+@pytest.mark.unit
+def test_cache_stores_only_the_profiled_columns(sample_path, cache, monkeypatch):
+    profiled = []
+    profile_column = Dataset._profile_column
+
+    def record_profile(ds, col_name):
+        profiled.append(col_name)
+        return profile_column(ds, col_name)
+
+    monkeypatch.setattr(Dataset, "_profile_column", record_profile)
+    first = Dataset(sample_path, "first", cache=cache)
+    first["price"]
+
+    assert profiled == ["price"]
+    assert cache.entries()[0]["profiled"] == 1
+
+    second = Dataset(sample_path, "second", cache=cache)
+    second["price"]
+
+    assert second.from_cache and second.dataframe is None
+    assert profiled == ["price"]
+
+    # the missing column is read from the source and added to the entry
+    assert second["region"].get_summary() == {
+        **first["region"].get_summary(),
+        "ds_name": "second",
+    }
+    assert profiled == ["price", "region", "region"]
+    assert list(second.dataframe.columns) == ["region"]
+    assert cache.entries()[0]["profiled"] == 2
+
+    third = Dataset(sample_path, "third", cache=cache)
+    assert third.columns.is_profiled("region")
+    assert third["region"].count == first["region"].count
+    assert profiled == ["price", "region", "region"]
@@ -0,0 +1,74 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from data_comparator.components.dataset import Dataset
+from data_comparator.components.sampling import Sampler
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    n_rows = 20000
+    df = pd.DataFrame(
+        {
+            "price": rng.normal(loc=10, size=n_rows),
+            "region": rng.choice(["north", "south", "east"], n_rows),
+        }
+    )
+    df.loc[df.index % 10 == 0, "price"] = np.nan
+    # a stratum too small for a plain fraction sample to be sure to hit
+    df.loc[[5, 17], "region"] = "west"
+    return df
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+def test_reservoir_sample_size():
+    sampler = Sampler.from_option(100)
+    for start in range(0, 1000, 64):
+        sampler.update(pd.DataFrame({"n": np.arange(start, min(start + 64, 1000))}))
+    sample = sampler.result()
+
+    assert sampler.population_rows == 1000
+    assert len(sample.index) == 100
+    assert sample["n"].is_unique and sample["n"].is_monotonic_increasing
+
+
+@pytest.mark.unit
+def test_stratified_sample_keeps_small_strata(sample_df):
+    sampler = Sampler("stratified", fraction=0.01, column="region", min_rows=2)
+    sample = sampler.sample_frame(sample_df, chunksize=1000)
+
+    assert (sample["region"] == "west").sum() == 2
+    for region in ["north", "south", "east"]:
+        assert (sample["region"] == region).sum() >= 2
+
+
+@pytest.mark.unit
+def test_sampled_load_reports_confidence_intervals(sample_df, tmp_path):
+    path = tmp_path / "sample.csv"
+    sample_df.to_csv(path, index=False)
+    ds = Dataset(path, "sampled", sample={"fraction": 0.1, "seed": 1}, chunksize=3000)
+    summary = ds.get_summary()
+
+    assert not ds.streaming
+    assert summary["sample"]["population_rows"] == len(sample_df.index)
+    assert summary["sample"]["sample_rows"] == len(ds.dataframe.index)
+    assert len(ds.dataframe.index) < len(sample_df.index) / 5
+    price = summary["estimates"]["price"]
+    for stat_name, actual in [
+        ("count", sample_df["price"].count()),
+        ("missing", sample_df["price"].isnull().sum()),
+        ("mean", sample_df["price"].mean()),
+    ]:
+        lower, upper = price[stat_name]["ci"]
+        assert lower <= actual <= upper, stat_name
+    assert Dataset(sample_df, "full").get_summary()["estimates"] == {}
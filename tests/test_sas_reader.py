@@ -0,0 +1,85 @@
+import pytest
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_comparator.components import sas_reader
+
+# 8 rows of date, text and integer columns (from the MIT-licensed
+# sas7bdat-converter test assets)
+SAMPLE_SAS_PATH = Path(__file__).parent / "test_data" / "unit" / "sample.sas7bdat"
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def _fake_read_rows(path, offset, rows, columns=None, encoding=None):
+    """Stands in for a pyreadstat row range read of a 10-row file"""
+    values = np.arange(offset, min(offset + rows, 10))
+    return pd.DataFrame({"row": values}, index=values)
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+def test_decode_byte_columns(encoding):
+    df = pd.DataFrame(
+        {
+            "name": pd.Series(["café".encode(encoding), None, b"plain"], dtype=object),
+            "value": [1.0, 2.0, 3.0],
+        }
+    )
+    decoded = sas_reader.decode_byte_columns(df, encoding)
+
+    assert decoded["name"].tolist()[0] == "café"
+    assert pd.isnull(decoded["name"].tolist()[1])
+    assert decoded["name"].tolist()[2] == "plain"
+    assert decoded["value"].tolist() == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.unit
+def test_invalid_utf8_is_decoded_with_replacement():
+    raw_column = pd.Series([b"ok", b"\xff"], dtype=object, name="code")
+
+    assert sas_reader.decode_bytes(raw_column, "utf-8").tolist() == ["ok", "�"]
+
+
+@pytest.mark.unit
+def test_parallel_chunks_are_yielded_in_file_order(monkeypatch):
+    monkeypatch.setattr(sas_reader, "_import_pyreadstat", lambda: object())
+    monkeypatch.setattr(sas_reader, "count_rows", lambda path: 10)
+    monkeypatch.setattr(sas_reader, "_read_rows", _fake_read_rows)
+    chunks = list(sas_reader.iter_chunks("file.sas7bdat", 3, workers=2))
+
+    assert [len(chunk.index) for chunk in chunks] == [3, 3, 3, 1]
+    assert pd.concat(chunks)["row"].tolist() == list(range(10))
+
+
+@pytest.mark.unit
+def test_parallel_decoding_of_a_sas_file():
+    pytest.importorskip("pyreadstat")
+    expected = pd.read_sas(SAMPLE_SAS_PATH, encoding="utf-8")
+    chunks = list(sas_reader.iter_chunks(SAMPLE_SAS_PATH, 3, workers=2))
+    data = pd.concat(chunks)
+
+    assert sas_reader.count_rows(SAMPLE_SAS_PATH) == 8
+    assert [len(chunk.index) for chunk in chunks] == [3, 3, 2]
+    assert data.index.tolist() == list(range(8))
+    for col_name in ["integer_row", "text_row", "date_row"]:
+        assert data[col_name].tolist() == expected[col_name].tolist()
+
+
+@pytest.mark.unit
+def test_pandas_reader_without_pyreadstat(monkeypatch, caplog):
+    monkeypatch.setattr(sas_reader, "_import_pyreadstat", lambda: None)
+    with caplog.at_level(logging.INFO, logger=sas_reader.LOGGER.name):
+        chunks = list(sas_reader.iter_chunks(SAMPLE_SAS_PATH, 3, workers=2))
+
+    assert "pyreadstat is not installed" in caplog.text
+    assert [len(chunk.index) for chunk in chunks] == [3, 3, 2]
+    assert pd.concat(chunks)["text_row"].tolist()[0] == "Some text"
@@ -0,0 +1,208 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from data_comparator.components.sketches import (
+    QUANTILES,
+    ExactDistinct,
+    HyperLogLog,
+    TDigest,
+    distinct_counter,
+)
+from data_comparator.components.dataset import Dataset
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+LEVELS = list(QUANTILES.values())
+
+
+def _hashes(values):
+    return pd.util.hash_pandas_object(pd.Series(values), index=False).to_numpy()
+
+
+def _rank_error(values, estimates):
+    """Largest distance between the quantile levels and the estimates' ranks"""
+    ranks = np.searchsorted(np.sort(values), estimates) / len(values)
+    return np.abs(ranks - LEVELS).max()
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("n_values", [10, 1000, 200000])
+def test_hyperloglog_estimate(n_values):
+    sketch = HyperLogLog(12)
+    # every value repeated, so only the distinct ones count
+    sketch.update(_hashes(np.tile(np.arange(n_values), 3)))
+
+    assert abs(sketch.estimate() - n_values) <= 4 * sketch.error * n_values
+
+
+@pytest.mark.unit
+def test_merged_sketches_match_one_sketch():
+    values = np.arange(50000)
+    whole = HyperLogLog(10)
+    whole.update(_hashes(values))
+    parts = [HyperLogLog(10) for _ in range(4)]
+    for part, chunk in zip(parts, np.array_split(values, 4)):
+        part.update(_hashes(chunk))
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+
+    assert merged.estimate() == whole.estimate()
+    with pytest.raises(ValueError):
+        merged.merge(HyperLogLog(11))
+
+
+@pytest.mark.unit
+def test_precision_is_validated():
+    with pytest.raises(ValueError):
+        HyperLogLog(3)
+    assert distinct_counter(None).error == 0.0
+
+
+@pytest.mark.unit
+def test_exact_distinct_sorts_each_hash_a_bounded_number_of_times(monkeypatch):
+    sorted_sizes = []
+    fold = ExactDistinct._fold
+
+    def counted_fold(counter):
+        if counter._pending:
+            sorted_sizes.append(len(counter._hashes) + counter._pending_size)
+        fold(counter)
+
+    monkeypatch.setattr(ExactDistinct, "_fold", counted_fold)
+    counter = ExactDistinct()
+    chunks = np.array_split(np.arange(200000), 200)
+    for chunk in chunks:
+        # half of each chunk was seen in the previous one
+        counter.update(_hashes(np.concatenate([chunk, chunk - 500])))
+
+    assert counter.estimate() == 200500
+    # re-sorting everything on each chunk would sort ~20M hashes
+    assert sum(sorted_sizes) <= 3 * 200500 * 2
+
+
+@pytest.mark.unit
+def test_merged_exact_counters_match_one_counter():
+    parts = [ExactDistinct() for _ in range(3)]
+    for position, part in enumerate(parts):
+        for chunk in np.array_split(np.arange(position * 100, 1000), 7):
+            part.update(_hashes(chunk))
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+
+    assert merged.estimate() == 1000
+    assert parts[1].estimate() == 900
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("load_params", [{}, {"chunksize": 300}])
+def test_approx_distinct_dataset(tmp_path, load_params):
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame(
+        {
+            "code": ["c{}".format(value) for value in rng.integers(0, 700, 2000)],
+            "day": pd.Series(
+                pd.date_range("2020-01-01", periods=400)[rng.integers(0, 400, 2000)]
+            ).dt.strftime("%Y-%m-%d"),
+        }
+    )
+    path = tmp_path / "codes.csv"
+    df.to_csv(path, index=False)
+    ds = Dataset(path, "codes", approx_distinct=10, **load_params)
+    code, day = ds.columns["code"], ds.columns["day"]
+
+    assert abs(code.unique - df["code"].nunique()) <= 4 * code.unique_error
+    assert code.duplicates == code.count - code.unique
+    assert abs((2000 - day.unique) - df["day"].nunique()) <= 4 * day.unique_error
+    assert set(ds.get_summary()["unique_errors"]) == {"code", "day"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("load_params", [{}, {"chunksize": 300}])
+def test_approx_distinct_never_exceeds_rows(tmp_path, load_params):
+    df = pd.DataFrame(
+        {
+            "code": ["c{}".format(value) for value in range(2000)],
+            "day": pd.date_range("2020-01-01", periods=2000).strftime("%Y-%m-%d"),
+        }
+    )
+    path = tmp_path / "distinct.csv"
+    df.to_csv(path, index=False)
+    # every value is distinct, and the estimates overshoot at this precision
+    ds = Dataset(path, "distinct", approx_distinct=True, **load_params)
+    code, day = ds.columns["code"], ds.columns["day"]
+
+    assert code.unique <= 2000 and code.duplicates >= 0
+    assert day.unique >= 0
+
+
+@pytest.mark.unit
+def test_small_tdigest_is_exact():
+    values = pd.Series(np.random.default_rng(5).normal(size=999))
+    digest = TDigest()
+    for chunk in np.array_split(values.to_numpy(), 10):
+        digest.update(chunk)
+
+    np.testing.assert_allclose(digest.quantiles(LEVELS), values.quantile(LEVELS))
+    assert np.isnan(TDigest().quantiles(LEVELS)).all()
+
+
+@pytest.mark.unit
+def test_tdigest_accuracy():
+    values = np.random.default_rng(6).lognormal(size=100000)
+    digest = TDigest()
+    for chunk in np.array_split(values, 200):
+        digest.update(chunk)
+
+    assert len(digest.means) < 5000
+    assert _rank_error(values, digest.quantiles(LEVELS)) < 0.002
+
+
+@pytest.mark.unit
+def test_merged_digests_match_whole():
+    values = np.random.default_rng(7).exponential(size=60000)
+    parts = [TDigest() for _ in range(6)]
+    for part, chunk in zip(parts, np.array_split(values, 6)):
+        part.update(chunk)
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+
+    assert merged.count == len(values)
+    assert merged.min == values.min() and merged.max == values.max()
+    assert _rank_error(values, merged.quantiles(LEVELS)) < 0.002
+
+
+@pytest.mark.unit
+def test_streamed_quantiles_dataset(tmp_path):
+    rng = np.random.default_rng(8)
+    df = pd.DataFrame(
+        {
+            "amount": rng.gamma(2, size=20000),
+            "opened": pd.Series(
+                pd.date_range("2020-01-01", periods=1000)[rng.integers(0, 1000, 20000)]
+            ).dt.strftime("%Y-%m-%d"),
+        }
+    )
+    path = tmp_path / "amounts.csv"
+    df.to_csv(path, index=False)
+    eager_ds = Dataset(path, "eager")
+    streamed_ds = Dataset(path, "streamed", chunksize=3000)
+    amount = streamed_ds["amount"].get_summary()
+    opened = streamed_ds["opened"].get_summary()
+
+    assert eager_ds["amount"].get_summary()["p50"] == df["amount"].median()
+    assert _rank_error(df["amount"].to_numpy(), [amount[q] for q in QUANTILES]) < 0.002
+    days = pd.to_datetime(df["opened"]).sort_values().to_numpy()
+    for name, level in QUANTILES.items():
+        rank = np.searchsorted(days, opened[name].to_datetime64()) / len(days)
+        assert abs(rank - level) < 0.002
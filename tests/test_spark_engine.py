@@ -0,0 +1,208 @@
+import math
+import sys
+import types
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from data_comparator.components.dataset import Dataset
+from data_comparator.components.spark_engine import (
+    _column_aggregations,
+    finalize_stats,
+    get_column_kind,
+)
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    n_rows = 500
+    df = pd.DataFrame(
+        {
+            "price": rng.normal(size=n_rows),
+            "region": rng.choice(["north", "south", "east", None], n_rows),
+            "active": rng.choice([True, False], n_rows),
+            "day": pd.to_datetime("2021-01-01")
+            + pd.to_timedelta(rng.integers(0, 30, n_rows), unit="D"),
+        }
+    )
+    df.loc[3, "price"] = np.nan
+    return df
+
+
+@pytest.fixture(scope="module")
+def spark():
+    pytest.importorskip("pyspark")
+    from pyspark.sql import SparkSession
+
+    session = (
+        SparkSession.builder.master("local[2]")
+        .appName("data_comparator_tests")
+        .config("spark.sql.shuffle.partitions", "2")
+        .getOrCreate()
+    )
+    yield session
+    session.stop()
+
+
+class _Expr(object):
+    """Stand-in for a Spark column expression, recording how it was built"""
+
+    def __init__(self, name, *args):
+        self.name = name
+        self.args = args
+
+    def __getattr__(self, name):
+        return lambda *args: _Expr(name, self, *args)
+
+    def __eq__(self, other):
+        return _Expr("==", self, other)
+
+    def __invert__(self):
+        return _Expr("~", self)
+
+
+def _spark_type(name):
+    return type(name, (), {})()
+
+
+@pytest.fixture
+def fake_functions(monkeypatch):
+    """pyspark.sql.functions replaced by functions building _Expr objects"""
+    functions = types.ModuleType("pyspark.sql.functions")
+    functions.__getattr__ = lambda name: lambda *args: _Expr(name, *args)
+    sql = types.ModuleType("pyspark.sql")
+    sql.functions = functions
+    monkeypatch.setitem(sys.modules, "pyspark", types.ModuleType("pyspark"))
+    monkeypatch.setitem(sys.modules, "pyspark.sql", sql)
+    monkeypatch.setitem(sys.modules, "pyspark.sql.functions", functions)
+    return functions
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+def test_column_kinds():
+    assert get_column_kind(_spark_type("LongType")) == "numeric"
+    assert get_column_kind(_spark_type("TimestampType")) == "temporal"
+    assert get_column_kind(_spark_type("BooleanType")) == "boolean"
+    for type_name in ["StringType", "ArrayType", "MapType", "StructType"]:
+        assert get_column_kind(_spark_type(type_name)) == "string"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("type_name", ["ArrayType", "MapType", "StructType"])
+def test_complex_columns_are_aggregated_as_strings(fake_functions, type_name):
+    aggs = _column_aggregations("tags", _spark_type(type_name), "string")
+
+    # spark's length() only accepts strings and binary
+    lengths = aggs["text_length_mean"].args[0]
+    assert lengths.name == "length"
+    assert lengths.args[0].name == "cast" and lengths.args[0].args[1] == "string"
+    assert aggs["unique"].args[0].name == "cast"
+    for stat_name in ["text_length_med", "text_length_quantiles"]:
+        assert "length(cast(`tags` as string))" in aggs[stat_name].args[0]
+
+
+@pytest.mark.unit
+def test_string_columns_are_aggregated_as_is(fake_functions):
+    aggs = _column_aggregations("name", _spark_type("StringType"), "string")
+
+    assert aggs["text_length_mean"].args[0].args[0].name == "col"
+    assert "length(`name`)" in aggs["text_length_med"].args[0]
+
+
+@pytest.mark.unit
+def test_finalize_numeric_stats(sample_df):
+    price = sample_df["price"]
+    count = price.count()
+    # spark reports the population skewness
+    skewness = price.skew() * (count - 2) / math.sqrt(count * (count - 1))
+    raw_stats = {
+        "count": count,
+        "min": price.min(),
+        "max": price.max(),
+        "mean": price.mean(),
+        "std": price.std(),
+        "zeros": 0,
+        "skewness": skewness,
+    }
+    ds = Dataset(sample_df, "pandas")
+    stats = finalize_stats(raw_stats, "numeric", len(price))
+
+    assert stats["missing"] == ds["price"].missing
+    assert stats["skew"] == pytest.approx(price.skew())
+    for stat_name in ["count", "min", "max", "mean", "std", "zeros"]:
+        assert stats[stat_name] == pytest.approx(getattr(ds["price"], stat_name))
+
+
+@pytest.mark.unit
+def test_finalize_boolean_and_temporal_stats(sample_df):
+    ds = Dataset(sample_df, "pandas")
+    active = sample_df["active"]
+    boolean_stats = finalize_stats(
+        {"count": len(active), "trues": active.sum(), "falses": (~active).sum()},
+        "boolean",
+        len(active),
+    )
+    day = sample_df["day"]
+    temporal_stats = finalize_stats(
+        {"count": day.count(), "min": day.min(), "max": day.max(), "distinct": 30},
+        "temporal",
+        len(day),
+    )
+
+    assert boolean_stats["top"] == ds["active"].top
+    assert boolean_stats["unique"] == ds["active"].unique
+    assert temporal_stats["unique"] == ds["day"].unique
+    assert temporal_stats["min"] == ds["day"].min
+
+
+@pytest.mark.unit
+def test_finalize_clamps_overshooting_distinct_counts():
+    # approx_count_distinct can exceed the number of rows
+    string_stats = finalize_stats(
+        {
+            "count": 100,
+            "text_length_mean": 3.0,
+            "text_length_std": 0.0,
+            "text_length_med": 3.0,
+            "unique": 103,
+        },
+        "string",
+        100,
+    )
+    temporal_stats = finalize_stats(
+        {"count": 100, "min": None, "max": None, "distinct": 103}, "temporal", 100
+    )
+
+    assert string_stats["unique"] == 100
+    assert string_stats["duplicates"] == 0
+    assert temporal_stats["unique"] == 0
+
+
+@pytest.mark.integration
+def test_spark_profile_matches_pandas(spark, sample_df):
+    spark_ds = Dataset(spark.createDataFrame(sample_df), "spark")
+    pandas_ds = Dataset(sample_df, "pandas")
+
+    assert spark_ds.engine == "spark"
+    assert spark_ds.dataframe is None
+    for col_name in pandas_ds.columns:
+        spark_summary = spark_ds[col_name].get_summary()
+        for stat_name, value in pandas_ds[col_name].get_summary().items():
+            if stat_name in ("ds_name", "unique", "duplicates"):
+                # distinct counts are approximate in spark
+                continue
+            if isinstance(value, float):
+                assert spark_summary[stat_name] == pytest.approx(value, nan_ok=True)
+            else:
+                assert spark_summary[stat_name] == value
+    assert spark_ds["price"].perform_check() == pandas_ds["price"].perform_check()
@@ -0,0 +1,140 @@
+import pytest
+
+import pandas as pd
+
+from data_comparator.components import check
+from data_comparator.components.aggregate import text_length_histogram
+from data_comparator.components.dataset import Dataset
+from data_comparator.components.string_kernel import TextStats, _is_numeric_value
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+VALUES = [
+    "plain",
+    "Two words",
+    "CAPS",
+    "a!b",
+    "",
+    "   ",
+    "12.5",
+    "-7",
+    ".5",
+    "1_000",
+    "1e5",
+    "inf",
+    None,
+    "plain",
+    "CAPS",
+]
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("dtype", [object, "str", "category"])
+def test_text_stats_counts(dtype):
+    raw_column = pd.Series(VALUES, dtype=dtype)
+    stats = TextStats(raw_column)
+
+    assert stats.count == raw_column.count()
+    assert stats.missing == 1
+    assert stats.unique == raw_column.nunique()
+    assert list(stats.values) == list(pd.unique(raw_column.dropna()))
+    assert stats.last_rows[0] == 13
+    assert stats.length_histogram() == text_length_histogram(raw_column)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("dtype", [object, "str", "category"])
+def test_text_stats_flags(dtype):
+    stats = TextStats(pd.Series(VALUES, dtype=dtype))
+    flags = {
+        name: [value for value, flag in zip(stats.values, mask) if flag]
+        for name, mask in stats.flags.items()
+    }
+
+    assert flags["numeric_data"] == [
+        value for value in stats.values if _is_numeric_value(value)
+    ]
+    assert flags["numeric_data"] == ["12.5", "-7", ".5", "1_000"]
+    assert flags["empty_text"] == ["", "   "]
+    assert flags["white_space"] == ["Two words", "   "]
+    assert flags["special_char"] == ["a!b", "12.5", "-7", ".5", "1_000"]
+    assert "CAPS" in flags["capitalized"] and "plain" not in flags["capitalized"]
+    assert flags["non_string"] == []
+    assert stats.flag_counts()["empty_text"] == 2
+
+
+@pytest.mark.unit
+def test_values_that_are_not_text():
+    stats = TextStats(pd.Series(["a b", 5, 2.5, b"X Y", True], dtype=object))
+    flags = stats.flags
+
+    assert flags["non_string"].tolist() == [False, True, True, False, True]
+    assert flags["numeric_data"].tolist() == [False, True, True, False, False]
+    # bytes are decoded before their patterns are checked
+    assert flags["white_space"].tolist() == [True, False, False, True, False]
+    assert stats.length_histogram()[3] == 2
+
+
+@pytest.mark.unit
+def test_non_text_column_has_no_lengths():
+    stats = TextStats(pd.Series([1, 2, 2], dtype=object))
+
+    assert stats.unique == 2
+    with pytest.raises(AttributeError):
+        stats.length_histogram()
+
+
+@pytest.mark.unit
+def test_string_check_reads_profile(monkeypatch):
+    ds = Dataset(pd.DataFrame({"name": VALUES}), "names")
+    expected = ds["name"].perform_check()
+
+    def rescan(rows):
+        raise AssertionError("the column was scanned again")
+
+    monkeypatch.setattr(check, "TextStats", rescan)
+    assert ds["name"].perform_check() == expected
+    assert expected["numeric_data"] == "1_000"
+    assert expected["empty_text"] == 5
+
+
+@pytest.mark.unit
+def test_string_check_picks_matches():
+    values = ["2021-01-05", "12", "LOUD", "Two words", "", "x!", "QUIET", "  "]
+    validations = {
+        case: {"enabled": True, "value": "", "fields": []}
+        for case in ["white_space", "capitalized", "special_char"]
+    }
+    ds = Dataset(pd.DataFrame({"name": values}), "names")
+
+    # the first match of each optional check, the last numeric and empty one
+    assert check.check_string_column(ds["name"], validations) == {
+        "white_space": "Two words",
+        "capitalized": "LOUD",
+        "special_char": "x!",
+        "numeric_data": "12",
+        "empty_text": 7,
+    }
+    assert check.check_string_column(ds["name"], validations, row_limit=4) == {
+        "white_space": "Two words",
+        "capitalized": "LOUD",
+        "special_char": "",
+        "numeric_data": "12",
+    }
+
+
+@pytest.mark.unit
+def test_string_check_skips_dates(monkeypatch):
+    monkeypatch.setattr(check, "DATE_BATCH_SIZE", 2)
+    dates = pd.date_range("2021-01-01", periods=50).strftime("%Y-%m-%d")
+    ds = Dataset(pd.DataFrame({"name": list(dates) + ["the-end"]}), "names")
+    validations = {"special_char": {"enabled": True, "value": "", "fields": []}}
+
+    assert check.check_string_column(ds["name"], validations) == {
+        "special_char": "the-end"
+    }
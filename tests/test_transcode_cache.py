@@ -0,0 +1,93 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from data_comparator.components.dataset import Dataset
+from data_comparator.components.transcode_cache import TranscodeCache
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+@pytest.fixture
+def sample_path(tmp_path):
+    rng = np.random.default_rng(0)
+    path = tmp_path / "sample.txt"
+    pd.DataFrame(
+        {
+            "price": rng.normal(size=200),
+            "region": rng.choice(["north", "south", None], 200),
+            "day": rng.choice(["2021-01-01", "2021-02-01"], 200),
+        }
+    ).to_csv(path, index=False, sep="|")
+    return path
+
+
+## UNIT TESTS ##
+
+
+@pytest.mark.unit
+def test_transcoded_copy_replaces_source(sample_path, tmp_path, monkeypatch):
+    transcoder = TranscodeCache(tmp_path / "transcoded")
+    direct = Dataset(sample_path, "direct", sep="|")
+    first = Dataset(sample_path, "first", transcode=transcoder, sep="|")
+
+    def fail_read(*args, **kwargs):
+        raise AssertionError("source was parsed")
+
+    monkeypatch.setattr(pd, "read_table", fail_read)
+    projected = Dataset(
+        sample_path,
+        "projected",
+        columns=["price", "day"],
+        transcode=transcoder,
+        sep="|",
+    )
+    streamed = Dataset(
+        sample_path, "streamed", transcode=transcoder, sep="|", chunksize=50
+    )
+
+    assert first.transcoded_path == projected.transcoded_path
+    assert first.read_format == "arrow" and first.input_format == "txt"
+    assert list(projected.dataframe.columns) == ["price", "day"]
+    assert projected["day"].data_type == "TemporalColumn"
+    for ds in [first, projected, streamed]:
+        for col_name in ds.columns:
+            summary = direct[col_name].get_summary()
+            for key, value in ds[col_name].get_summary().items():
+                if isinstance(value, float):
+                    assert value == pytest.approx(summary[key], nan_ok=True), key
+                elif key != "ds_name":
+                    assert value == summary[key], key
+    assert len(transcoder.entries()) == 1
+
+
+@pytest.mark.unit
+def test_changed_source_is_transcoded_again(sample_path, tmp_path):
+    transcoder = TranscodeCache(tmp_path / "transcoded", max_bytes=1)
+    Dataset(sample_path, "first", transcode=transcoder, sep="|")
+    pd.DataFrame({"price": [1.0, 2.0]}).to_csv(sample_path, index=False, sep="|")
+    changed = Dataset(sample_path, "changed", transcode=transcoder, sep="|")
+
+    assert changed["price"].count == 2
+    # the stale copy is evicted to stay under the cap
+    assert [entry["rows"] for entry in transcoder.entries()] == [2]
+
+
+@pytest.mark.unit
+def test_evicted_copy_falls_back_to_source(sample_path, tmp_path):
+    transcoder = TranscodeCache(tmp_path / "transcoded", max_bytes=1)
+    direct = Dataset(sample_path, "direct", sep="|", chunksize=50)
+    streamed = Dataset(
+        sample_path, "streamed", transcode=transcoder, sep="|", chunksize=50
+    )
+    other_path = tmp_path / "other.txt"
+    pd.DataFrame({"price": [1.0, 2.0]}).to_csv(other_path, index=False, sep="|")
+    # the second copy evicts the one the streamed dataset reads its checks from
+    Dataset(other_path, "other", transcode=transcoder, sep="|")
+
+    assert not streamed.transcoded_path.exists()
+    assert streamed.perform_checks() == direct.perform_checks()
+    assert streamed.transcoded_path is None and streamed.read_format == "txt"